@@ -0,0 +1,358 @@
+import os
+import random
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_DATABASE = Path(__file__).parent / "Database" / "Accounts.txt"
+
+# Account type (first field of each line) -> AccountStore attribute holding that role
+ROLE_TABLES = {
+    "STUDENT": "students",
+    "PROF": "professors",
+    "PROFESSOR": "professors",
+    "ADMIN": "admins",
+}
+
+# account IDs are a 3-digit role prefix followed by 6 digits
+ID_SUFFIX_MIN = 100000
+ID_SUFFIX_MAX = 999999
+RANDOM_ID_ATTEMPTS = 32
+
+# true/false is written padded to this width so a toggle never changes the line length
+CLEARANCE_WIDTH = len("false")
+
+
+def parse_account_line(line):
+    return [p.strip().strip('"') for p in line.split(",")]
+
+
+def format_clearance(cleared):
+    return ("true" if cleared else "false").ljust(CLEARANCE_WIDTH)
+
+
+def format_student_record(parts):
+    student_num, full_name, classification, major, cleared = parts
+    return f"STUDENT,{student_num},{full_name},{classification},{major},{format_clearance(cleared)}"
+
+
+def format_account_record(parts):
+    if parts[0] == "STUDENT":
+        return format_student_record(parts[1:])
+    return ",".join(str(p) for p in parts)
+
+
+class AccountStore:
+    """
+    In-memory index of Accounts.txt.
+
+    The file is parsed once into ID-keyed dictionaries per role (students,
+    professors, admins) holding the parsed fields of each record. Every lookup
+    checks the file's mtime/size/inode first and re-parses only when the file
+    changed on disk, so repeated logins cost O(1) instead of a full scan.
+
+    For every STUDENT record the byte offset and width of its fiscal clearance
+    field is kept as well, so a clearance toggle is patched into the file in
+    place instead of rewriting Accounts.txt.
+    """
+
+    def __init__(self, database=None):
+        self.database = Path(database) if database is not None else DEFAULT_DATABASE
+        self.students = {}
+        self.professors = {}
+        self.admins = {}
+        # student_num -> (byte offset, width) of the clearance field
+        self._clearance_slots = {}
+        # IDs present in the file / IDs handed out but not yet written
+        self._ids = set()
+        self._reserved = set()
+        self._stamp = None
+        self._lock_depth = 0
+
+    @contextmanager
+    def lock(self):
+        """
+        Hold an exclusive lock on Accounts.txt (via a sidecar .lock file) so
+        writers in other processes cannot interleave. Re-entrant within one store.
+        """
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+
+        lock_path = self.database.with_name(self.database.name + ".lock")
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _is_current(self):
+        return self._stamp is not None and self.database.exists() and self._stamp == self._file_stamp()
+
+    def _file_stamp(self):
+        st = os.stat(self.database)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def refresh(self):
+        """Re-parse the account file if it changed since the last load."""
+        stamp = self._file_stamp()
+        if stamp != self._stamp:
+            self._load()
+            self._stamp = stamp
+
+    def _load(self):
+        self.students = {}
+        self.professors = {}
+        self.admins = {}
+        self._clearance_slots = {}
+        self._ids = set()
+
+        with open(self.database, "rb") as f:
+            offset = 0
+            for raw in f:
+                self._index_line(raw, offset)
+                offset += len(raw)
+
+    def _index_line(self, raw, line_start):
+        line = raw.decode("utf-8").strip()
+        if not line:
+            return
+        parts = parse_account_line(line)
+        table_name = ROLE_TABLES.get(parts[0].upper())
+        if table_name is None or len(parts) < 2:
+            return
+        table = getattr(self, table_name)
+        # first record wins, matching the old top-to-bottom scan
+        if parts[1] in table:
+            return
+        table[parts[1]] = parts
+        self._ids.add(parts[1])
+
+        if table_name == "students" and len(parts) == 6:
+            body = raw.rstrip(b"\r\n")
+            comma = body.rfind(b",")
+            self._clearance_slots[parts[1]] = (line_start + comma + 1, len(body) - comma - 1)
+
+    def get_student(self, user_id):
+        self.refresh()
+        return self.students.get(user_id)
+
+    def get_professor(self, user_id):
+        self.refresh()
+        return self.professors.get(user_id)
+
+    def get_admin(self, user_id):
+        self.refresh()
+        return self.admins.get(user_id)
+
+    def set_clearance(self, student_num, cleared):
+        """
+        Set one student's fiscal clearance on disk.
+
+        When the existing field is wide enough for the new value it is
+        overwritten in place with a single seek + write. Otherwise (an old
+        unpadded "true" becoming "false") the file is rewritten once with all
+        clearance fields padded, after which every later toggle is in place.
+        Returns False if the student is not in the file.
+        """
+        with self.lock():
+            self.refresh()
+            parts = self.students.get(student_num)
+            if parts is None:
+                return False
+
+            token = "true" if cleared else "false"
+            slot = self._clearance_slots.get(student_num)
+            if slot is None or slot[1] < len(token):
+                record = parts[1:5] + [cleared]
+                self.rewrite_students({student_num: record})
+                return True
+
+            offset, width = slot
+            with open(self.database, "r+b") as f:
+                f.seek(offset)
+                f.write(token.ljust(width).encode("utf-8"))
+            parts[5] = token
+            self._stamp = self._file_stamp()
+            return True
+
+    def update_student(self, student_num, full_name, classification, major, cleared):
+        """Persist a student record, patching in place when only clearance changed."""
+        parts = self.get_student(student_num)
+        if parts is None:
+            return False
+        if parts[2:5] == [full_name, classification, major]:
+            return self.set_clearance(student_num, cleared)
+        self.rewrite_students({student_num: [student_num, full_name, classification, major, cleared]})
+        return True
+
+    def rewrite_students(self, records):
+        """
+        Replace STUDENT records in one atomic rewrite of the account file.
+
+        `records` maps student_num -> [student_num, full_name, classification,
+        major, cleared]. Other lines are copied through unchanged apart from
+        padding their clearance field to the fixed width.
+        """
+        with self.lock():
+            pending = dict(records)
+            tmp_path = self.database.with_name(self.database.name + ".tmp")
+
+            with open(self.database, "r", encoding="utf-8", newline="") as src, \
+                    open(tmp_path, "w", encoding="utf-8", newline="") as dst:
+                for line in src:
+                    stripped = line.strip()
+                    parts = parse_account_line(stripped) if stripped else None
+                    if not parts or parts[0].upper() != "STUDENT" or len(parts) < 2:
+                        dst.write(line)
+                        continue
+
+                    ending = line[len(line.rstrip("\r\n")):] or "\n"
+                    record = pending.pop(parts[1], None)
+                    if record is not None:
+                        dst.write(format_student_record(record) + ending)
+                        continue
+                    if len(parts) != 6:
+                        dst.write(line)
+                        continue
+
+                    body = line.rstrip("\r\n")
+                    last_field = body[body.rfind(",") + 1:]
+                    if len(last_field) < CLEARANCE_WIDTH:
+                        body += " " * (CLEARANCE_WIDTH - len(last_field))
+                    dst.write(body + ending)
+
+            os.replace(tmp_path, self.database)
+            self.refresh()
+
+    def apply_clearances(self, statuses):
+        """
+        Apply many clearance changes in one atomic rewrite.
+
+        `statuses` maps student_num -> bool. Returns (changed, unchanged,
+        unknown) lists of student numbers.
+        """
+        with self.lock():
+            self.refresh()
+            changed, unchanged, unknown = [], [], []
+            records = {}
+            for student_num, cleared in statuses.items():
+                parts = self.students.get(student_num)
+                if parts is None:
+                    unknown.append(student_num)
+                elif len(parts) == 6 and (parts[5].lower() == "true") == cleared:
+                    unchanged.append(student_num)
+                else:
+                    changed.append(student_num)
+                    records[student_num] = parts[1:5] + [cleared]
+
+            if records:
+                self.rewrite_students(records)
+            return changed, unchanged, unknown
+
+    def allocate_ids(self, prefix, count=1):
+        """
+        Hand out `count` new IDs of the form prefix + 6 digits.
+
+        IDs are drawn at random and checked against every ID already in the
+        file (and every ID handed out earlier), so they never collide. Raises
+        ValueError when the prefix has fewer than `count` IDs left.
+        """
+        if self.database.exists():
+            self.refresh()
+
+        new_ids = []
+        while len(new_ids) < count:
+            for _ in range(RANDOM_ID_ATTEMPTS):
+                candidate = f"{prefix}{random.randint(ID_SUFFIX_MIN, ID_SUFFIX_MAX)}"
+                if candidate not in self._ids and candidate not in self._reserved:
+                    break
+            else:
+                # the prefix is nearly full: pick from whatever is left
+                needed = count - len(new_ids)
+                free = [
+                    f"{prefix}{n}" for n in range(ID_SUFFIX_MIN, ID_SUFFIX_MAX + 1)
+                    if f"{prefix}{n}" not in self._ids and f"{prefix}{n}" not in self._reserved
+                ]
+                if len(free) < needed:
+                    raise ValueError(f"Not enough free {prefix} IDs left ({len(free)} free, {needed} needed).")
+                candidates = random.sample(free, needed)
+                self._reserved.update(candidates)
+                new_ids.extend(candidates)
+                break
+
+            self._reserved.add(candidate)
+            new_ids.append(candidate)
+
+        return new_ids
+
+    def append_records(self, records):
+        """
+        Append account records with one buffered write.
+
+        `records` is a list of field lists such as
+        ["STUDENT", id, name, classification, major, False] or
+        ["ADMIN", id, name]. The in-memory index is extended in place when it
+        was current before the write, so no re-parse is needed afterwards.
+        """
+        data = "".join(format_account_record(r) + "\n" for r in records).encode("utf-8")
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock():
+            was_current = self._is_current()
+
+            with open(self.database, "a+b") as f:
+                f.seek(0, os.SEEK_END)
+                start = f.tell()
+                if start > 0:
+                    f.seek(start - 1)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+
+            if was_current:
+                offset = start
+                for raw in data.splitlines(keepends=True):
+                    self._index_line(raw, offset)
+                    offset += len(raw)
+                self._stamp = self._file_stamp()
+            self._reserved.difference_update(r[1] for r in records)
+
+    def professor_names(self):
+        """Return a professor_id -> professor_name map."""
+        self.refresh()
+        return {pid: parts[2] for pid, parts in self.professors.items() if len(parts) > 2}
+
+
+_stores = {}
+
+
+def get_account_store(database=None):
+    """Return the shared AccountStore for `database` (default Database/Accounts.txt)."""
+    path = Path(database) if database is not None else DEFAULT_DATABASE
+    key = os.path.abspath(path)
+    store = _stores.get(key)
+    if store is None:
+        store = AccountStore(path)
+        _stores[key] = store
+    return store
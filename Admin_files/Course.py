@@ -1,24 +1,141 @@
-import random
 import csv
+import io
 import os
+import sys
 from pathlib import Path
 
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from CrnIndex import get_crn_index
+from CrnAllocator import get_crn_allocator
+from CoursesTable import get_courses_table
+from SortedCrnIndex import get_sorted_crn_index
+from Roster import Roster
+from EnrollmentIndex import get_enrollment_index
+from MeetingTime import meeting_mask, times_conflict
+
+
+class CourseRegistry(dict):
+    """
+    CRN (string) -> Course mapping that hydrates itself from disk.
+
+    A CRN that is not registered yet is resolved through the CRN index and
+    only that one course file is parsed; the resulting Course registers
+    itself here, so later lookups are plain dict hits.
+    """
+
+    def __init__(self, courses_dir=None):
+        super().__init__()
+        self.courses_dir = courses_dir
+
+    def _hydrate(self, crn):
+        # imported here because CourseCatalog imports this module
+        from CourseCatalog import load_course
+
+        course_file = get_crn_index(self.courses_dir).lookup(crn)
+        if course_file is None:
+            return None
+        course = load_course(course_file, Course)
+        if course is None or str(course.CRN) != str(crn).strip():
+            return None
+        return course
+
+    def __missing__(self, crn):
+        course = self._hydrate(crn)
+        if course is None:
+            raise KeyError(crn)
+        return course
+
+    def __contains__(self, crn):
+        return dict.__contains__(self, crn) or self._hydrate(crn) is not None
+
+    def get(self, crn, default=None):
+        try:
+            return self[crn]
+        except KeyError:
+            return default
+
+
+CSV_FIELDNAMES = ['crn', 'course_name', 'time', 'credits', 'class_list']
+# attributes that feed a save_all_courses_to_csv row; setting one marks the course dirty
+CSV_FIELDS = ('course_name', 'time', 'credits', 'class_list')
+
+
+def _encode_csv_row(values):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_stamp(csv_path):
+    try:
+        st = os.stat(csv_path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _read_csv_extras(csv_path):
+    """
+    Header of an existing courses CSV (plus any CSV_FIELDNAMES it lacks) and,
+    per CRN, the values of the columns a Course does not own, such as the
+    professor column CoursesTable keeps.
+    """
+    fieldnames = list(CSV_FIELDNAMES)
+    extras = {}
+    try:
+        with open(csv_path, mode="r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames:
+                fieldnames = list(reader.fieldnames)
+                fieldnames += [name for name in CSV_FIELDNAMES if name not in fieldnames]
+            for row in reader:
+                crn = (row.get("crn") or "").strip()
+                if crn:
+                    extras.setdefault(crn, {k: v for k, v in row.items() if k not in CSV_FIELDNAMES and k is not None})
+    except FileNotFoundError:
+        pass
+    return fieldnames, extras
+
+
+def _rewrite_courses_csv(csv_path, courses):
+    """Write the whole CSV atomically and return the row layout that was written."""
+    fieldnames, extras = _read_csv_extras(csv_path)
+    spans = {}
+    offset = 0
+    tmp_path = f"{csv_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        header = _encode_csv_row(fieldnames)
+        f.write(header)
+        offset += len(header)
+        for course in courses:
+            row = course.csv_row(fieldnames, extras.get(str(course.CRN)))
+            f.write(row)
+            spans[str(course.CRN)] = (offset, len(row), course.__dict__.get("edits", 0))
+            offset += len(row)
+    os.replace(tmp_path, csv_path)
+    return {"stamp": _csv_stamp(csv_path), "spans": spans, "dead": 0, "fieldnames": fieldnames, "extras": extras}
+
 
 class Course: 
     crns_list = []
-    # registry mapping CRN (string) -> Course instance
-    courses_by_crn = {}
-    def __init__(self, course_name, time, credits, class_list):
+    # registry mapping CRN (string) -> Course instance, loaded lazily from Database/courses
+    courses_by_crn = CourseRegistry()
+    # abspath of a CSV written by save_all_courses_to_csv -> row spans written there
+    _csv_layouts = {}
+    def __init__(self, course_name, time, credits, class_list, crn=None):
         self.course_name = course_name
-        CRN = random.randint(10000, 99999)
-        if CRN not in Course.crns_list:
-            Course.crns_list.append(CRN)
-            self.CRN = CRN
+        # courses loaded from disk keep their CRN; new courses get an unused one
+        # from the allocator, which learns every CRN persisted on disk the
+        # first time it has to hand one out
+        if crn is not None:
+            self.CRN = int(crn)
+            if get_crn_allocator().claim(self.CRN):
+                Course.crns_list.append(self.CRN)
         else:
-            while CRN in Course.crns_list:
-                CRN = random.randint(10000, 99999)
-            Course.crns_list.append(CRN)
-            self.CRN = CRN
+            self.CRN = get_crn_allocator().allocate()
+            Course.crns_list.append(self.CRN)
         # register this instance for class-level operations
         Course.courses_by_crn[str(self.CRN)] = self
         self.time = time
@@ -26,26 +143,114 @@ class Course:
         self.class_list = class_list
         self.professor = ''
     
+    def __setattr__(self, name, value):
+        if name == "class_list":
+            # enrolled students live in a Roster that reports its own edits
+            old_roster = self.__dict__.get("class_list", ())
+            value = Roster(value if value is not None else (), on_change=self._roster_changed)
+        object.__setattr__(self, name, value)
+        if name in CSV_FIELDS:
+            self.mark_dirty()
+        if name == "class_list":
+            self._roster_replaced(old_roster, value)
+
+    def _roster_replaced(self, old_roster, new_roster):
+        # a whole new list bypasses the Roster callbacks; report the difference
+        index = get_enrollment_index()
+        for student in old_roster:
+            if student not in new_roster:
+                index.drop(student, self.CRN)
+        for student in new_roster:
+            if student not in old_roster:
+                index.enroll(student, self.CRN)
+
+    def mark_dirty(self):
+        """Record an edit to a field written by save_all_courses_to_csv."""
+        self.__dict__["edits"] = self.__dict__.get("edits", 0) + 1
+
+    @property
+    def meeting_mask(self):
+        """Weekly bitmask of the 5-minute slots this course meets in (see MeetingTime)."""
+        return meeting_mask(self.time)
+
+    def conflicts_with(self, other):
+        return times_conflict(self.meeting_mask, other.meeting_mask)
+
+    def _roster_changed(self, student, enrolled):
+        self.mark_dirty()
+        if enrolled:
+            get_enrollment_index().enroll(student, self.CRN)
+        else:
+            get_enrollment_index().drop(student, self.CRN)
+
+    def csv_row(self, fieldnames=CSV_FIELDNAMES, extras=None):
+        """This course as an encoded CSV row; columns it does not own come from `extras`."""
+        own = {
+            "crn": self.CRN,
+            "course_name": self.course_name,
+            "time": self.time,
+            "credits": self.credits,
+            "class_list": ";".join(self.class_list),
+        }
+        extras = extras or {}
+        return _encode_csv_row([own[name] if name in own else extras.get(name, "") for name in fieldnames])
+
     @classmethod
     def save_all_courses_to_csv(cls, csv_path):
-        fieldnames = ['crn', 'course_name', 'time', 'credits', 'class_list']
-
+        """
+        Write every registered course to `csv_path`.
+
+        The byte span of each row and the edit count it was written at are
+        remembered per file. As long as nobody else touched the file, the next
+        call only writes courses edited since: a row that kept its length is
+        patched in place, otherwise the old span is overwritten with blank
+        lines (skipped by csv readers) and the row is appended. The file is
+        rewritten from scratch when it changed on disk, a course left the
+        registry, or the blanked bytes outgrow the live rows. A rewrite keeps
+        the file's header and each row's values for columns a Course does not
+        own, such as the professor column CoursesTable maintains.
+        """
         dirname = os.path.dirname(csv_path)
         if dirname:
             os.makedirs(dirname, exist_ok=True)
 
-        with open(csv_path, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for course in cls.courses_by_crn.values():
-                writer.writerow({
-                    "crn": course.CRN,
-                    "course_name": course.course_name,
-                    "time": course.time,
-                    "credits": course.credits,
-                    "class_list": ";".join(course.class_list)
-                })
+        key = os.path.abspath(csv_path)
+        layout = cls._csv_layouts.get(key)
+        courses = list(cls.courses_by_crn.values())
+        crns = {str(course.CRN) for course in courses}
+        if layout is None or layout["stamp"] != _csv_stamp(csv_path) or not crns >= layout["spans"].keys():
+            cls._csv_layouts[key] = _rewrite_courses_csv(csv_path, courses)
+            return
+
+        spans = layout["spans"]
+        with open(csv_path, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            for course in courses:
+                crn = str(course.CRN)
+                span = spans.get(crn)
+                edits = course.__dict__.get("edits", 0)
+                if span is not None and span[2] == edits:
+                    continue
+                row = course.csv_row(layout["fieldnames"], layout["extras"].get(crn))
+                if span is not None and span[1] == len(row):
+                    f.seek(span[0])
+                    f.write(row)
+                    spans[crn] = (span[0], len(row), edits)
+                    continue
+                if span is not None:
+                    f.seek(span[0])
+                    f.write(b"\n" * span[1])
+                    layout["dead"] += span[1]
+                f.seek(end)
+                f.write(row)
+                spans[crn] = (end, len(row), edits)
+                end += len(row)
+
+        if layout["dead"] > end - layout["dead"]:
+            cls._csv_layouts[key] = _rewrite_courses_csv(csv_path, courses)
+        else:
+            layout["stamp"] = _csv_stamp(csv_path)
 
     def print_course_details(self):
         print(f"Course Name: {self.course_name}")
@@ -57,63 +262,33 @@ class Course:
         for student in self.class_list:
             print(f"- {student}")
 
-    def display_crn_desc(self, csv_path):
-        crns = []
-
-        with open(csv_path, mode="r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                if "crn" in row and row["crn"].isdigit():
-                    crns.append(int(row["crn"]))
-
-        crns.sort(reverse=True)
+    @classmethod
+    def display_crn_desc(cls, csv_path, offset=0, page_size=None):
+        """
+        Print the CRNs in Courses.csv, highest first. With `page_size` only
+        that many are printed, starting `offset` entries in. Raises
+        FileNotFoundError if there is no such CSV.
+        """
+        if not os.path.isfile(csv_path):
+            raise FileNotFoundError(f"Courses file not found: {csv_path}")
+        crn_index = get_sorted_crn_index(csv_path)
+        if page_size is None:
+            page_size = len(crn_index)
 
-        for i, crn in enumerate(crns, start=1):
+        for i, crn in enumerate(crn_index.page(offset, page_size), start=offset + 1):
             print(f"{i}. {crn}")
 
     def assign_professor(self, crn, professor_name):
-
-        csv_path = Path(__file__).parent.parent / "Database" / "Courses.csv"
-        os.makedirs(csv_path.parent, exist_ok=True)
-
-        rows = []
-        fieldnames = ["crn", "course_name", "time", "class_list", "professor"]
         crn_str = str(crn)
-        updated_row = None
-
-        # Read existing rows if file exists
-        if csv_path.exists():
-            with open(csv_path, mode="r", newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                # load rows
-                for r in reader:
-                    # ensure professor key exists for every row
-                    if "professor" not in r:
-                        r["professor"] = ""
-                    rows.append(r)
-
-        # Update matching CRN row if present
-        for r in rows:
-            if r.get("crn") == crn_str:
-                r["professor"] = professor_name
-                updated_row = r
-                break
         if str(self.CRN) == crn_str:
             self.professor = professor_name
 
-        # If not found, append a new row with professor populated
+        # keyed update of the cached Courses.csv rows, written back in one atomic rewrite
+        updated_row = get_courses_table().update(crn_str, professor=professor_name)
         if updated_row is None:
             print("CRN not found in database. Please try creating a course with this CRN before assigning a professor to it.")
             return None
-        
-        # Write everything back with the professor column ensured
-        with open(csv_path, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in rows:
-                writer.writerow(r)
-        
+
         return updated_row
 
 
@@ -127,23 +302,18 @@ class Course:
     
     @staticmethod        
     def access_course_crn(find_course_name, csv_path):
-        with open(csv_path, mode="r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                if row["course_name"] == find_course_name:
-                    return row["crn"]
+        # first section with that name; see CoursesTable.crns_for_name for all of them
+        crns = get_courses_table(csv_path).crns_for_name(find_course_name)
+        if crns:
+            return crns[0]
         
         return "Course name not found, can not retrieve CRN."
     
     @staticmethod
     def access_course_course_name(crn, csv_path):
-        with open(csv_path, mode="r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                if row["crn"] == crn:
-                    return row["course_name"]
+        course_name = get_courses_table(csv_path).course_name(crn)
+        if course_name is not None:
+            return course_name
         
         return "CRN not found for the given course name."
     
@@ -171,7 +341,8 @@ class Course:
         }
 
         file_exists = os.path.isfile(csv_path)
-        with open(csv_path, mode="a", newline="", encoding="utf-8") as f:
+        with get_sorted_crn_index(csv_path).appending(self.CRN), \
+                open(csv_path, mode="a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
 
             if not file_exists or os.path.getsize(csv_path) == 0:
@@ -184,7 +355,8 @@ class Course:
         fieldnames = ["crn", "course_name", "time","credits", "class_list"]
         file_exists = os.path.isfile(csv_path)
 
-        with open(csv_path, mode="a", newline="", encoding="utf-8") as f:
+        with get_sorted_crn_index(csv_path).appending(course_obj.CRN), \
+                open(csv_path, mode="a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
 
             if not file_exists or os.path.getsize(csv_path) == 0:
@@ -201,7 +373,7 @@ class Course:
     #Scheduling Functions
     def add_course_on_student_schedule(self, schedule_list, student_name):
         if student_name not in self.class_list:
-            self.class_list.append(student_name)    
+            self.class_list.add(student_name)    
             schedule_list.append(self)
         else:
             print(f"Student {student_name} is already enrolled in this course.")
@@ -209,7 +381,7 @@ class Course:
     def remove_course_from_student_schedule(self, student_name, schedule_list):
         if student_name in self.class_list:
             schedule_list.remove(self)
-            self.class_list.remove(student_name)    
+            self.class_list.discard(student_name)    
         else:
             print(f"Student {student_name} is not enrolled in this course.")
     
@@ -225,10 +397,12 @@ class Course:
             f.write(f"credits: {self.credits}\n")
             f.write(f"course_name: {self.course_name}\n")
             f.write(f"time: {self.time}\n")
-            f.write("professor: none\n\n")
+            f.write(f"professor: {getattr(self, 'professor_id', None) or 'none'}\n\n")
             f.write("students:\n")
             for s in self.class_list:
                 f.write(f"{s}\n")
 
+        get_crn_index(folder).record(self.CRN, file_path)
+
 
     
\ No newline at end of file
@@ -0,0 +1,216 @@
+"""
+Non-interactive admin commands for batch jobs.
+
+Run from the project root, e.g.:
+    python Admin_files/admin_commands.py import-clearance bursar.csv
+    python Admin_files/admin_commands.py provision freshmen.csv --output ids.csv
+    python Admin_files/admin_commands.py replay-journal
+    python Admin_files/admin_commands.py assign-professors fall.csv
+    python Admin_files/admin_commands.py check-times
+    python Admin_files/admin_commands.py schedule-cohort freshmen.txt --processes 8
+    python Admin_files/admin_commands.py propose-times --output times.csv
+"""
+import argparse
+import csv
+import sys
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from Functions import import_fiscal_clearances
+from Signup import provision_accounts
+from CourseJournal import CourseJournal
+from CoursesTable import CoursesTable
+from CourseCatalog import CourseCatalog
+from MeetingTime import parse_meeting_time
+from CohortScheduler import schedule_cohort
+from TimetableSolver import propose_times, read_transcript_courses
+
+
+def import_clearance_command(args):
+    counts = import_fiscal_clearances(args.bursar_file, args.database)
+    print(f"Changed: {counts['changed']}")
+    print(f"Unchanged: {counts['unchanged']}")
+    print(f"Unknown IDs: {counts['unknown']}")
+    if counts["invalid"]:
+        print(f"Invalid rows skipped: {counts['invalid']}")
+
+
+def provision_command(args):
+    try:
+        results = provision_accounts(args.accounts_csv, args.database, args.output)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print(f"Created {len(results)} accounts.")
+    if args.output:
+        print(f"Row to ID mapping written to {args.output}")
+    else:
+        for row_num, role, name, user_id in results:
+            print(f"row {row_num}: {role} {name} -> {user_id}")
+
+
+def replay_journal_command(args):
+    journal = CourseJournal(args.courses_dir)
+    replayed = journal.recover()
+    print(f"Replayed {replayed} uncommitted course edits from {journal.journal_path}")
+
+
+def assign_professors_command(args):
+    assignments = {}
+    with open(args.assignments_csv, mode="r", newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if len(row) < 2 or not row[0].strip().isdigit():
+                continue
+            assignments[row[0].strip()] = row[1].strip()
+
+    missing = CoursesTable(args.courses_csv).assign_professors(assignments)
+    print(f"Assigned: {len(assignments) - len(missing)}")
+    if missing:
+        print(f"CRNs not found in Courses.csv: {', '.join(missing)}")
+
+
+def check_times_command(args):
+    bad = 0
+    for course in CourseCatalog(args.courses_dir).courses():
+        try:
+            parse_meeting_time(course.time)
+        except ValueError as e:
+            bad += 1
+            print(f"{course.source_path.name}: {e}")
+    print(f"{bad} course(s) with unreadable meeting times.")
+    if bad:
+        sys.exit(1)
+
+
+def read_student_ids(path):
+    """900-numbers from a file with one per line, or in the first column of a CSV."""
+    student_ids = []
+    with open(path, mode="r", newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            if row and row[0].strip().isdigit():
+                student_ids.append(row[0].strip())
+    return student_ids
+
+
+def schedule_cohort_command(args):
+    student_ids = read_student_ids(args.students_file)
+    result = schedule_cohort(
+        student_ids,
+        courses_dir=args.courses_dir,
+        processes=args.processes,
+        seats=args.seats,
+    )
+    print(f"Scheduled: {len(result['scheduled'])}")
+    print(f"Re-solved for full sections: {len(result['resolved'])}")
+    print(f"Skipped (already scheduled): {len(result['skipped'])}")
+    if result["unplaced"]:
+        print(f"No open sections for: {', '.join(result['unplaced'])}")
+
+
+def propose_times_command(args):
+    courses = CourseCatalog(args.courses_dir).courses()
+    proposal, current_cost, proposed_cost = propose_times(
+        courses,
+        transcript_terms=read_transcript_courses(args.transcripts),
+        iterations=args.iterations,
+        seed=args.seed,
+    )
+    changes = [(c, proposal[str(c.CRN)]) for c in courses if proposal.get(str(c.CRN), c.time) != c.time]
+    print(f"Conflict cost: {current_cost:g} now, {proposed_cost:g} proposed")
+    print(f"Sections to move: {len(changes)}")
+
+    if args.output:
+        with open(args.output, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["crn", "course_name", "current_time", "proposed_time"])
+            for course, new_time in changes:
+                writer.writerow([course.CRN, course.course_name, course.time, new_time])
+        print(f"Proposal written to {args.output}")
+    else:
+        for course, new_time in changes:
+            print(f"{course.CRN} {course.course_name}: {course.time} -> {new_time}")
+
+    if args.apply:
+        journal = CourseJournal(args.courses_dir)
+        for course, new_time in changes:
+            journal.apply(course.CRN, "change_time", time=new_time)
+        print(f"Applied {len(changes)} time changes.")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Earthquakes admin batch commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    clearance = subparsers.add_parser(
+        "import-clearance",
+        help="apply a bursar file of '900number,cleared|uncleared' rows",
+    )
+    clearance.add_argument("bursar_file")
+    clearance.add_argument("--database", default=None, help="path to Accounts.txt")
+    clearance.set_defaults(func=import_clearance_command)
+
+    provision = subparsers.add_parser(
+        "provision",
+        help="create accounts from a CSV with name,classification,major[,role] columns",
+    )
+    provision.add_argument("accounts_csv")
+    provision.add_argument("--output", default=None, help="write the row -> ID mapping to this CSV")
+    provision.add_argument("--database", default=None, help="path to Accounts.txt")
+    provision.set_defaults(func=provision_command)
+
+    replay = subparsers.add_parser(
+        "replay-journal",
+        help="re-apply course file edits interrupted by a crash",
+    )
+    replay.add_argument("--courses-dir", default=None, help="path to Database/courses")
+    replay.set_defaults(func=replay_journal_command)
+
+    assign = subparsers.add_parser(
+        "assign-professors",
+        help="set the professor column of Courses.csv from 'crn,professor' rows",
+    )
+    assign.add_argument("assignments_csv")
+    assign.add_argument("--courses-csv", default=None, help="path to Courses.csv")
+    assign.set_defaults(func=assign_professors_command)
+
+    times = subparsers.add_parser(
+        "check-times",
+        help="list course files whose time: line cannot be parsed",
+    )
+    times.add_argument("--courses-dir", default=None, help="path to Database/courses")
+    times.set_defaults(func=check_times_command)
+
+    cohort = subparsers.add_parser(
+        "schedule-cohort",
+        help="build and save schedules for every 900-number in a file",
+    )
+    cohort.add_argument("students_file")
+    cohort.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    cohort.add_argument("--seats", type=int, default=None, help="students allowed per section")
+    cohort.add_argument("--courses-dir", default=None, help="path to Database/courses")
+    cohort.set_defaults(func=schedule_cohort_command)
+
+    timetable = subparsers.add_parser(
+        "propose-times",
+        help="propose meeting times that keep commonly co-enrolled sections apart",
+    )
+    timetable.add_argument("--output", default=None, help="write 'crn,course_name,current_time,proposed_time' rows to this CSV")
+    timetable.add_argument("--apply", action="store_true", help="write the proposed times to the course files")
+    timetable.add_argument("--iterations", type=int, default=None, help="annealing moves (default: 500 per section)")
+    timetable.add_argument("--seed", type=int, default=0)
+    timetable.add_argument("--transcripts", default=None, help="path to Transcripts.csv")
+    timetable.add_argument("--courses-dir", default=None, help="path to Database/courses")
+    timetable.set_defaults(func=propose_times_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,16 @@ from Functions import clear_screen
 from Functions import admin_input_course
 from Functions import create_student_schedule
 from Functions import create_schedule
+from Functions import save_student_schedule
+from Functions import add_student_to_course
+from Functions import drop_student_from_course
 from Functions import manage_fiscal_clearance
+from SortedCrnIndex import get_sorted_crn_index
+from EnrollmentIndex import get_enrollment_index
+
+CRN_PAGE_SIZE = 20
 
 def admin_driver(admin):
-    all_students_schedules = []
     while True:
         print("\nWelcome to the Admin Portal!! Please Choose an Action from the Menu! ")
         print("\n===== ADMIN MENU =====")
@@ -25,7 +31,8 @@ def admin_driver(admin):
         print("7. Create Transcript")
         print("8. View Transcript")
         print("9. Assign Professor to Existing Course")
-        print("10. Exit")
+        print("10. Browse Course CRNs")
+        print("11. Exit")
 
         choice = input("Enter choice: ")
 
@@ -62,16 +69,14 @@ def admin_driver(admin):
         elif choice == "2":
             clear_screen()
             print("Student schedule")
-            student_900 = input("Enter student 900 number: ")
-            for schedule in all_students_schedules:
-                if student_900 in schedule.keys():
-                    print(f"Schedule for student {student_900}:")
-                    for course in schedule[student_900]:
-                        course.print_course_details()
-                    break
+            student_900 = input("Enter student 900 number: ").strip()
+            courses = get_enrollment_index().courses_for(student_900)
+            if courses:
+                print(f"Schedule for student {student_900}:")
+                for course in courses:
+                    course.print_course_details()
             else:
-                print(f"No schedule found for student {student_900}.")    
-            
+                print(f"No schedule found for student {student_900}.")
 
         elif choice == "3":
             clear_screen()
@@ -82,44 +87,47 @@ def admin_driver(admin):
             print("Create Student Schedule")
             student_900 = input("Enter student 900 number: ")
             new_schedule = create_schedule(student_900)
-            all_students_schedules.append({student_900: new_schedule})
+            save_student_schedule(student_900, new_schedule)
             create_new = input("Do you want to create another student schedule? (y/n): ").lower()
             
             while create_new != 'n':
                 student_900 = input("Enter student 900 number: ")
                 new_schedule = create_schedule(student_900)
-                all_students_schedules.append({student_900: new_schedule})
+                save_student_schedule(student_900, new_schedule)
                 create_new = input("Do you want to create another student schedule? (y/n): ").lower()
 
         
         elif choice == "5":
             clear_screen()
             course_action = (input("Add or Remove course from schedule? (a/r): ")).lower()
+            # course file rosters (and the enrollment index built from them) say who is enrolled
+            enrollment = get_enrollment_index()
             if course_action == 'a':
-                student_900 = input("Enter student 900 number: ")
-                course_to_add = admin_input_course()
-                for schedule in all_students_schedules:
-                    if student_900 in schedule.keys():
-                        course_to_add.add_course_on_student_schedule(schedule[student_900], student_900)
-                        print(f"Course {course_to_add.course_name} added to student {student_900}'s schedule.")
-                        break
-                else:
+                student_900 = input("Enter student 900 number: ").strip()
+                if not enrollment.crns_for(student_900):
                     print(f"No schedule found for student {student_900}.")
-            elif course_action == 'r':
-                student_900 = input("Enter student 900 number: ")
-                course_crn_to_remove = input("Enter course crn to remove: ")
-                for schedule in all_students_schedules:
-                    if student_900 in schedule.keys():
-                        for course in schedule[student_900]:
-                            if str(course.CRN) == course_crn_to_remove:
-                                course.remove_course_from_student_schedule(student_900, schedule[student_900])
-                                print(f"Course {course.course_name} removed from student {student_900}'s schedule.")
-                                break
-                        else:
-                            print(f"Course with CRN {course_crn_to_remove} not found in student {student_900}'s schedule.")
-                        break
+                    continue
+                course_crn_to_add = input("Enter course crn to add: ").strip()
+                if course_crn_to_add in enrollment.crns_for(student_900):
+                    print(f"Student {student_900} is already enrolled in this course.")
+                    continue
+                course = add_student_to_course(student_900, course_crn_to_add)
+                if course is None:
+                    print(f"Course with CRN {course_crn_to_add} not found.")
                 else:
+                    print(f"Course {course.course_name} added to student {student_900}'s schedule.")
+            elif course_action == 'r':
+                student_900 = input("Enter student 900 number: ").strip()
+                course_crn_to_remove = input("Enter course crn to remove: ").strip()
+                crns = enrollment.crns_for(student_900)
+                if not crns:
                     print(f"No schedule found for student {student_900}.")
+                elif course_crn_to_remove not in crns:
+                    print(f"Course with CRN {course_crn_to_remove} not found in student {student_900}'s schedule.")
+                else:
+                    course = drop_student_from_course(student_900, course_crn_to_remove)
+                    name = course.course_name if course is not None else course_crn_to_remove
+                    print(f"Course {name} removed from student {student_900}'s schedule.")
                     
         elif choice == "6":
             clear_screen()
@@ -175,6 +183,27 @@ def admin_driver(admin):
                     print("Assignment not made (already assigned or matching course file not found).")
 
         elif choice == "10":
+            clear_screen()
+            print("Course CRNs (highest first)")
+            crn_index = get_sorted_crn_index()
+            offset = 0
+            while True:
+                total = len(crn_index)
+                if total == 0:
+                    print("No courses in Courses.csv.")
+                    break
+                Course.display_crn_desc(crn_index.csv_path, offset, CRN_PAGE_SIZE)
+                last = min(offset + CRN_PAGE_SIZE, total)
+                print(f"Showing {offset + 1}-{last} of {total}")
+                step = input("n = next page, p = previous page, anything else to return: ").lower()
+                if step == "n" and last < total:
+                    offset += CRN_PAGE_SIZE
+                elif step == "p" and offset > 0:
+                    offset -= CRN_PAGE_SIZE
+                elif step not in ("n", "p"):
+                    break
+
+        elif choice == "11":
             break
 
         else:
@@ -4,26 +4,18 @@ from pathlib import Path
 admin_folder = Path(__file__).parent
 sys.path.insert(0, str(admin_folder))
 
-from Admin import Admin
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
 
-from pathlib import Path
+from Admin import Admin
+from AccountStore import get_account_store
 
 def load_admin(user_id, database=None):
-    if database is None:
-        base_folder = Path(__file__).parent.parent
-        database = base_folder / "Database" / "Accounts.txt"
-
-    with open(database, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = [p.strip().strip('"') for p in line.split(",")]
-
-            if parts[0] == "ADMIN" and parts[1] == user_id:
-                return Admin(
-                    admin_num=parts[1],
-                    full_name=parts[2]
-                )
+    parts = get_account_store(database).get_admin(user_id)
+    if parts is None or len(parts) < 3:
+        return None
 
-    return None
+    return Admin(
+        admin_num=parts[1],
+        full_name=parts[2]
+    )
@@ -1,4 +1,6 @@
+import csv
 import unittest
+import unittest.mock
 import tempfile
 import os
 from pathlib import Path
@@ -54,6 +56,63 @@ class TestCourseMethods(unittest.TestCase):
         finally:
             os.remove(path)
 
+    def test_save_all_courses_to_csv_rewrites_only_edited_rows(self):
+        c1 = Course(course_name="Physics 101", time="MWF 9-10", credits=4, class_list=["Alice"])
+        c2 = Course(course_name="Biology 101", time="TTh 1-2", credits=3, class_list=[])
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            Course.save_all_courses_to_csv(path)
+            c1.change_time("MWF 8-9")
+            c2.add_course_on_student_schedule([], "Bob")
+            with unittest.mock.patch("Admin_files.Course._rewrite_courses_csv") as rewrite:
+                Course.save_all_courses_to_csv(path)
+                rewrite.assert_not_called()
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                rows = {r["crn"]: r for r in csv.DictReader(f)}
+            self.assertEqual(len(rows), 2)
+            self.assertEqual(rows[str(c1.CRN)]["time"], "MWF 8-9")
+            self.assertEqual(rows[str(c2.CRN)]["class_list"], "Bob")
+        finally:
+            os.remove(path)
+
+    def test_save_all_courses_to_csv_skips_clean_courses(self):
+        course = Course(course_name="Chemistry 101", time="MWF 11-12", credits=4, class_list=[])
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            Course.save_all_courses_to_csv(path)
+            with unittest.mock.patch.object(Course, "csv_row") as csv_row:
+                Course.save_all_courses_to_csv(path)
+                csv_row.assert_not_called()
+        finally:
+            os.remove(path)
+
+    def test_save_all_courses_to_csv_keeps_professor_column(self):
+        from CoursesTable import CoursesTable
+
+        c1 = Course(course_name="Physics 101", time="MWF 9-10", credits=4, class_list=[])
+        c2 = Course(course_name="Biology 101", time="TTh 1-2", credits=3, class_list=[])
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        os.close(fd)
+        try:
+            Course.save_all_courses_to_csv(path)
+            CoursesTable(path).update(c1.CRN, professor="Dr. Smith")
+            # the file changed underneath, so this is a full rewrite
+            c2.change_time("MWF 1-2:15PM")
+            Course.save_all_courses_to_csv(path)
+            # and this one appends c1's longer row
+            c1.add_course_on_student_schedule([], "Alice")
+            Course.save_all_courses_to_csv(path)
+            with open(path, 'r', newline='', encoding='utf-8') as f:
+                rows = {r["crn"]: r for r in csv.DictReader(f)}
+            self.assertEqual(rows[str(c1.CRN)]["professor"], "Dr. Smith")
+            self.assertEqual(rows[str(c1.CRN)]["class_list"], "Alice")
+            self.assertEqual(rows[str(c2.CRN)]["professor"], "")
+            self.assertEqual(rows[str(c2.CRN)]["time"], "MWF 1-2:15PM")
+        finally:
+            os.remove(path)
+
     # print_course_details tests
     def test_print_course_details_no_exception(self):
         course = Course(course_name="Chemistry 101", time="MWF 11-12", credits=4, class_list=["Carol"])
@@ -0,0 +1,117 @@
+import csv
+import os
+import re
+from pathlib import Path
+
+from MeetingTime import meeting_mask
+
+DEFAULT_OVERRIDES = Path(__file__).parent / "Database" / "corequisites.csv"
+# "BIO 110L" and "BIO 110 Lab" are the labs of "BIO 110"
+LAB_NAME = re.compile(r"^(?P<lecture>.*\d)\s*(?:L|LAB)$", re.IGNORECASE)
+
+_overrides = {}
+
+
+def load_overrides(path=None):
+    """
+    Read the override table: rows of course_name,group. A course is put in
+    the named group instead of the one its name suggests; a blank group
+    takes it out of any group. Re-read only when the file changes.
+    """
+    path = Path(path) if path is not None else DEFAULT_OVERRIDES
+    key = os.path.abspath(path)
+    try:
+        stamp = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _overrides.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    table = {}
+    with open(path, mode="r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            name = (row.get("course_name") or "").strip()
+            if name:
+                table[name] = (row.get("group") or "").strip()
+    _overrides[key] = (stamp, table)
+    return table
+
+
+def corequisite_key(course_name, overrides=None):
+    """The group a course belongs to (its lecture's name), or None if it stands alone."""
+    if overrides and course_name in overrides:
+        return overrides[course_name] or None
+    match = LAB_NAME.match(course_name.strip())
+    return match["lecture"].strip() if match else course_name.strip()
+
+
+def corequisite_groups(course_names, overrides=None):
+    """group -> sorted course names, for the groups with more than one course in `course_names`."""
+    groups = {}
+    for name in set(course_names):
+        key = corequisite_key(name, overrides)
+        if key is not None:
+            groups.setdefault(key, set()).add(name)
+    return {key: sorted(names) for key, names in groups.items() if len(names) > 1}
+
+
+class CourseBundle:
+    """One section of each course in a co-requisite group, scheduled as a unit."""
+
+    __slots__ = ("course_name", "parts", "credits", "meeting_mask")
+
+    def __init__(self, group, parts):
+        self.course_name = group
+        self.parts = parts
+        self.credits = sum(c.credits for c in parts)
+        self.meeting_mask = 0
+        for c in parts:
+            self.meeting_mask |= meeting_mask(c.time)
+
+
+def link_corequisites(courses, overrides=None):
+    """
+    Replace the sections of every co-requisite group by CourseBundles of
+    one section per course that do not overlap each other, so a lecture is
+    never picked without its lab. Sections of other courses pass through.
+    """
+    if overrides is None:
+        overrides = load_overrides()
+    groups = corequisite_groups((c.course_name for c in courses), overrides)
+    if not groups:
+        return list(courses)
+
+    group_of = {name: key for key, names in groups.items() for name in names}
+    items = []
+    # group -> course name -> sections
+    sections = {}
+    for c in courses:
+        key = group_of.get(c.course_name)
+        if key is None:
+            items.append(c)
+        else:
+            sections.setdefault(key, {}).setdefault(c.course_name, []).append(c)
+
+    for key, by_name in sections.items():
+        partials = [((), 0)]
+        for name in groups[key]:
+            partials = [
+                (parts + (c,), mask | meeting_mask(c.time))
+                for parts, mask in partials
+                for c in by_name[name]
+                if not mask & meeting_mask(c.time)
+            ]
+        items.extend(CourseBundle(key, list(parts)) for parts, _ in partials)
+    return items
+
+
+def expand(items):
+    """Flatten CourseBundles back into their courses."""
+    courses = []
+    for item in items:
+        if isinstance(item, CourseBundle):
+            courses.extend(item.parts)
+        else:
+            courses.append(item)
+    return courses
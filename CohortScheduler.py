@@ -0,0 +1,114 @@
+import os
+import random
+from multiprocessing import Pool
+
+from CourseCatalog import CourseCatalog
+from CourseJournal import get_course_journal
+from ScheduleSolver import DEFAULT_TIME_BUDGET, best_schedule
+
+class CatalogEntry:
+    """The read-only part of a Course the solver needs, cheap to send to workers."""
+
+    __slots__ = ("crn", "course_name", "time", "credits")
+
+    def __init__(self, crn, course_name, time, credits):
+        self.crn = crn
+        self.course_name = course_name
+        self.time = time
+        self.credits = credits
+
+
+def solve_student(student_id, entries, max_credits, time_budget):
+    """
+    Best schedule for one student. The solver keeps the first of equally good
+    sections it sees, so the catalog is shuffled with the student's ID as the
+    seed: the cohort spreads over all sections of a course instead of piling
+    into the first one, and a rerun gives the same answer.
+    """
+    entries = list(entries)
+    random.Random(student_id).shuffle(entries)
+    chosen = best_schedule(entries, max_credits, time_budget=time_budget)
+    return student_id, [entry.crn for entry in chosen]
+
+
+# set in each worker process by _init_worker
+_worker_catalog = None
+
+
+def _init_worker(entries, max_credits, time_budget):
+    global _worker_catalog
+    _worker_catalog = (entries, max_credits, time_budget)
+
+
+def _solve_in_worker(student_id):
+    entries, max_credits, time_budget = _worker_catalog
+    return solve_student(student_id, entries, max_credits, time_budget)
+
+
+def schedule_cohort(student_ids, courses_dir=None, processes=None, seats=None,
+                    max_credits=19, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Build and commit schedules for a whole cohort without prompting.
+
+    The catalog is read once and handed to a pool of `processes` workers
+    (default: one per core), which solve every student's schedule in
+    parallel. The results are then committed serially, in input order: if
+    `seats` is set and a chosen section filled up in the meantime, that
+    student is re-solved against the sections that still have room. Each
+    touched course file gets one journaled edit with all of its new
+    students; the rosters are the saved schedules.
+
+    Students already on a course roster are skipped, so rerunning over the
+    same list only schedules the ones that are left. A student no section
+    could be found for is reported as unplaced and nothing is saved for
+    them.
+
+    Returns a dict with the scheduled {student: [CRNs]}, the students that
+    were re-solved, skipped and unplaced.
+    """
+    courses = {str(course.CRN): course for course in CourseCatalog(courses_dir).courses()}
+    entries = [CatalogEntry(crn, c.course_name, c.time, c.credits) for crn, c in courses.items()]
+
+    rostered = set()
+    for course in courses.values():
+        rostered.update(course.class_list)
+    skipped = []
+    pending = []
+    for student_id in dict.fromkeys(student_ids):
+        if student_id in rostered:
+            skipped.append(student_id)
+        else:
+            pending.append(student_id)
+
+    workers = processes or os.cpu_count() or 1
+    if workers == 1 or len(pending) < 2:
+        solved = [solve_student(s, entries, max_credits, time_budget) for s in pending]
+    else:
+        with Pool(workers, initializer=_init_worker, initargs=(entries, max_credits, time_budget)) as pool:
+            solved = pool.map(_solve_in_worker, pending, chunksize=max(1, len(pending) // (4 * workers)))
+
+    # commit phase: single process, students in input order
+    enrolled = {crn: len(course.class_list) for crn, course in courses.items()}
+    new_students = {}
+    scheduled = {}
+    resolved = []
+    unplaced = []
+    for student_id, crns in solved:
+        if seats is not None and any(enrolled[crn] >= seats for crn in crns):
+            open_entries = [e for e in entries if enrolled[e.crn] < seats]
+            student_id, crns = solve_student(student_id, open_entries, max_credits, time_budget)
+            resolved.append(student_id)
+        if not crns:
+            unplaced.append(student_id)
+            continue
+        for crn in crns:
+            enrolled[crn] += 1
+            new_students.setdefault(crn, []).append(student_id)
+            courses[crn].class_list.add(student_id)
+        scheduled[student_id] = crns
+
+    journal = get_course_journal(courses_dir)
+    for crn, students in new_students.items():
+        journal.apply(crn, "add_students", student_ids=students)
+
+    return {"scheduled": scheduled, "resolved": resolved, "skipped": skipped, "unplaced": unplaced}
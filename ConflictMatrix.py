@@ -0,0 +1,69 @@
+from MeetingTime import meeting_mask
+
+
+def _bit_positions(bits):
+    return [i for i, bit in enumerate(reversed(bin(bits))) if bit == "1"]
+
+
+class ConflictMatrix:
+    """
+    Which sections of a catalog meet at overlapping times.
+
+    Row i is a Python int with bit j set when sections i and j overlap, so
+    "everything compatible with these sections" is one OR of their rows and
+    one AND NOT against the full set. Sections with the same meeting time
+    share a row, which keeps a 5,000-section catalog to a few MB at most.
+    Rows are built slot by slot: every 5-minute slot of the week gets the
+    set of sections meeting in it, and a row is the OR of its slots.
+    """
+
+    def __init__(self, courses):
+        self.crns = [str(course.CRN) for course in courses]
+        self._index = {crn: i for i, crn in enumerate(self.crns)}
+        self._all = (1 << len(self.crns)) - 1
+
+        # meeting mask -> bitset of the sections with that mask
+        members = {}
+        for i, course in enumerate(courses):
+            mask = meeting_mask(course.time)
+            members[mask] = members.get(mask, 0) | (1 << i)
+
+        slot_sections = {}
+        for mask, bits in members.items():
+            for slot in _bit_positions(mask):
+                slot_sections[slot] = slot_sections.get(slot, 0) | bits
+
+        self._rows = {}
+        for mask in members:
+            row = 0
+            for slot in _bit_positions(mask):
+                row |= slot_sections[slot]
+            self._rows[mask] = row
+        self._section_masks = [meeting_mask(course.time) for course in courses]
+
+    def __len__(self):
+        return len(self.crns)
+
+    def _position(self, crn):
+        i = self._index.get(str(crn).strip())
+        if i is None:
+            raise ValueError(f"CRN {crn} is not in the catalog")
+        return i
+
+    def row(self, crn):
+        """Bitset (by catalog position) of the sections that overlap `crn`."""
+        return self._rows[self._section_masks[self._position(crn)]]
+
+    def conflicts(self, crn_a, crn_b):
+        return bool(self.row(crn_a) >> self._position(crn_b) & 1)
+
+    def compatible_with(self, crns):
+        """CRNs of every other section that overlaps none of `crns`."""
+        blocked = 0
+        for crn in crns:
+            blocked |= self.row(crn) | (1 << self._position(crn))
+        return [self.crns[i] for i in _bit_positions(self._all & ~blocked)]
+
+    def nbytes(self):
+        """Approximate memory held by the rows."""
+        return sum((row.bit_length() + 7) // 8 for row in self._rows.values())
@@ -0,0 +1,176 @@
+import os
+from pathlib import Path
+
+from Admin_files.Course import Course
+from AccountStore import get_account_store
+from ConflictMatrix import ConflictMatrix
+
+DEFAULT_COURSES_DIR = Path(__file__).parent / "Database" / "courses"
+
+
+def parse_course_file(course_path):
+    """
+    Parse one Database/courses/*.txt file.
+
+    Returns a dict with crn, course_name, time, credits, professor_id and
+    students, or None when the file has no crn/course_name.
+    """
+    with open(course_path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    crn = None
+    course_name = None
+    time = "TBA"
+    credits = 3
+    students = []
+    professor_id = None
+
+    reading_students = False
+    for line in lines:
+        line = line.strip()
+
+        if line.startswith("crn:"):
+            crn = line.split(":", 1)[1].strip()
+        elif line.startswith("course_name:"):
+            course_name = line.split(":", 1)[1].strip()
+        elif line.startswith("time:"):
+            time = line.split(":", 1)[1].strip()
+        elif line.startswith("credits:"):
+            credits_str = line.split(":", 1)[1].strip()
+            credits = int(credits_str) if credits_str.isdigit() else 3
+        elif line.startswith("professor:"):
+            prof_val = line.split(":", 1)[1].strip()
+            if prof_val and prof_val.lower() != "none":
+                professor_id = prof_val
+        elif line.startswith("students:"):
+            reading_students = True
+        elif reading_students and line and line != "professor: none":
+            students.append(line)
+
+    if not crn or not course_name:
+        return None
+    return {
+        "crn": crn,
+        "course_name": course_name,
+        "time": time,
+        "credits": credits,
+        "professor_id": professor_id,
+        "students": students,
+    }
+
+
+def load_course(course_path, course_class=Course, database=None):
+    """
+    Build a Course from one course file, or return None if it is unreadable.
+
+    The professor id from the file and the professor's name (looked up in
+    AccountStore) are attached as professor_id / professor_name, and the
+    file it came from as source_path.
+    """
+    try:
+        data = parse_course_file(course_path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if data is None or not data["crn"].isdigit():
+        return None
+
+    course = course_class(data["course_name"], data["time"], data["credits"], data["students"], crn=data["crn"])
+    course.professor_id = data["professor_id"]
+    course.professor_name = None
+    if data["professor_id"]:
+        try:
+            prof = get_account_store(database).get_professor(data["professor_id"])
+        except OSError:
+            # if reading accounts fails, continue without professor names
+            prof = None
+        if prof is not None and len(prof) > 2:
+            course.professor_name = prof[2]
+    course.source_path = Path(course_path)
+    return course
+
+
+class CourseCatalog:
+    """
+    Cached view of the Database/courses directory.
+
+    Each course file is parsed once into a Course object. Every access
+    re-stats the directory and only files whose mtime/size changed (or that
+    were added or removed) are parsed again, so repeated schedule builds do
+    not re-read the whole catalog.
+    """
+
+    def __init__(self, courses_dir=None, database=None):
+        self.courses_dir = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+        self.database = database
+        # file name -> ((mtime_ns, size), Course or None)
+        self._files = {}
+        self._by_crn = {}
+        # bumped whenever the set of courses changes
+        self.version = 0
+        self._conflicts = None
+
+    def refresh(self):
+        if not self.courses_dir.exists():
+            if self._files:
+                self.version += 1
+            self._files = {}
+            self._by_crn = {}
+            return
+
+        seen = {}
+        changed = False
+        with os.scandir(self.courses_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".txt") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._files.get(entry.name)
+                if cached is not None and cached[0] == stamp:
+                    seen[entry.name] = cached
+                else:
+                    seen[entry.name] = (stamp, self._load_course(Path(entry.path)))
+                    changed = True
+
+        if changed or len(seen) != len(self._files):
+            self._files = seen
+            self._by_crn = {
+                str(course.CRN): course
+                for _, (_, course) in sorted(seen.items())
+                if course is not None
+            }
+            self.version += 1
+
+    def _load_course(self, course_path):
+        return load_course(course_path, database=self.database)
+
+    def get(self, crn):
+        """Return the Course with this CRN, or None."""
+        self.refresh()
+        return self._by_crn.get(str(crn).strip())
+
+    def courses(self):
+        """Return every course, ordered by file name."""
+        self.refresh()
+        return list(self._by_crn.values())
+
+    def conflict_matrix(self):
+        """Return the ConflictMatrix of the current courses, rebuilt only when they change."""
+        self.refresh()
+        if self._conflicts is None or self._conflicts[0] != self.version:
+            self._conflicts = (self.version, ConflictMatrix(list(self._by_crn.values())))
+        return self._conflicts[1]
+
+
+_catalogs = {}
+
+
+def get_course_catalog(courses_dir=None):
+    """Return the shared CourseCatalog for `courses_dir` (default Database/courses)."""
+    path = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+    key = os.path.abspath(path)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        catalog = CourseCatalog(path)
+        _catalogs[key] = catalog
+    return catalog
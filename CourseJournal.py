@@ -0,0 +1,215 @@
+import json
+import os
+from pathlib import Path
+
+from CrnIndex import get_crn_index
+
+DEFAULT_COURSES_DIR = Path(__file__).parent / "Database" / "courses"
+# truncate the journal once everything in it is committed and it grew past this
+CHECKPOINT_BYTES = 1 << 20
+
+
+def _set_field(text, key, value, after_keys):
+    new_line = f"{key}: {value}"
+    for i, line in enumerate(text):
+        if line.lower().startswith(f"{key}:"):
+            text[i] = new_line
+            return text
+    for after in after_keys:
+        for i, line in enumerate(text):
+            if line.lower().startswith(f"{after}:"):
+                text.insert(i + 1, new_line)
+                return text
+    text.append(new_line)
+    return text
+
+
+def assign_professor(text, professor_id):
+    return _set_field(text, "professor", professor_id, ("credits", "crn"))
+
+
+def change_time(text, time):
+    return _set_field(text, "time", time, ("course_name", "credits", "crn"))
+
+
+def drop_student(text, student_id):
+    reading_students = False
+    for i, line in enumerate(text):
+        if line.startswith("students:"):
+            reading_students = True
+        elif reading_students and line.strip() == student_id:
+            del text[i]
+            break
+    return text
+
+
+def add_students(text, student_ids):
+    if not any(line.startswith("students:") for line in text):
+        text.append("students:")
+    enrolled = set()
+    reading_students = False
+    for line in text:
+        if line.startswith("students:"):
+            reading_students = True
+        elif reading_students and line.strip():
+            enrolled.add(line.strip())
+    text.extend(s for s in dict.fromkeys(student_ids) if s not in enrolled)
+    return text
+
+
+# op name -> function(lines of the course file, **args) -> new lines
+OPERATIONS = {
+    "assign_professor": assign_professor,
+    "change_time": change_time,
+    "drop_student": drop_student,
+    "add_students": add_students,
+}
+
+
+class CourseJournal:
+    """
+    Append-only write-ahead journal for edits to Database/courses files.
+
+    Each edit is journaled as a small intent record (op, CRN, file, args)
+    and fsynced, the course file is then replaced atomically (temp file +
+    rename) and a commit record is appended. After a crash, `recover()`
+    re-applies every intent that has no commit; all ops are idempotent so
+    replaying one that already reached the file is harmless. `apply` runs
+    that recovery before any new edit, so an old intent is never replayed
+    over a newer one. This replaces the full .bak copy that assign_course
+    used to make before every edit.
+    """
+
+    def __init__(self, courses_dir=None, journal_path=None):
+        self.courses_dir = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+        if journal_path is None:
+            journal_path = self.courses_dir.parent / "course_journal.log"
+        self.journal_path = Path(journal_path)
+        self._next_seq = None
+        # None until the journal has been checked for intents left by a crash
+        self._needs_recovery = None
+
+    def _read_entries(self):
+        entries = []
+        if not self.journal_path.exists():
+            return entries
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    # a torn final line from a crash mid-append
+                    continue
+        return entries
+
+    def _append(self, entry):
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_course_file(self, course_file, op, args):
+        text = course_file.read_text(encoding="utf-8").splitlines()
+        text = OPERATIONS[op](text, **args)
+        tmp_path = course_file.with_name(course_file.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(text).rstrip() + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, course_file)
+
+    def apply(self, crn, op, **args):
+        """
+        Journal and apply one edit to the course file holding `crn`.
+
+        Returns False (and journals nothing) if no course file has that CRN.
+        """
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown course operation: {op}")
+        crn = str(crn).strip()
+        crn_index = get_crn_index(self.courses_dir)
+        course_file = crn_index.lookup(crn)
+        if course_file is None:
+            return False
+
+        if self._needs_recovery is None:
+            self._needs_recovery = bool(self.pending())
+        if self._needs_recovery:
+            self.recover()
+
+        if self._next_seq is None:
+            self._next_seq = max((e.get("seq", 0) for e in self._read_entries()), default=0) + 1
+        seq = self._next_seq
+        self._next_seq += 1
+
+        self._append({"seq": seq, "op": op, "crn": crn, "file": course_file.name, "args": args})
+        try:
+            self._write_course_file(course_file, op, args)
+        except BaseException:
+            self._needs_recovery = True
+            raise
+        self._append({"seq": seq, "commit": True})
+
+        # the rename touched the folder; let the index accept it without a rebuild
+        crn_index.record(crn, course_file)
+        if self.journal_path.stat().st_size > CHECKPOINT_BYTES:
+            self.checkpoint()
+        return True
+
+    def pending(self):
+        """Return intent records that were never committed, oldest first."""
+        intents = {}
+        for entry in self._read_entries():
+            if entry.get("commit"):
+                intents.pop(entry.get("seq"), None)
+            elif "op" in entry:
+                intents[entry["seq"]] = entry
+        return [intents[seq] for seq in sorted(intents)]
+
+    def recover(self):
+        """Replay uncommitted edits, then truncate the journal. Returns the number replayed."""
+        replayed = 0
+        for entry in self.pending():
+            course_file = self.courses_dir / entry["file"]
+            if course_file.exists():
+                self._write_course_file(course_file, entry["op"], entry.get("args", {}))
+                replayed += 1
+            self._append({"seq": entry["seq"], "commit": True})
+
+        # temp files left behind by a crash before their rename
+        for tmp_path in self.courses_dir.glob("*.txt.tmp"):
+            tmp_path.unlink()
+        self.checkpoint()
+        self._needs_recovery = False
+        return replayed
+
+    def checkpoint(self):
+        """Truncate the journal if every entry in it is committed."""
+        if self.journal_path.exists() and not self.pending():
+            self.journal_path.write_text("", encoding="utf-8")
+
+
+_journals = {}
+
+
+def get_course_journal(courses_dir=None):
+    """Return the shared CourseJournal for `courses_dir` (default Database/courses)."""
+    path = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+    key = os.path.abspath(path)
+    journal = _journals.get(key)
+    if journal is None:
+        journal = CourseJournal(path)
+        _journals[key] = journal
+    return journal
+
+
+def save_course_change(course, op, **args):
+    """
+    Persist one edit already made to `course` in memory.
+
+    Goes through the journal when the course has a file on disk, otherwise
+    writes the whole course with save_to_txt.
+    """
+    if not get_course_journal().apply(course.CRN, op, **args):
+        course.save_to_txt()
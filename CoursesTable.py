@@ -0,0 +1,174 @@
+import csv
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_COURSES_CSV = Path(__file__).parent / "Database" / "Courses.csv"
+DEFAULT_FIELDNAMES = ["crn", "course_name", "time", "credits", "class_list", "professor"]
+
+
+class CoursesTable:
+    """
+    CRN-keyed view of Courses.csv.
+
+    The file is read once into a dict of rows keyed by CRN and re-read only
+    when it changes on disk. Rows the dict cannot key (no CRN, or a CRN
+    repeated further down) are kept so a rewrite never drops them. Updates
+    are made in memory and written back with a single atomic rewrite (temp
+    file + rename) that keeps every column of the original header. Inside
+    `batch()` the write is deferred until the block exits, so assigning
+    professors for a whole term costs one rewrite instead of one per course.
+
+    A course name -> CRNs index is built alongside the rows, so lookups in
+    either direction are dict hits. A name maps to a list of CRNs because the
+    same course can be offered in several sections.
+    """
+
+    def __init__(self, csv_path=None):
+        self.csv_path = Path(csv_path) if csv_path is not None else DEFAULT_COURSES_CSV
+        self.rows = {}
+        self.crns_by_name = {}
+        self._file_rows = []
+        self.fieldnames = list(DEFAULT_FIELDNAMES)
+        self._stamp = None
+        self._dirty = False
+        self._batch_depth = 0
+
+    def _file_stamp(self):
+        try:
+            st = os.stat(self.csv_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def refresh(self):
+        """Re-read Courses.csv if it changed on disk (pending edits are kept)."""
+        if self._dirty:
+            return
+        stamp = self._file_stamp()
+        if stamp is not None and stamp == self._stamp:
+            return
+
+        rows = {}
+        file_rows = []
+        fieldnames = list(DEFAULT_FIELDNAMES)
+        if stamp is not None:
+            with open(self.csv_path, mode="r", newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                if reader.fieldnames:
+                    fieldnames = list(reader.fieldnames)
+                for row in reader:
+                    file_rows.append(row)
+                    crn = (row.get("crn") or "").strip()
+                    if crn:
+                        rows.setdefault(crn, row)
+        if "professor" not in fieldnames:
+            fieldnames.append("professor")
+
+        crns_by_name = {}
+        for crn, row in rows.items():
+            crns_by_name.setdefault(row.get("course_name") or "", []).append(crn)
+
+        self.rows = rows
+        self._file_rows = file_rows
+        self.crns_by_name = crns_by_name
+        self._stamp = stamp
+        self.fieldnames = fieldnames
+
+    def get(self, crn):
+        self.refresh()
+        return self.rows.get(str(crn).strip())
+
+    def __contains__(self, crn):
+        return self.get(crn) is not None
+
+    def course_name(self, crn):
+        """Return the course name for `crn`, or None."""
+        row = self.get(crn)
+        return row.get("course_name") if row is not None else None
+
+    def crns_for_name(self, course_name):
+        """Return the CRNs of every section named `course_name`, in file order."""
+        self.refresh()
+        return list(self.crns_by_name.get(course_name, ()))
+
+    def update(self, crn, **fields):
+        """
+        Set `fields` on the row for `crn`. Returns the updated row, or None if
+        Courses.csv has no such CRN. Flushed right away unless inside batch().
+        """
+        with self.batch():
+            row = self.rows.get(str(crn).strip())
+            if row is None:
+                return None
+            if "course_name" in fields:
+                self._unindex_name(row)
+            for key, value in fields.items():
+                if key not in self.fieldnames:
+                    self.fieldnames.append(key)
+                row[key] = value
+            if "course_name" in fields:
+                self.crns_by_name.setdefault(row["course_name"] or "", []).append(row["crn"].strip())
+            self._dirty = True
+        return row
+
+    def _unindex_name(self, row):
+        name = row.get("course_name") or ""
+        crns = self.crns_by_name.get(name, [])
+        if row["crn"].strip() in crns:
+            crns.remove(row["crn"].strip())
+        if not crns:
+            self.crns_by_name.pop(name, None)
+
+    def assign_professors(self, assignments):
+        """
+        Apply a {crn: professor} mapping with one rewrite of Courses.csv.
+        Returns the CRNs that were not found.
+        """
+        missing = []
+        with self.batch():
+            for crn, professor in assignments.items():
+                if self.update(crn, professor=professor) is None:
+                    missing.append(str(crn))
+        return missing
+
+    @contextmanager
+    def batch(self):
+        """Defer writing Courses.csv until the outermost batch exits."""
+        if self._batch_depth == 0:
+            self.refresh()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self):
+        if not self._dirty:
+            return
+        os.makedirs(self.csv_path.parent, exist_ok=True)
+        tmp_path = self.csv_path.with_name(self.csv_path.name + ".tmp")
+        with open(tmp_path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames, restval="", extrasaction="ignore")
+            writer.writeheader()
+            for row in self._file_rows:
+                writer.writerow(row)
+        os.replace(tmp_path, self.csv_path)
+        self._dirty = False
+        self._stamp = self._file_stamp()
+
+
+_tables = {}
+
+
+def get_courses_table(csv_path=None):
+    """Return the shared CoursesTable for `csv_path` (default Database/Courses.csv)."""
+    path = Path(csv_path) if csv_path is not None else DEFAULT_COURSES_CSV
+    key = os.path.abspath(path)
+    table = _tables.get(key)
+    if table is None:
+        table = CoursesTable(path)
+        _tables[key] = table
+    return table
@@ -0,0 +1,139 @@
+import csv
+import random
+from pathlib import Path
+
+from CrnIndex import get_crn_index
+
+DEFAULT_COURSES_CSV = Path(__file__).parent / "Database" / "Courses.csv"
+CRN_MIN = 10000
+CRN_MAX = 99999
+RANDOM_CRN_ATTEMPTS = 32
+
+
+class CrnAllocator:
+    """
+    Hands out unique 5-digit CRNs.
+
+    Used CRNs are kept in a bytearray bitmap over the 10000-99999 space, so
+    membership and reservation are O(1). The bitmap is seeded (once, on the
+    first allocation or lookup) from every CRN already persisted in
+    Database/courses and Database/Courses.csv, without rewriting the CRN
+    index; courses loaded from disk before then only `claim()` their CRN.
+    New CRNs are drawn at random like before; once the
+    space is crowded the next free slot is found with a C-level scan instead
+    of retrying, and a ValueError is raised when nothing is left.
+    """
+
+    def __init__(self, courses_dir=None, courses_csv=None):
+        self.courses_dir = courses_dir
+        self.courses_csv = Path(courses_csv) if courses_csv is not None else DEFAULT_COURSES_CSV
+        self._used = None
+        self._free = 0
+        # CRNs claimed before the bitmap was seeded
+        self._claimed = set()
+
+    def _seed(self):
+        self._used = bytearray(CRN_MAX - CRN_MIN + 1)
+        self._free = len(self._used)
+
+        for crn in self._claimed:
+            self._mark(crn)
+        self._claimed = set()
+        for crn in get_crn_index(self.courses_dir).crns(persist=False):
+            self._mark(crn)
+
+        if self.courses_csv.exists():
+            with open(self.courses_csv, mode="r", newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    self._mark(row.get("crn"))
+
+    def _mark(self, crn):
+        try:
+            slot = int(str(crn).strip()) - CRN_MIN
+        except (TypeError, ValueError):
+            return False
+        if not 0 <= slot < len(self._used) or self._used[slot]:
+            return False
+        self._used[slot] = 1
+        self._free -= 1
+        return True
+
+    def __contains__(self, crn):
+        if self._used is None:
+            self._seed()
+        try:
+            slot = int(crn) - CRN_MIN
+        except (TypeError, ValueError):
+            return False
+        return 0 <= slot < len(self._used) and bool(self._used[slot])
+
+    def claim(self, crn):
+        """
+        Note a CRN that is in use without seeding the bitmap. Returns False if
+        this allocator already knew it.
+        """
+        if self._used is not None:
+            return self._mark(crn)
+        try:
+            crn = int(str(crn).strip())
+        except (TypeError, ValueError):
+            return False
+        if crn in self._claimed:
+            return False
+        self._claimed.add(crn)
+        return True
+
+    def reserve(self, crn):
+        """Mark an existing CRN as used. Returns False if it already was."""
+        if self._used is None:
+            self._seed()
+        return self._mark(crn)
+
+    def allocate(self):
+        """Return a new random unused CRN."""
+        if self._used is None:
+            self._seed()
+        if self._free == 0:
+            raise ValueError(f"All CRNs between {CRN_MIN} and {CRN_MAX} are in use.")
+
+        for _ in range(RANDOM_CRN_ATTEMPTS):
+            slot = random.randrange(len(self._used))
+            if not self._used[slot]:
+                break
+        else:
+            # crowded space: take the next free slot after a random start
+            start = random.randrange(len(self._used))
+            slot = self._used.find(0, start)
+            if slot == -1:
+                slot = self._used.find(0)
+
+        self._used[slot] = 1
+        self._free -= 1
+        return slot + CRN_MIN
+
+    def reserve_block(self, count):
+        """
+        Reserve `count` consecutive unused CRNs for batch course creation and
+        return them as a list. Raises ValueError if no such run is free.
+        """
+        if self._used is None:
+            self._seed()
+        if count <= 0:
+            return []
+        start = self._used.find(bytes(count))
+        if start == -1:
+            raise ValueError(f"No block of {count} consecutive free CRNs left ({self._free} free in total).")
+        self._used[start:start + count] = b"\x01" * count
+        self._free -= count
+        return list(range(start + CRN_MIN, start + CRN_MIN + count))
+
+
+_allocator = None
+
+
+def get_crn_allocator():
+    """Return the process-wide CrnAllocator for Database/."""
+    global _allocator
+    if _allocator is None:
+        _allocator = CrnAllocator()
+    return _allocator
@@ -0,0 +1,196 @@
+import os
+from pathlib import Path
+
+DEFAULT_COURSES_DIR = Path(__file__).parent / "Database" / "courses"
+STAMP_PREFIX = "# dir_mtime_ns="
+# rewrite the index once appended lines outnumber its entries by this many
+COMPACT_SLACK = 256
+
+
+def read_crn(course_file):
+    """Return the `crn:` value of a course file, reading only up to that line."""
+    with open(course_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.lower().startswith("crn:"):
+                return line.split(":", 1)[1].strip()
+    return None
+
+
+class CrnIndex:
+    """
+    Persistent CRN -> course file index for Database/courses.
+
+    The index lives next to the courses folder (Database/crn_index.csv by
+    default) as `crn,file name` rows plus the folder mtime it was built
+    against. It is loaded once per process; when the folder's mtime no longer
+    matches (a course file was added, removed or renamed) it is rebuilt by
+    reading only the `crn:` line of each file. Course.save_to_txt appends to
+    it, so a lookup normally opens nothing but the one course file.
+    """
+
+    def __init__(self, courses_dir=None, index_path=None):
+        self.courses_dir = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+        if index_path is None:
+            index_path = self.courses_dir.parent / "crn_index.csv"
+        self.index_path = Path(index_path)
+        self._files = None
+        self._dir_stamp = None
+        # lines in the index file, counting superseded ones
+        self._lines = 0
+
+    def _current_dir_stamp(self):
+        return os.stat(self.courses_dir).st_mtime_ns
+
+    def _read_index(self):
+        files = {}
+        dir_stamp = None
+        lines = 0
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    lines += 1
+                    line = line.rstrip("\n")
+                    if line.startswith(STAMP_PREFIX):
+                        dir_stamp = int(line[len(STAMP_PREFIX):])
+                    elif "," in line:
+                        crn, name = line.split(",", 1)
+                        files[crn] = name
+        return files, dir_stamp, lines
+
+    def _load(self):
+        files, dir_stamp, lines = self._read_index()
+        self._files = files
+        self._dir_stamp = dir_stamp
+        self._lines = lines
+        if dir_stamp is not None and self._needs_compaction():
+            self._write()
+
+    def _needs_compaction(self):
+        return self._lines > 2 * len(self._files) + COMPACT_SLACK
+
+    def _write(self):
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{STAMP_PREFIX}{self._dir_stamp}\n")
+            for crn, name in self._files.items():
+                f.write(f"{crn},{name}\n")
+        os.replace(tmp_path, self.index_path)
+        self._lines = len(self._files) + 1
+
+    def rebuild(self):
+        files = {}
+        for course_file in sorted(self.courses_dir.glob("*.txt")):
+            try:
+                crn = read_crn(course_file)
+            except (OSError, UnicodeDecodeError):
+                continue
+            if crn:
+                files.setdefault(crn, course_file.name)
+
+        self._files = files
+        self._dir_stamp = self._current_dir_stamp()
+        self._write()
+
+    def _ensure_current(self):
+        if self._files is None:
+            self._load()
+        if self._dir_stamp != self._current_dir_stamp():
+            self.rebuild()
+
+    def lookup(self, crn):
+        """Return the path of the course file for `crn`, or None."""
+        if not self.courses_dir.is_dir():
+            return None
+        crn = str(crn).strip()
+        self._ensure_current()
+
+        name = self._files.get(crn)
+        if name is not None:
+            course_file = self.courses_dir / name
+            try:
+                if read_crn(course_file) == crn:
+                    return course_file
+            except (OSError, UnicodeDecodeError):
+                pass
+            # the file was edited in place since it was indexed
+            self.rebuild()
+            name = self._files.get(crn)
+            if name is not None:
+                return self.courses_dir / name
+        return None
+
+    def crns(self, persist=True):
+        """
+        Return every CRN found in the courses folder. With persist=False the
+        index file is only read, never rewritten: a stale index is bypassed
+        by reading the `crn:` line of each file.
+        """
+        if not self.courses_dir.is_dir():
+            return []
+        if persist:
+            self._ensure_current()
+            return list(self._files)
+
+        dir_stamp = self._current_dir_stamp()
+        if self._files is not None and self._dir_stamp == dir_stamp:
+            return list(self._files)
+        files, index_stamp, _ = self._read_index()
+        if index_stamp == dir_stamp:
+            return list(files)
+        crns = []
+        for course_file in self.courses_dir.glob("*.txt"):
+            try:
+                crn = read_crn(course_file)
+            except (OSError, UnicodeDecodeError):
+                continue
+            if crn:
+                crns.append(crn)
+        return crns
+
+    def _all_files_indexed(self):
+        names = {n for n in os.listdir(self.courses_dir) if n.endswith(".txt")}
+        return names <= set(self._files.values())
+
+    def record(self, crn, course_file):
+        """
+        Point `crn` at `course_file` after Course.save_to_txt or the course
+        journal wrote it. When `crn` already pointed there, the file was
+        replaced under its own name: the folder holds the same files, so
+        only its new mtime is noted, without listing the folder.
+        """
+        crn = str(crn).strip()
+        name = Path(course_file).name
+        if self._files is None:
+            self._load()
+        unchanged = self._files.get(crn) == name
+        self._files[crn] = name
+
+        lines = [] if unchanged else [f"{crn},{name}\n"]
+        dir_stamp = self._current_dir_stamp()
+        if dir_stamp != self._dir_stamp:
+            # a new file moved the folder mtime; keep the index current as long
+            # as every course file in the folder is accounted for
+            if unchanged or self._all_files_indexed():
+                self._dir_stamp = dir_stamp
+                lines.append(f"{STAMP_PREFIX}{dir_stamp}\n")
+        if not lines:
+            return
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+        self._lines += len(lines)
+        if self._needs_compaction():
+            self._write()
+
+
+_indexes = {}
+
+
+def get_crn_index(courses_dir=None):
+    """Return the shared CrnIndex for `courses_dir` (default Database/courses)."""
+    path = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+    key = os.path.abspath(path)
+    index = _indexes.get(key)
+    if index is None:
+        index = CrnIndex(path)
+        _indexes[key] = index
+    return index
@@ -1,4 +1,3 @@
-import subprocess
 import sys
 from pathlib import Path
 
@@ -12,6 +11,7 @@ sys.path.insert(0, str(student_folder))
 from Student_files.Student import Student
 from Student_files.load_student import load_student
 from Student_files.student_driver import student_driver
+from Signup import sign_up
 
 def main_menu():
     while True:
@@ -23,7 +23,7 @@ def main_menu():
         choice = input("Enter choice: ")
 
         if choice == "1":
-            run_java_signup()
+            sign_up()
         elif choice == "2":
             login()
         elif choice == "3":
@@ -32,9 +32,6 @@ def main_menu():
         else:
             print("Invalid choice. Try again.")
 
-def run_java_signup():
-    subprocess.run(["java", "SignUp"])
-
 def login():
     name = input("Enter your name: ").strip()
     user_id = input("Enter your ID: ").strip()
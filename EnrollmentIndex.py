@@ -0,0 +1,132 @@
+import os
+from pathlib import Path
+
+from MeetingTime import meeting_mask
+
+DEFAULT_COURSES_DIR = Path(__file__).parent / "Database" / "courses"
+# build the index rather than queue more roster changes than this
+QUEUE_LIMIT = 10000
+
+
+class EnrollmentIndex:
+    """
+    Student ID -> CRNs of the courses the student is enrolled in.
+
+    Built from the `students:` sections of Database/courses on first use,
+    then kept current in memory: every Course roster reports adds and drops
+    here, which covers schedule add/remove, create_schedule, the professor
+    drop and rosters set on a Course. A student's schedule is then a lookup
+    of their own k CRNs instead of a scan over every course file. Changes
+    reported before the first lookup are queued and replayed on top of the
+    course files, so creating a Course never builds the index.
+    """
+
+    def __init__(self, courses_dir=None):
+        self.courses_dir = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+        self._crns_by_student = None
+        # (student, crn, enrolled) reported before the index was built
+        self._queued = []
+
+    def rebuild(self):
+        # imported here because CourseCatalog imports Course, which imports this module
+        from CourseCatalog import parse_course_file
+
+        crns_by_student = {}
+        if self.courses_dir.is_dir():
+            for course_file in sorted(self.courses_dir.glob("*.txt")):
+                try:
+                    parsed = parse_course_file(course_file)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                if parsed is None:
+                    continue
+                for student in parsed["students"]:
+                    crns_by_student.setdefault(student, {})[parsed["crn"]] = None
+        self._crns_by_student = crns_by_student
+
+        queued, self._queued = self._queued, []
+        for student_id, crn, enrolled in queued:
+            if enrolled:
+                self.enroll(student_id, crn)
+            else:
+                self.drop(student_id, crn)
+
+    def _ensure_built(self):
+        if self._crns_by_student is None:
+            self.rebuild()
+
+    def crns_for(self, student_id):
+        """Return the CRNs `student_id` is enrolled in, in enrollment order."""
+        self._ensure_built()
+        return list(self._crns_by_student.get(str(student_id).strip(), ()))
+
+    def courses_for(self, student_id):
+        """Return the Course objects `student_id` is enrolled in."""
+        # imported here because Course imports this module
+        from Admin_files.Course import Course
+
+        courses = []
+        for crn in self.crns_for(student_id):
+            course = Course.courses_by_crn.get(crn)
+            if course is not None:
+                courses.append(course)
+        return courses
+
+    def time_conflicts(self, course, old_time=None):
+        """
+        Return {student: [courses that now overlap `course`]} for the
+        students on its roster. With the `old_time` the course had before a
+        change, overlaps that already existed then are left out. Only those
+        students' own courses are checked, so the cost follows the roster
+        size, not the student body.
+        """
+        mask = course.meeting_mask
+        old_mask = meeting_mask(old_time) if old_time is not None else 0
+        conflicts = {}
+        if not mask:
+            return conflicts
+        crn = str(course.CRN)
+        for student in course.class_list:
+            clashes = [
+                other for other in self.courses_for(student)
+                if str(other.CRN) != crn and other.meeting_mask & mask and not other.meeting_mask & old_mask
+            ]
+            if clashes:
+                conflicts[student] = clashes
+        return conflicts
+
+    def _queue(self, student_id, crn, enrolled):
+        self._queued.append((student_id, crn, enrolled))
+        if len(self._queued) > QUEUE_LIMIT:
+            self.rebuild()
+
+    def enroll(self, student_id, crn):
+        if self._crns_by_student is None:
+            self._queue(student_id, crn, True)
+            return
+        self._crns_by_student.setdefault(str(student_id).strip(), {})[str(crn)] = None
+
+    def drop(self, student_id, crn):
+        if self._crns_by_student is None:
+            self._queue(student_id, crn, False)
+            return
+        student_id = str(student_id).strip()
+        crns = self._crns_by_student.get(student_id)
+        if crns is not None:
+            crns.pop(str(crn), None)
+            if not crns:
+                del self._crns_by_student[student_id]
+
+
+_indexes = {}
+
+
+def get_enrollment_index(courses_dir=None):
+    """Return the shared EnrollmentIndex for `courses_dir` (default Database/courses)."""
+    path = Path(courses_dir) if courses_dir is not None else DEFAULT_COURSES_DIR
+    key = os.path.abspath(path)
+    index = _indexes.get(key)
+    if index is None:
+        index = EnrollmentIndex(path)
+        _indexes[key] = index
+    return index
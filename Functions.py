@@ -1,11 +1,18 @@
 from Admin_files.Course import Course
 from pathlib import Path
+import csv
 import sys
 
 student_folder = Path(__file__).parent / "Student files"
 sys.path.insert(0, str(student_folder))
 
 from Student_files.load_student import load_student
+from AccountStore import get_account_store
+from CourseCatalog import get_course_catalog
+from CourseJournal import get_course_journal
+from EnrollmentIndex import get_enrollment_index
+from CoRequisites import corequisite_groups, corequisite_key, load_overrides
+from ScheduleSolver import best_schedule, ranked_schedules, DEFAULT_TIME_BUDGET
 
 def clear_screen():
     for _ in range(3):
@@ -63,102 +70,59 @@ def manage_fiscal_clearance():
     update_student_in_database(student)
     print("Changes saved successfully!")
 
-def update_student_in_database(student):
-    base_folder = Path(__file__).parent
-    database = base_folder / "Database" / "Accounts.txt"
-    
-    with open(database, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-    
-    with open(database, "w", encoding="utf-8") as f:
-        for line in lines:
-            if line.strip():
-                parts = [p.strip().strip('"') for p in line.split(",")]
-                if parts[0] == "STUDENT" and parts[1] == student.student_num:
-                    f.write(f"STUDENT,{student.student_num},{student.full_name},{student.classification},{student.major},{'true' if student.fiscal_clearance else 'false'}\n")
-                else:
-                    f.write(line)
-            else:
-                f.write(line)
+def update_student_in_database(student, database=None):
+    # AccountStore patches the clearance field in place when nothing else changed
+    get_account_store(database).update_student(
+        student.student_num,
+        student.full_name,
+        student.classification,
+        student.major,
+        student.fiscal_clearance,
+    )
 
 
-def create_schedule(student_900):
-    import os
-    
-    base_folder = Path(__file__).parent
-    courses_folder = base_folder / "Database" / "courses"
-    accounts_file = base_folder / "Database" / "Accounts.txt"
+CLEARANCE_VALUES = {
+    "true": True, "t": True, "yes": True, "y": True, "1": True, "cleared": True,
+    "false": False, "f": False, "no": False, "n": False, "0": False, "uncleared": False,
+}
 
-    # Build a quick map of professor_id -> professor_name from Accounts.txt
-    professor_map = {}
-    if accounts_file.exists():
-        try:
-            with open(accounts_file, 'r', encoding='utf-8') as af:
-                for line in af:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = [p.strip().strip('"') for p in line.split(',')]
-                    if parts and parts[0].upper() in ("PROF", "PROFESSOR") and len(parts) > 2:
-                        pid = parts[1]
-                        pname = parts[2]
-                        professor_map[pid] = pname
-        except Exception:
-            # if reading accounts fails, continue without professor names
-            professor_map = {}
-    
-    available_courses = []
-    
-    # Read all course files from the courses folder
-    if courses_folder.exists():
-        for course_file in os.listdir(courses_folder):
-            if course_file.endswith('.txt'):
-                course_path = courses_folder / course_file
-                
-                # Read course details from file
-                with open(course_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                    crn = None
-                    course_name = None
-                    time = "TBA"
-                    credits = 3
-                    students = []
-                    professor_id = None
-                    professor_name = None
-                    
-                    # Parse the file
-                    reading_students = False
-                    for line in lines:
-                        line = line.strip()
-                        
-                        if line.startswith("crn:"):
-                            crn = line.split(":", 1)[1].strip()
-                        elif line.startswith("course_name:"):
-                            course_name = line.split(":", 1)[1].strip()
-                        elif line.startswith("time:"):
-                            time = line.split(":", 1)[1].strip()
-                        elif line.startswith("credits:"):
-                            credits_str = line.split(":", 1)[1].strip()
-                            credits = int(credits_str) if credits_str.isdigit() else 3
-                        elif line.startswith("professor:"):
-                            prof_val = line.split(":", 1)[1].strip()
-                            if prof_val and prof_val.lower() != 'none':
-                                professor_id = prof_val
-                                professor_name = professor_map.get(prof_val)
-                        elif line.startswith("students:"):
-                            reading_students = True
-                        elif reading_students and line and line != "professor: none":
-                            students.append(line)
-                    
-                    # Create Course object if we have valid data
-                    if crn and course_name:
-                        course = Course(course_name, time, credits, students)
-                        course.CRN = int(crn)
-                        # attach professor metadata to course instance for display
-                        course.professor_id = professor_id
-                        course.professor_name = professor_name
-                        available_courses.append(course)
+def import_fiscal_clearances(bursar_file, database=None):
+    """
+    Apply a bursar file of `900number,status` rows to Accounts.txt.
+
+    The file is streamed once; a header row and blank lines are skipped and a
+    later row for the same student overrides an earlier one. All changes are
+    committed with a single atomic rewrite. Returns a dict with the counts of
+    changed, unchanged, unknown and invalid entries.
+    """
+    statuses = {}
+    invalid = 0
+    with open(bursar_file, "r", newline="", encoding="utf-8") as f:
+        for line_num, row in enumerate(csv.reader(f), 1):
+            if not row or not "".join(row).strip():
+                continue
+            student_num = row[0].strip()
+            status = row[1].strip().lower() if len(row) > 1 else ""
+            if status not in CLEARANCE_VALUES or not student_num.isdigit():
+                if line_num != 1:
+                    invalid += 1
+                continue
+            statuses[student_num] = CLEARANCE_VALUES[status]
+
+    changed, unchanged, unknown = get_account_store(database).apply_clearances(statuses)
+    return {
+        "changed": len(changed),
+        "unchanged": len(unchanged),
+        "unknown": len(unknown),
+        "invalid": invalid,
+    }
+
+
+def create_schedule(student_900, catalog=None):
+    # Courses come from the shared catalog, which only re-reads changed files
+    if catalog is None:
+        catalog = get_course_catalog()
+    available_courses = catalog.courses()
     
     if not available_courses:
         print("No courses available in the database.")
@@ -166,29 +130,48 @@ def create_schedule(student_900):
     
     # AUTOMATICALLY create initial schedule
     print(f"\n=== Auto-generating Schedule for Student {student_900} ===")
-    selected_courses = auto_select_courses(available_courses, 19)
+    # best schedule first; 'next' pages through the runners-up
+    schedules = ranked_schedules(available_courses, 19)
+    selected_courses = next(schedules, [])
     
     # Add student to all selected courses
     for course in selected_courses:
         if student_900 not in course.class_list:
-            course.class_list.append(student_900)
-    
-    # Display the auto-generated schedule
-    print("\n===== AUTO-GENERATED SCHEDULE =====")
-    total_credits = sum(c.credits for c in selected_courses)
-    for course in selected_courses:
-        prof_display = f"Prof: {course.professor_name}" if getattr(course, 'professor_name', None) else (f"Prof ID: {course.professor_id}" if getattr(course, 'professor_id', None) else "Prof: none")
-        print(f"- {course.course_name} ({course.credits} credits) - {course.time} [CRN: {course.CRN}] - {prof_display}")
-    print(f"\nTotal Credits: {total_credits}/19")
+            course.class_list.add(student_900)
     
-    # Ask if they want to edit
-    edit_choice = input("\nWould you like to edit this schedule? (y/n): ").strip().lower()
+    while True:
+        # Display the auto-generated schedule
+        print("\n===== AUTO-GENERATED SCHEDULE =====")
+        total_credits = sum(c.credits for c in selected_courses)
+        for course in selected_courses:
+            prof_display = f"Prof: {course.professor_name}" if getattr(course, 'professor_name', None) else (f"Prof ID: {course.professor_id}" if getattr(course, 'professor_id', None) else "Prof: none")
+            print(f"- {course.course_name} ({course.credits} credits) - {course.time} [CRN: {course.CRN}] - {prof_display}")
+        print(f"\nTotal Credits: {total_credits}/19")
+        
+        # Ask if they want to edit
+        edit_choice = input("\nWould you like to edit this schedule? (y/n, or 'next' for the next best option): ").strip().lower()
+        if edit_choice != 'next':
+            break
+        
+        alternative = next(schedules, None)
+        if alternative is None:
+            print("No other schedules fit.")
+            continue
+        for course in selected_courses:
+            course.class_list.discard(student_900)
+        selected_courses = alternative
+        for course in selected_courses:
+            if student_900 not in course.class_list:
+                course.class_list.add(student_900)
     
     if edit_choice != 'y':
         print("\nSchedule accepted!")
         return selected_courses
     
     # Now allow editing
+    conflicts = catalog.conflict_matrix()
+    overrides = load_overrides()
+    corequisites = corequisite_groups((c.course_name for c in available_courses), overrides)
     print("\n=== Edit Schedule ===")
     print("\nAvailable courses:")
     for i, course in enumerate(available_courses, 1):
@@ -213,7 +196,7 @@ def create_schedule(student_900):
                         selected_courses.remove(course_to_remove)
                         total_credits -= course_to_remove.credits
                         if student_900 in course_to_remove.class_list:
-                            course_to_remove.class_list.remove(student_900)
+                            course_to_remove.class_list.discard(student_900)
                         print(f"✓ Removed: {course_to_remove.course_name}")
                     else:
                         print("That course is not in the schedule.")
@@ -225,14 +208,21 @@ def create_schedule(student_900):
             if 0 <= course_index < len(available_courses):
                 selected_course = available_courses[course_index]
                 
+                clash = next((c for c in selected_courses if conflicts.conflicts(c.CRN, selected_course.CRN)), None)
                 if selected_course in selected_courses:
                     print("That course is already in the schedule.")
+                elif clash is not None:
+                    print(f"✗ Cannot add {selected_course.course_name} - meets at the same time as {clash.course_name}")
                 elif total_credits + selected_course.credits <= 19:
                     selected_courses.append(selected_course)
                     total_credits += selected_course.credits
                     if student_900 not in selected_course.class_list:
-                        selected_course.class_list.append(student_900)
+                        selected_course.class_list.add(student_900)
                     print(f"✓ Added: {selected_course.course_name} ({selected_course.credits} credits)")
+                    chosen_names = {c.course_name for c in selected_courses}
+                    missing = [n for n in corequisites.get(corequisite_key(selected_course.course_name, overrides), ()) if n not in chosen_names]
+                    if missing:
+                        print(f"  Also needs its co-requisite: {', '.join(missing)}")
                 else:
                     print(f"✗ Cannot add {selected_course.course_name} - would exceed 19 credits")
             else:
@@ -251,19 +241,51 @@ def create_schedule(student_900):
     
     return selected_courses
 
-def auto_select_courses(available_courses, max_credits=19):
-    
-    sorted_courses = sorted(available_courses, key=lambda c: c.credits, reverse=True)
-    
-    selected = []
-    total_credits = 0
-    
-    for course in sorted_courses:
-        if total_credits + course.credits <= max_credits:
-            selected.append(course)
-            total_credits += course.credits
-            
-        if total_credits == max_credits:
-            break
-    
-    return selected
\ No newline at end of file
+def save_student_schedule(student_900, courses, courses_dir=None):
+    """
+    Persist a schedule built by create_schedule. The student is written onto
+    the roster of each course file (through the course journal) and dropped
+    from every other course they were enrolled in; the course rosters are
+    the only record of a student's schedule.
+    """
+    crns = [str(course.CRN) for course in courses]
+    for crn in get_enrollment_index(courses_dir).crns_for(student_900):
+        if crn not in crns:
+            drop_student_from_course(student_900, crn, courses_dir)
+    journal = get_course_journal(courses_dir)
+    for crn in crns:
+        journal.apply(crn, "add_students", student_ids=[student_900])
+
+
+def add_student_to_course(student_900, crn, courses_dir=None):
+    """
+    Enroll a student in an existing course: the roster in memory and the
+    course file. Returns the Course, or None if no course has that CRN.
+    """
+    course = get_course_catalog(courses_dir).get(crn)
+    if course is None:
+        return None
+    course.class_list.add(student_900)
+    get_course_journal(courses_dir).apply(course.CRN, "add_students", student_ids=[student_900])
+    return course
+
+
+def drop_student_from_course(student_900, crn, courses_dir=None):
+    """
+    Undo add_student_to_course. Returns the Course, or None if no course has
+    that CRN any more, in which case only the enrollment index changes.
+    """
+    course = get_course_catalog(courses_dir).get(crn)
+    if course is not None:
+        course.class_list.discard(student_900)
+        get_course_journal(courses_dir).apply(course.CRN, "drop_student", student_id=student_900)
+    else:
+        get_enrollment_index(courses_dir).drop(student_900, crn)
+    return course
+
+def auto_select_courses(available_courses, max_credits=19, preference=None, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Most credits (plus optional preference weight) up to `max_credits` with
+    no overlapping meeting times; see ScheduleSolver.best_schedule.
+    """
+    return best_schedule(available_courses, max_credits, preference, time_budget)
@@ -0,0 +1,109 @@
+import re
+
+SLOT_MINUTES = 5
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+DAY_BITS = {"M": 0, "T": 1, "W": 2, "R": 3, "F": 4, "S": 5, "U": 6}
+# a time with no days listed is assumed to meet every weekday
+DEFAULT_DAYS = "MTWRF"
+NO_MEETING = {"", "TBA", "ONLINE", "ARR"}
+
+TIME_PATTERN = re.compile(
+    r"^\s*(?P<days>[A-Za-z]*)\s*"
+    r"(?P<start>\d{1,2})(?::(?P<start_min>\d{2}))?\s*(?P<start_mer>[AaPp]\.?[Mm]\.?)?\s*"
+    r"[-–—]\s*"
+    r"(?P<end>\d{1,2})(?::(?P<end_min>\d{2}))?\s*(?P<end_mer>[AaPp]\.?[Mm]\.?)?\s*$"
+)
+# longest tokens first: "THU" is Thursday, not Thursday and Sunday
+DAY_ALIASES = {
+    "MON": "M", "TUE": "T", "WED": "W", "THU": "R", "FRI": "F", "SAT": "S", "SUN": "U",
+    "TH": "R", "TU": "T", "SU": "U",
+}
+DAYS_PATTERN = re.compile("|".join(sorted(DAY_ALIASES, key=len, reverse=True)) + "|[MTWRFSU]")
+
+_masks = {}
+# time strings meeting_mask could not make sense of
+unparseable_times = set()
+
+
+def _parse_days(days):
+    days = days.upper()
+    if not days:
+        days = DEFAULT_DAYS
+    codes = DAYS_PATTERN.findall(days)
+    if "".join(codes) != days:
+        raise ValueError(f"Unknown day letters in {days!r}")
+    return {DAY_ALIASES.get(code, code) for code in codes}
+
+
+def _to_minutes(hour, minute, meridiem):
+    if meridiem is None:
+        # no AM/PM: classes run from 7AM to 6PM
+        pm = hour == 12 or hour < 7
+    else:
+        pm = meridiem[0].upper() == "P"
+    if hour == 12:
+        # "11-12AM" is written for a class ending at noon, not midnight
+        return 12 * 60 + minute
+    return (hour + (12 if pm else 0)) * 60 + minute
+
+
+def parse_meeting_time(text):
+    """
+    Parse a course `time:` string such as "MWF 10-11AM", "TR 12:30–1:45PM",
+    "TTH 10:50-12:05" or "5:30–6:45PM" into a weekly bitmask.
+
+    Bit day * SLOTS_PER_DAY + slot is set for every 5-minute slot the course
+    meets in (days run Monday=0 .. Sunday=6). A start time without AM/PM takes
+    the end time's, unless that would put it after the end. Raises ValueError
+    if the string cannot be read.
+    """
+    if text is None or text.strip().upper() in NO_MEETING:
+        return 0
+    match = TIME_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Unrecognised meeting time: {text!r}")
+
+    days = _parse_days(match["days"])
+    end_hour, end_min = int(match["end"]), int(match["end_min"] or 0)
+    start_hour, start_min = int(match["start"]), int(match["start_min"] or 0)
+    if not (1 <= start_hour <= 12 and 1 <= end_hour <= 12 and start_min < 60 and end_min < 60):
+        raise ValueError(f"Meeting time out of range: {text!r}")
+
+    end = _to_minutes(end_hour, end_min, match["end_mer"])
+    start_mer = match["start_mer"] or match["end_mer"]
+    start = _to_minutes(start_hour, start_min, start_mer)
+    if start >= end and match["start_mer"] is None and match["end_mer"] is not None:
+        other = "AM" if match["end_mer"][0].upper() == "P" else "PM"
+        start = _to_minutes(start_hour, start_min, other)
+    if start >= end:
+        raise ValueError(f"Meeting time ends before it starts: {text!r}")
+
+    first_slot = start // SLOT_MINUTES
+    slots = -(-end // SLOT_MINUTES) - first_slot
+    day_mask = ((1 << slots) - 1) << first_slot
+    mask = 0
+    for day in days:
+        mask |= day_mask << (DAY_BITS[day] * SLOTS_PER_DAY)
+    return mask
+
+
+def meeting_mask(text):
+    """
+    Memoized parse_meeting_time. An unparseable string is reported once,
+    added to `unparseable_times` and treated as having no fixed meeting
+    (mask 0), so it clashes with nothing; `check-times` lists them all.
+    """
+    mask = _masks.get(text)
+    if mask is None:
+        try:
+            mask = parse_meeting_time(text)
+        except ValueError as e:
+            print(f"Warning: {e}; treating it as no fixed meeting time.")
+            unparseable_times.add(text)
+            mask = 0
+        _masks[text] = mask
+    return mask
+
+
+def times_conflict(mask_a, mask_b):
+    return bool(mask_a & mask_b)
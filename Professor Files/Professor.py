@@ -1,3 +1,12 @@
+import sys
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from CourseJournal import get_course_journal
+
+
 class Professor:
     def __init__(self, professor_id, full_name, department, assigned_courses=None):
         self.professor_id = professor_id
@@ -28,13 +37,10 @@ class Professor:
         Returns True if assignment was made (and persisted when requested),
         False if the CRN was already assigned or not found when persisting.
         """
-        from pathlib import Path
-        import shutil
-
         # allow callers to pass persist flag and courses_dir as optional args
         # keep signature backwards-compatible by accepting only crn in positional
         persist = True
-        courses_dir = "Database/courses"
+        journal = get_course_journal()
 
         crn_str = str(crn).strip()
 
@@ -43,71 +49,18 @@ class Professor:
             print(f"Course {crn} is already assigned to Professor {self.full_name}.")
             return False
 
-        # If persistence is requested, try to find and update the course file
+        # If persistence is requested, journal the professor: line change on the
+        # course file (found through the CRN index)
         if persist:
-            courses_path = Path(courses_dir)
+            courses_path = journal.courses_dir
             if not courses_path.exists() or not courses_path.is_dir():
                 raise FileNotFoundError(f"Courses directory not found: {courses_path}")
 
-            found = False
-            for course_file in courses_path.glob("*.txt"):
-                try:
-                    text = course_file.read_text(encoding="utf-8").splitlines()
-                except Exception:
-                    # skip files we can't read
-                    continue
-
-                file_crn = None
-                crn_index = None
-                for i, line in enumerate(text):
-                    if line.lower().startswith("crn:"):
-                        file_crn = line.split(":", 1)[1].strip()
-                        crn_index = i
-                        break
-
-                if file_crn != crn_str:
-                    continue
-
-                # Found the file for this CRN. Update professor: line.
-                new_prof_line = f"professor: {self.professor_id}"
-
-                prof_index = None
-                for j, line in enumerate(text):
-                    if line.lower().startswith("professor:"):
-                        prof_index = j
-                        break
-
-            
-                # Create a simple .bak next to the course file (e.g. "MAT 103.bak")
-                backup_path = course_file.with_suffix(".bak")
-                shutil.copy2(course_file, backup_path)
-
-                if prof_index is not None:
-                    text[prof_index] = new_prof_line
-                else:
-                    
-                    insert_at = None
-                    for j, line in enumerate(text):
-                        if line.lower().startswith("credits:"):
-                            insert_at = j + 1
-                            break
-                    if insert_at is None and crn_index is not None:
-                        insert_at = crn_index + 1
-                    if insert_at is None:
-                        # fallback to appending at end
-                        text.append(new_prof_line)
-                    else:
-                        text.insert(insert_at, new_prof_line)
-
-                course_file.write_text("\n".join(text).rstrip() + "\n", encoding="utf-8")
-                found = True
-                break
-
+            found = journal.apply(crn_str, "assign_professor", professor_id=self.professor_id)
             if not found:
-                print(f"CRN {crn} not found in {courses_dir}; no file updated.")
+                print(f"CRN {crn} not found in {courses_path}; no file updated.")
                 return False
 
-    
         self.assigned_courses.append(crn_str)
         print(f"Course {crn} assigned to Professor {self.full_name}.")
         return True
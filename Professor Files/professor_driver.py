@@ -9,6 +9,8 @@ sys.path.insert(0, str(admin_folder))
 
 from Course import Course
 from Functions import clear_screen
+from CourseJournal import save_course_change
+from EnrollmentIndex import get_enrollment_index
 
 def professor_driver(professor):
     while True:
@@ -26,9 +28,9 @@ def professor_driver(professor):
             print(f"\n{professor.full_name}'s Assigned Courses:")
             if professor.assigned_courses:
                 for crn in professor.assigned_courses:
-                    # Look up course details from Course registry
-                    if crn in Course.courses_by_crn:
-                        course = Course.courses_by_crn[crn]
+                    # Look up course details from Course registry (loaded on demand)
+                    course = Course.courses_by_crn.get(crn)
+                    if course is not None:
                         print(f"\nCRN: {course.CRN}")
                         print(f"Course Name: {course.course_name}")
                         print(f"Time: {course.time}")
@@ -49,8 +51,8 @@ def professor_driver(professor):
                 print(f"CRN {crn} is not assigned to you.")
                 continue
             
-            if crn in Course.courses_by_crn:
-                course = Course.courses_by_crn[crn]
+            course = Course.courses_by_crn.get(crn)
+            if course is not None:
                 print(f"\nCourse: {course.course_name}")
                 print(f"CRN: {course.CRN}")
                 print(f"Time: {course.time}")
@@ -75,18 +77,26 @@ def professor_driver(professor):
                 print(f"CRN {crn} is not assigned to you.")
                 continue
             
-            if crn in Course.courses_by_crn:
-                course = Course.courses_by_crn[crn]
+            course = Course.courses_by_crn.get(crn)
+            if course is not None:
                 print(f"\nCourse: {course.course_name}")
                 print(f"Current Time: {course.time}")
                 
                 new_time = input("Enter new time (e.g., MWF 10-11AM): ").strip()
+                old_time = course.time
                 course.change_time(new_time)
                 print(f"Course time updated to: {new_time}")
                 
                 # Save changes to course file
-                course.save_to_txt()
+                save_course_change(course, "change_time", time=new_time)
                 print("Changes saved.")
+                
+                # students the new time gives an overlap they did not have before
+                conflicts = get_enrollment_index().time_conflicts(course, old_time)
+                if conflicts:
+                    print(f"\nWarning: {len(conflicts)} enrolled student(s) now have a time conflict:")
+                    for student, clashes in conflicts.items():
+                        print(f"- {student}: " + ", ".join(f"{c.course_name} ({c.time}) [CRN: {c.CRN}]" for c in clashes))
             else:
                 print(f"Course with CRN {crn} not found in system.")
 
@@ -102,8 +112,8 @@ def professor_driver(professor):
                 print(f"CRN {crn} is not assigned to you.")
                 continue
             
-            if crn in Course.courses_by_crn:
-                course = Course.courses_by_crn[crn]
+            course = Course.courses_by_crn.get(crn)
+            if course is not None:
                 print(f"\nCourse: {course.course_name}")
                 print(f"Enrolled Students: {len(course.class_list)}")
                 
@@ -116,11 +126,11 @@ def professor_driver(professor):
                 student_id = input("\nEnter student ID to drop: ").strip()
                 
                 if student_id in course.class_list:
-                    course.class_list.remove(student_id)
+                    course.class_list.discard(student_id)
                     print(f"Student {student_id} dropped from {course.course_name}.")
                     
                     # Save changes to course file
-                    course.save_to_txt()
+                    save_course_change(course, "drop_student", student_id=student_id)
                     print("Changes saved.")
                 else:
                     print(f"Student {student_id} not found in this course.")
@@ -107,6 +107,19 @@ class TestProfessorDriver:
         assert "Course time updated to: MWF 1-2PM" in output
         assert self.course1.time == "MWF 1-2PM"
 
+    @patch('builtins.input', side_effect=['3', '12345', 'TR 2-3PM', '5'])
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_change_time_reports_conflicts(self, mock_stdout, mock_input):
+        """Test that students left with overlapping courses are listed"""
+        index = MagicMock()
+        index.time_conflicts.return_value = {"900111111": [self.course2]}
+        with patch('professor_driver.get_enrollment_index', return_value=index):
+            professor_driver(self.professor)
+        output = mock_stdout.getvalue()
+        index.time_conflicts.assert_called_once_with(self.course1, "MWF 10-11AM")
+        assert "1 enrolled student(s) now have a time conflict" in output
+        assert "- 900111111: CPSC 201 (TR 2-3:30PM) [CRN: 67890]" in output
+
     @patch('builtins.input', side_effect=['3', '99999', '5'])
     @patch('sys.stdout', new_callable=StringIO)
     def test_change_time_not_assigned_course(self, mock_stdout, mock_input):
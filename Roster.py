@@ -0,0 +1,76 @@
+class Roster:
+    """
+    Insertion-ordered set of student IDs for a course's class_list.
+
+    Backed by a dict, so membership, add and discard are O(1) while iteration
+    keeps enrollment order. It supports the list operations the code already
+    uses on class_list (append, remove, count, len, indexing, ";".join) and
+    compares equal to a list or tuple with the same IDs in the same order.
+    Adding an ID that is already enrolled does nothing.
+
+    `on_change(student, enrolled)` is called after every add (enrolled=True)
+    and discard (enrolled=False); Course uses it to mark itself dirty and to
+    keep the enrollment index current.
+    """
+
+    __hash__ = None
+
+    def __init__(self, students=(), on_change=None):
+        self._students = dict.fromkeys(students)
+        self.on_change = on_change
+
+    def _changed(self, student, enrolled):
+        if self.on_change is not None:
+            self.on_change(student, enrolled)
+
+    def __iter__(self):
+        return iter(self._students)
+
+    def __len__(self):
+        return len(self._students)
+
+    def __contains__(self, student):
+        return student in self._students
+
+    def __getitem__(self, index):
+        return list(self._students)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, Roster):
+            return list(self._students) == list(other._students)
+        if isinstance(other, (list, tuple)):
+            return list(self._students) == list(other)
+        if isinstance(other, (set, frozenset)):
+            return self._students.keys() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Roster({list(self._students)!r})"
+
+    def add(self, student):
+        if student not in self._students:
+            self._students[student] = None
+            self._changed(student, True)
+
+    append = add
+
+    def extend(self, students):
+        for student in students:
+            self.add(student)
+
+    def discard(self, student):
+        if student in self._students:
+            del self._students[student]
+            self._changed(student, False)
+
+    def remove(self, student):
+        """Like list.remove: raises ValueError if `student` is not enrolled."""
+        if student not in self._students:
+            raise ValueError(f"{student} is not in the roster")
+        self.discard(student)
+
+    def count(self, student):
+        return 1 if student in self._students else 0
+
+    def copy(self):
+        return list(self._students)
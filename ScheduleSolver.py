@@ -0,0 +1,257 @@
+import heapq
+import itertools
+import time
+
+from CoRequisites import CourseBundle, expand, link_corequisites
+from MeetingTime import meeting_mask
+
+# seconds auto_select_courses may spend before settling for the best schedule found
+DEFAULT_TIME_BUDGET = 0.5
+# how many search nodes between clock checks
+CLOCK_CHECK_INTERVAL = 1024
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def _mask(item):
+    return item.meeting_mask if isinstance(item, CourseBundle) else meeting_mask(item.time)
+
+
+def _value(item, preference):
+    if preference is None:
+        return item.credits
+    return item.credits + sum(preference(c) for c in expand([item]))
+
+
+class _Section:
+    __slots__ = ("course", "credits", "value", "mask", "name")
+
+    def __init__(self, course, value):
+        self.course = course
+        self.credits = course.credits
+        self.value = value
+        self.mask = _mask(course)
+        self.name = course.course_name
+
+
+class _Group:
+    """Sections sharing one meeting time; at most one of them can be taken."""
+
+    __slots__ = ("mask", "sections", "credit_values", "best_value", "best_ratio", "free_value")
+
+    def __init__(self, mask, sections):
+        self.mask = mask
+        self.sections = sorted(sections, key=lambda s: -s.value)
+        self.credit_values = sorted({s.credits for s in sections}, reverse=True)
+        self.best_value = self.sections[0].value
+        paid = [s.value / s.credits for s in sections if s.credits > 0]
+        self.best_ratio = max(paid, default=0.0)
+        self.free_value = max((s.value for s in sections if s.credits == 0), default=0.0)
+
+    def options(self, names, position, last_group):
+        """
+        Sections worth branching on, best value first. Per credit value, once
+        a section is offered whose course has no sections in later groups,
+        the rest are dominated: they are worth no more and block as much.
+        """
+        done = set()
+        for s in self.sections:
+            if s.credits in done or s.name in names:
+                continue
+            if last_group[s.name] <= position:
+                done.add(s.credits)
+            yield s
+
+
+def _group_sections(courses, max_credits, preference):
+    groups = {}
+    for i, course in enumerate(courses):
+        if course.credits > max_credits:
+            continue
+        section = _Section(course, _value(course, preference))
+        # a course with no known meeting time conflicts with nothing, so it is its own group
+        key = section.mask if section.mask else ("unscheduled", i)
+        groups.setdefault(key, []).append(section)
+    # most valuable groups first, so good schedules are found early; among equals,
+    # small footprints first, since they leave the most room for the rest of the week
+    return sorted(
+        (_Group(key if isinstance(key, int) else 0, sections) for key, sections in groups.items()),
+        key=lambda g: (-g.best_value, bin(g.mask).count("1")),
+    )
+
+
+def _greedy(groups, max_credits):
+    sections = sorted((s for g in groups for s in g.sections), key=lambda s: -s.value)
+    chosen, credits, used_mask, names = [], 0, 0, set()
+    for s in sections:
+        if credits + s.credits <= max_credits and not (s.mask & used_mask) and s.name not in names:
+            chosen.append(s)
+            credits += s.credits
+            used_mask |= s.mask
+            names.add(s.name)
+    return chosen
+
+
+def best_schedule(courses, max_credits=19, preference=None, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Pick courses that maximize total credits (plus `preference(course)` for
+    each course, if given) without going over `max_credits`, without two
+    courses meeting at the same time, without two sections of the same
+    course and without a lecture missing its lab (see CoRequisites).
+
+    Sections are grouped by meeting-time bitmask, since at most one section
+    of a group fits in a schedule, and a depth-first branch and bound picks
+    groups in turn. Within a group, sections of the same credits are tried
+    only until one is found whose course appears in no later group. A
+    greedy conflict-free pick seeds the incumbent; a branch is cut when the
+    groups still free cannot beat it even ignoring conflicts among
+    themselves (for plain credits: the largest credit total they reach
+    under the cap). The search ends when nothing can improve or after
+    `time_budget` seconds, returning the best schedule found so far.
+    """
+    return expand(_solve(link_corequisites(courses), max_credits, preference, time_budget))
+
+
+def _solve(courses, max_credits, preference, time_budget):
+    groups = _group_sections(courses, max_credits, preference)
+    if not groups:
+        return []
+
+    n = len(groups)
+    last_group = {}
+    for j, g in enumerate(groups):
+        for s in g.sections:
+            last_group[s.name] = j
+
+    def bound(groups_left, credits_left):
+        if preference is None:
+            # bitset of the credit totals one section per group can add
+            limit = (1 << (credits_left + 1)) - 1
+            reachable = 1
+            for g in groups_left:
+                step = reachable
+                for credits in g.credit_values:
+                    step |= reachable << credits
+                reachable = step & limit
+            return reachable.bit_length() - 1
+        total = ratio = free = 0.0
+        for g in groups_left:
+            total += g.best_value
+            ratio = max(ratio, g.best_ratio)
+            free += g.free_value
+        return min(total, credits_left * ratio + free)
+
+    best_choice = _greedy(groups, max_credits)
+    best_value = sum(s.value for s in best_choice)
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    nodes = 0
+    chosen = []
+    names = set()
+
+    def search(k, credits, value, used_mask):
+        nonlocal best_value, best_choice, nodes
+        nodes += 1
+        if deadline is not None and nodes % CLOCK_CHECK_INTERVAL == 0 and time.perf_counter() > deadline:
+            raise _OutOfTime
+        if value > best_value:
+            best_value = value
+            best_choice = list(chosen)
+
+        credits_left = max_credits - credits
+        free_groups = [j for j in range(k, n) if not groups[j].mask & used_mask]
+        for pos, j in enumerate(free_groups):
+            if value + bound([groups[i] for i in free_groups[pos:]], credits_left) <= best_value:
+                return
+            for s in groups[j].options(names, j, last_group):
+                if s.credits > credits_left:
+                    continue
+                chosen.append(s)
+                names.add(s.name)
+                search(j + 1, credits + s.credits, value + s.value, used_mask | s.mask)
+                names.discard(s.name)
+                chosen.pop()
+
+    try:
+        search(0, 0, 0.0, 0)
+    except _OutOfTime:
+        pass
+    return [s.course for s in sorted(best_choice, key=lambda s: (-s.value, -s.credits))]
+
+
+def _best_extending(courses, include, exclude, max_credits, preference, time_budget):
+    """Best schedule that contains every course in `include` and none in `exclude` (ids), or None."""
+    credits = sum(c.credits for c in include)
+    if credits > max_credits:
+        return None
+    used_mask = 0
+    for c in include:
+        used_mask |= _mask(c)
+    names = {c.course_name for c in include}
+    taken = exclude | {id(c) for c in include}
+    rest = [
+        c for c in courses
+        if id(c) not in taken and not _mask(c) & used_mask and c.course_name not in names
+    ]
+    return list(include) + _solve(rest, max_credits - credits, preference, time_budget)
+
+
+def ranked_schedules(courses, max_credits=19, preference=None, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    Lazily yield conflict-free schedules (lists of courses) best first, by
+    total credits plus `preference(course)` as in best_schedule.
+
+    The first schedule costs one best_schedule call. After a schedule
+    [c1, ..., cm] is taken from the queue, its part of the search space is
+    split into m pieces ("has c1..c(j-1) but not cj"), each piece's best
+    schedule is solved and queued, and the next one taken is the best in the
+    queue. Every schedule comes up exactly once, but only full ones are
+    yielded: an empty schedule, or one another course still fits into
+    without a clash or going over `max_credits`, is split and skipped.
+    Each schedule asked for shares one `time_budget` across all of the
+    pieces solved for it, so a piece may settle for less than its best,
+    which can put a later schedule slightly out of order.
+    """
+    def score(schedule):
+        return sum(_value(c, preference) for c in schedule)
+
+    def is_full(schedule):
+        if not schedule:
+            return False
+        credits = sum(c.credits for c in schedule)
+        used_mask = 0
+        for c in schedule:
+            used_mask |= _mask(c)
+        names = {c.course_name for c in schedule}
+        taken = {id(c) for c in schedule}
+        return not any(
+            id(c) not in taken and c.course_name not in names
+            and credits + c.credits <= max_credits and not _mask(c) & used_mask
+            for c in courses
+        )
+
+    def budget_left():
+        if time_budget is None:
+            return None
+        return max(deadline - time.perf_counter(), 0.0)
+
+    # lectures and their labs are one unit throughout
+    courses = link_corequisites(courses)
+    counter = itertools.count()
+    queue = []
+    deadline = time.perf_counter() + (time_budget or 0)
+    first = _best_extending(courses, (), frozenset(), max_credits, preference, budget_left())
+    heapq.heappush(queue, (-score(first), next(counter), first, (), frozenset()))
+    while queue:
+        _, _, schedule, include, exclude = heapq.heappop(queue)
+        if is_full(schedule):
+            yield expand(schedule)
+            deadline = time.perf_counter() + (time_budget or 0)
+        free = schedule[len(include):]
+        for j, course in enumerate(free):
+            piece_include = tuple(include) + tuple(free[:j])
+            piece_exclude = exclude | {id(course)}
+            best = _best_extending(courses, piece_include, piece_exclude, max_credits, preference, budget_left())
+            if best is not None:
+                heapq.heappush(queue, (-score(best), next(counter), best, piece_include, piece_exclude))
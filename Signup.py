@@ -0,0 +1,168 @@
+import csv
+from pathlib import Path
+
+from AccountStore import get_account_store
+
+DEFAULT_PINS = Path(__file__).parent / "Database" / "Security_pins.txt"
+
+# role -> (account type written to Accounts.txt, ID prefix)
+ROLES = {
+    "student": ("STUDENT", "900"),
+    "professor": ("PROFESSOR", "700"),
+    "admin": ("ADMIN", "800"),
+}
+PIN_ATTEMPTS = 3
+
+
+def load_pin(role, pins_file=None):
+    if pins_file is None:
+        pins_file = DEFAULT_PINS
+    with open(pins_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(role + ":"):
+                return line.split(":", 1)[1].strip()
+    return ""
+
+
+def validate_field(label, value):
+    # Accounts.txt is split on commas, so a comma or quote would corrupt the record
+    value = str(value).strip()
+    if not value:
+        raise ValueError(f"{label} cannot be empty.")
+    if any(c in value for c in ',"\n\r'):
+        raise ValueError(f"{label} cannot contain commas, quotes or line breaks.")
+    return value
+
+
+def build_record(role, user_id, full_name, classification=None, major=None):
+    """Validate one account's fields and return its Accounts.txt record."""
+    account_type = ROLES[role][0]
+    full_name = validate_field("Name", full_name)
+    if role == "student":
+        classification = validate_field("Classification", classification)
+        major = validate_field("Major", major)
+        return [account_type, user_id, full_name, classification, major, False]
+    return [account_type, user_id, full_name]
+
+
+def create_account(role, full_name, classification=None, major=None, database=None):
+    """
+    Create one account in-process and return its new ID.
+
+    Replaces the `java SignUp` launch: the record is written in the same
+    STUDENT/PROFESSOR/ADMIN format through AccountStore, and the ID comes from
+    its collision-free allocator instead of an unchecked random number.
+    """
+    if role not in ROLES:
+        raise ValueError(f"Unknown account type: {role}")
+    store = get_account_store(database)
+    # validate before taking an ID so a bad entry does not burn one
+    build_record(role, "", full_name, classification, major)
+    with store.lock():
+        user_id = store.allocate_ids(ROLES[role][1])[0]
+        store.append_records([build_record(role, user_id, full_name, classification, major)])
+    return user_id
+
+
+def provision_accounts(csv_path, database=None, output_path=None):
+    """
+    Create every account listed in a CSV in one batch.
+
+    The CSV needs a header with a `name` column, plus `classification` and
+    `major` for students; an optional `role` column (student, professor,
+    admin) defaults to student. All rows are validated first and nothing is
+    written if any row is bad. IDs are then allocated per prefix in one pass
+    and every record is appended with a single write while Accounts.txt is
+    locked.
+
+    Returns a list of (row number, role, name, new ID). When `output_path` is
+    given the same mapping is written there as CSV.
+    """
+    rows = []
+    errors = []
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or "name" not in [c.strip().lower() for c in reader.fieldnames]:
+            raise ValueError("CSV must have a header row with a 'name' column.")
+        for row_num, row in enumerate(reader, 2):
+            row = {k.strip().lower(): (v or "").strip() for k, v in row.items() if k is not None}
+            if not any(row.values()):
+                continue
+            role = row.get("role", "").lower() or "student"
+            try:
+                if role not in ROLES:
+                    raise ValueError(f"Unknown account type: {role}")
+                record = build_record(role, "", row.get("name"), row.get("classification"), row.get("major"))
+            except ValueError as e:
+                errors.append(f"row {row_num}: {e}")
+                continue
+            rows.append((row_num, role, record))
+
+    if errors:
+        raise ValueError("Invalid rows, nothing was written:\n" + "\n".join(errors))
+
+    store = get_account_store(database)
+    with store.lock():
+        ids_by_role = {}
+        for role in ROLES:
+            count = sum(1 for _, r, _ in rows if r == role)
+            ids_by_role[role] = iter(store.allocate_ids(ROLES[role][1], count)) if count else iter(())
+
+        results = []
+        records = []
+        for row_num, role, record in rows:
+            record[1] = next(ids_by_role[role])
+            records.append(record)
+            results.append((row_num, role, record[2], record[1]))
+        store.append_records(records)
+
+    if output_path is not None:
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["row", "role", "name", "id"])
+            writer.writerows(results)
+
+    return results
+
+
+def check_pin(role, pins_file=None):
+    pin = load_pin(role, pins_file)
+    for _ in range(PIN_ATTEMPTS):
+        entered = input(f"Enter {role} PIN: ")
+        if entered == pin:
+            return True
+    print("Too many attempts. Returning to main menu.")
+    return False
+
+
+def sign_up(database=None, pins_file=None):
+    print("=== SIGN UP ===")
+    print("1. Student")
+    print("2. Professor")
+    print("3. Admin")
+    choice = input("Choose: ").strip()
+
+    role = {"1": "student", "2": "professor", "3": "admin"}.get(choice)
+    if role is None:
+        print("Invalid option.")
+        return None
+
+    if role != "student" and not check_pin(role, pins_file):
+        return None
+
+    full_name = input("Enter full name: ")
+    classification = major = None
+    if role == "student":
+        classification = input("Enter classification: ")
+        major = input("Enter major: ")
+
+    try:
+        user_id = create_account(role, full_name, classification, major, database)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return None
+
+    print("\nAccount created successfully!")
+    print(f"Name: {full_name.strip()}")
+    print(f"ID: {user_id}")
+    return user_id
@@ -0,0 +1,152 @@
+import bisect
+import csv
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+DEFAULT_COURSES_CSV = Path(__file__).parent / "Database" / "Courses.csv"
+DEFAULT_INDEX_PATH = Path(__file__).parent / "Database" / "Courses.crns"
+STAMP_PREFIX = "# csv_stamp="
+
+
+class SortedCrnIndex:
+    """
+    Ascending list of the CRNs in Courses.csv.
+
+    For Database/Courses.csv the list is persisted as Database/Courses.crns:
+    one CRN per line plus the mtime/size of the CSV it was built from, so a
+    new process loads it without re-sorting. Any other CSV keeps its list in
+    memory unless the caller passes an `index_path`. The list is rebuilt only
+    when the CSV changed behind its back; the add-course paths wrap their
+    append in `appending()`, which places the new CRN with bisect and accepts
+    the new CSV stamp. A missing CSV is an empty index. `page()` slices out
+    one page in either order.
+    """
+
+    def __init__(self, csv_path=None, index_path=None):
+        self.csv_path = Path(csv_path) if csv_path is not None else DEFAULT_COURSES_CSV
+        if index_path is None and os.path.abspath(self.csv_path) == os.path.abspath(DEFAULT_COURSES_CSV):
+            index_path = DEFAULT_INDEX_PATH
+        self.index_path = Path(index_path) if index_path is not None else None
+        self._crns = None
+        self._csv_stamp = None
+
+    def _current_csv_stamp(self):
+        try:
+            st = os.stat(self.csv_path)
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns},{st.st_size}"
+
+    def _load(self):
+        crns = []
+        csv_stamp = None
+        if self.index_path is not None and self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith(STAMP_PREFIX):
+                        csv_stamp = line[len(STAMP_PREFIX):]
+                    elif line.isdigit():
+                        crns.append(int(line))
+        self._crns = crns
+        self._csv_stamp = csv_stamp
+
+    def _save(self):
+        if self.index_path is None:
+            return
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(f"{STAMP_PREFIX}{self._csv_stamp}\n")
+            for crn in self._crns:
+                f.write(f"{crn}\n")
+        os.replace(tmp_path, self.index_path)
+
+    def rebuild(self):
+        csv_stamp = self._current_csv_stamp()
+        crns = set()
+        with open(self.csv_path, mode="r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                crn = (row.get("crn") or "").strip()
+                if crn.isdigit():
+                    crns.add(int(crn))
+        self._crns = sorted(crns)
+        self._csv_stamp = csv_stamp
+        self._save()
+
+    def _ensure_current(self):
+        csv_stamp = self._current_csv_stamp()
+        if csv_stamp is None:
+            self._crns = []
+            self._csv_stamp = None
+            return
+        if self._crns is None:
+            self._load()
+        if self._csv_stamp != csv_stamp:
+            self.rebuild()
+
+    def _tracking(self):
+        if self.index_path is None:
+            return self._crns is not None
+        return self.index_path.exists()
+
+    def __len__(self):
+        self._ensure_current()
+        return len(self._crns)
+
+    @contextmanager
+    def appending(self, crn):
+        """
+        Wrap an append of the row for `crn` to Courses.csv. The index is
+        brought up to date first, so afterwards only `crn` needs inserting.
+        Nothing is done for a CSV that was never paged through.
+        """
+        if not self._tracking():
+            yield
+            return
+        self._ensure_current()
+        yield
+
+        crn = int(crn)
+        i = bisect.bisect_left(self._crns, crn)
+        if i == len(self._crns) or self._crns[i] != crn:
+            self._crns.insert(i, crn)
+        self._csv_stamp = self._current_csv_stamp()
+        self._save()
+
+    def page(self, offset=0, page_size=20, descending=True):
+        """Return up to `page_size` CRNs starting `offset` entries into the given order."""
+        self._ensure_current()
+        offset = max(offset, 0)
+        if descending:
+            end = len(self._crns) - offset
+            start = max(end - page_size, 0)
+            return self._crns[start:end][::-1] if end > 0 else []
+        return self._crns[offset:offset + page_size]
+
+    def pages(self, page_size=20, descending=True):
+        """Yield successive pages until the index is exhausted."""
+        offset = 0
+        while True:
+            crns = self.page(offset, page_size, descending)
+            if not crns:
+                return
+            yield crns
+            offset += page_size
+
+
+_indexes = {}
+
+
+def get_sorted_crn_index(csv_path=None, index_path=None):
+    """
+    Return the shared SortedCrnIndex for `csv_path` (default Database/Courses.csv).
+    `index_path` only applies when the index is first created.
+    """
+    path = Path(csv_path) if csv_path is not None else DEFAULT_COURSES_CSV
+    key = os.path.abspath(path)
+    index = _indexes.get(key)
+    if index is None:
+        index = SortedCrnIndex(path, index_path)
+        _indexes[key] = index
+    return index
@@ -1,5 +1,11 @@
 from pathlib import Path
 import csv
+import sys
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from EnrollmentIndex import get_enrollment_index
 
 
 class Student:
@@ -42,7 +48,16 @@ class Student:
         print(f"Major: {self.major}")
 
     def display_schedule(self):
-        print("This is where teh schedule would be displayed.")
+        courses = get_enrollment_index().courses_for(self.student_num)
+        if not courses:
+            print(f"No courses found for student {self.student_num}.")
+            return
+
+        total_credits = 0
+        for course in courses:
+            print(f"- {course.course_name} ({course.credits} credits) - {course.time} [CRN: {course.CRN}]")
+            total_credits += course.credits
+        print(f"Total Credits: {total_credits}")
     
     def return_clearance_status(self):
         return bool(self.fiscal_clearance)
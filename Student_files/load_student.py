@@ -1,23 +1,21 @@
+import sys
 from .Student import *
 from pathlib import Path
 
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from AccountStore import get_account_store
+
 def load_student(user_id, database=None):
-    if database is None:
-        base_folder = Path(__file__).parent.parent  # root folder
-        database = base_folder / "Database" / "Accounts.txt"
+    parts = get_account_store(database).get_student(user_id)
+    if parts is None or len(parts) < 6:
+        return None
 
-    with open(database, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = [p.strip().strip('"') for p in line.split(",")]
-            if parts[0] == "STUDENT" and parts[1] == user_id:
-                return Student(
-                    student_num=parts[1],
-                    full_name=parts[2],
-                    classification=parts[3],
-                    major=parts[4],
-                    fiscal_clearance=parts[5]
-                )
-    return None
+    return Student(
+        student_num=parts[1],
+        full_name=parts[2],
+        classification=parts[3],
+        major=parts[4],
+        fiscal_clearance=parts[5]
+    )
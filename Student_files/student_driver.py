@@ -32,7 +32,8 @@ def student_driver(student):
             print("Fiscal Clearance:", student.return_clearance_status())
         elif choice == "4":
             clear_screen()
-            print("View Schdule:", student.display_schedule())
+            print("View Schedule:")
+            student.display_schedule()
         elif choice == "5":
             clear_screen()
             choice_schedule = input("Would you like to view a previous schedule? (yes/no): ").strip().lower()
@@ -0,0 +1,218 @@
+import csv
+import math
+import random
+from pathlib import Path
+
+from MeetingTime import meeting_mask
+
+DEFAULT_TRANSCRIPTS = Path(__file__).parent / "Database" / "Transcripts.csv"
+# the usual grid: 50-minute MWF and 75-minute TR blocks
+STANDARD_SLOTS = (
+    "MWF 8-8:50AM", "MWF 9-9:50AM", "MWF 10-10:50AM", "MWF 11-11:50AM",
+    "MWF 12-12:50PM", "MWF 1-1:50PM", "MWF 2-2:50PM", "MWF 3-3:50PM",
+    "TR 8-9:15AM", "TR 9:30-10:45AM", "TR 11-12:15PM", "TR 12:30-1:45PM",
+    "TR 2-3:15PM", "TR 3:30-4:45PM",
+)
+# cost of one professor teaching two sections at once, against 1 per clashing student
+PROFESSOR_WEIGHT = 1000
+# cost of moving a section off its current time, so only moves that pay off are proposed
+MOVE_WEIGHT = 0.5
+# annealing moves per section that gets a time; 2,000 sections take about 15 seconds
+ITERATIONS_PER_SECTION = 500
+
+
+def _course_key(name):
+    # transcripts write "CPSC1724" where course files have "CPSC 1724"
+    return "".join(name.split()).upper()
+
+
+def read_transcript_courses(path=None):
+    """Course lists of every Transcripts.csv row (one list per student term)."""
+    path = Path(path) if path is not None else DEFAULT_TRANSCRIPTS
+    if not path.exists():
+        return []
+    terms = []
+    with open(path, mode="r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # the header has been written as both Courses_list and Courses_List
+            row = {(k or "").strip().lower(): v for k, v in row.items()}
+            names = [_course_key(n) for n in (row.get("courses_list") or "").split(",") if n.strip()]
+            if len(names) > 1:
+                terms.append(names)
+    return terms
+
+
+def co_enrollment_weights(courses, transcript_terms=()):
+    """
+    {(i, j): weight} for pairs of sections (positions in `courses`, i < j)
+    that should not meet at the same time: 1 per student enrolled in both,
+    1 per past transcript term with both courses (shared out over their
+    sections), and PROFESSOR_WEIGHT for two sections with one professor.
+    """
+    weights = {}
+
+    def add(i, j, w):
+        if i != j:
+            key = (i, j) if i < j else (j, i)
+            weights[key] = weights.get(key, 0) + w
+
+    by_student = {}
+    for i, course in enumerate(courses):
+        for student in course.class_list:
+            by_student.setdefault(student, []).append(i)
+    for sections in by_student.values():
+        for a in range(len(sections)):
+            for b in range(a + 1, len(sections)):
+                add(sections[a], sections[b], 1)
+
+    by_name = {}
+    for i, course in enumerate(courses):
+        by_name.setdefault(_course_key(course.course_name), []).append(i)
+    pairs = {}
+    for names in transcript_terms:
+        names = sorted(set(n for n in names if n in by_name))
+        for a in range(len(names)):
+            for b in range(a + 1, len(names)):
+                pairs[names[a], names[b]] = pairs.get((names[a], names[b]), 0) + 1
+    for (name_a, name_b), count in pairs.items():
+        share = count / (len(by_name[name_a]) * len(by_name[name_b]))
+        for i in by_name[name_a]:
+            for j in by_name[name_b]:
+                add(i, j, share)
+
+    by_professor = {}
+    for i, course in enumerate(courses):
+        professor = getattr(course, "professor_id", None)
+        if professor and professor.lower() != "none":
+            by_professor.setdefault(professor, []).append(i)
+    for sections in by_professor.values():
+        for a in range(len(sections)):
+            for b in range(a + 1, len(sections)):
+                add(sections[a], sections[b], PROFESSOR_WEIGHT)
+    return weights
+
+
+def conflict_cost(masks, weights):
+    """Total weight of the section pairs whose meeting masks overlap."""
+    return sum(w for (i, j), w in weights.items() if masks[i] & masks[j])
+
+
+class _Annealer:
+    """
+    Simulated annealing over section -> slot, scored by deltas.
+
+    pressure[i][s] is the weight of i's neighbours that would overlap it in
+    slot s, so a move is priced in O(1) as pressure[i][new] - pressure[i][old].
+    Only an accepted move touches other rows: its neighbours' pressure
+    changes for the slots that overlap the old or the new slot.
+    """
+
+    def __init__(self, n, slots, weights, start, rng):
+        self.rng = rng
+        self.home = list(start)
+        masks = [meeting_mask(s) for s in slots]
+        k = len(slots)
+        self.overlap = [[bool(masks[a] & masks[b]) for b in range(k)] for a in range(k)]
+        self.neighbours = [[] for _ in range(n)]
+        for (i, j), w in weights.items():
+            self.neighbours[i].append((j, w))
+            self.neighbours[j].append((i, w))
+        self.slot = list(start)
+        self.pressure = [[0] * k for _ in range(n)]
+        for i in range(n):
+            row = self.pressure[i]
+            for j, w in self.neighbours[i]:
+                for s, clash in enumerate(self.overlap[self.slot[j]]):
+                    if clash:
+                        row[s] += w
+        self.cost = sum(self.pressure[i][self.slot[i]] for i in range(n)) / 2
+        # (old, new) -> [(slot, +1 or -1)] where overlapping changes
+        self._changes = {}
+
+    def delta(self, i, new):
+        row = self.pressure[i]
+        old, home = self.slot[i], self.home[i]
+        return row[new] - row[old] + MOVE_WEIGHT * ((new != home) - (old != home))
+
+    def move(self, i, new):
+        old = self.slot[i]
+        changes = self._changes.get((old, new))
+        if changes is None:
+            changes = [
+                (s, int(self.overlap[s][new]) - int(self.overlap[s][old]))
+                for s in range(len(self.overlap))
+                if self.overlap[s][new] != self.overlap[s][old]
+            ]
+            self._changes[old, new] = changes
+        pressure = self.pressure
+        for j, w in self.neighbours[i]:
+            row = pressure[j]
+            for s, sign in changes:
+                row[s] += sign * w
+        self.slot[i] = new
+
+    def run(self, movable, choices, iterations, start_temperature=2.0, end_temperature=0.01):
+        """Try `iterations` random moves of a `movable` section to one of the first `choices` slots."""
+        best_cost, best_slot = self.cost, list(self.slot)
+        if not movable or iterations <= 0:
+            return best_slot, best_cost
+        cooling = (end_temperature / start_temperature) ** (1 / iterations)
+        temperature = start_temperature
+        rng = self.rng
+        for _ in range(iterations):
+            i = movable[rng.randrange(len(movable))]
+            new = rng.randrange(choices)
+            if new != self.slot[i]:
+                change = self.delta(i, new)
+                if change <= 0 or rng.random() < math.exp(-change / temperature):
+                    self.move(i, new)
+                    self.cost += change
+                    if self.cost < best_cost - 1e-9:
+                        best_cost, best_slot = self.cost, list(self.slot)
+            temperature *= cooling
+        return best_slot, best_cost
+
+
+def propose_times(courses, slots=STANDARD_SLOTS, transcript_terms=(), iterations=None, seed=0):
+    """
+    Propose a meeting time from `slots` for every section of `courses`
+    with a readable time, so that sections commonly taken together (by
+    current rosters and past transcripts) do not overlap.
+
+    Every section starts from its current time, which is a candidate too,
+    and each move off it costs MOVE_WEIGHT, so sections only move when
+    that takes conflicts away. Sections with no meeting time (TBA, online)
+    are left alone. `iterations` defaults to ITERATIONS_PER_SECTION per
+    section being timed. Returns ({crn: proposed time}, cost of the current
+    times, cost of the proposal), where cost is the weight of overlapping
+    pairs (see co_enrollment_weights).
+    """
+    weights = co_enrollment_weights(courses, transcript_terms)
+    masks = [meeting_mask(c.time) for c in courses]
+    current_cost = conflict_cost(masks, weights)
+
+    # one candidate per distinct meeting mask: the grid, then the times already in use
+    candidates = []
+    slot_of = {}
+    for time in list(slots) + [c.time for c in courses]:
+        mask = meeting_mask(time)
+        if mask and mask not in slot_of:
+            slot_of[mask] = len(candidates)
+            candidates.append(time)
+    choices = len(candidates)
+    # sections with no meeting time stay put, in an extra slot that overlaps nothing
+    candidates.append("TBA")
+    movable = [i for i, mask in enumerate(masks) if mask]
+    start = [slot_of[mask] if mask else choices for mask in masks]
+
+    if iterations is None:
+        iterations = ITERATIONS_PER_SECTION * len(movable)
+    annealer = _Annealer(len(courses), candidates, weights, start, random.Random(seed))
+    best_slot, _ = annealer.run(movable, choices, iterations)
+
+    proposal = {}
+    for i in movable:
+        course = courses[i]
+        proposal[str(course.CRN)] = course.time if best_slot[i] == start[i] else candidates[best_slot[i]]
+    proposed_cost = conflict_cost([meeting_mask(candidates[k]) for k in best_slot], weights)
+    return proposal, current_cost, proposed_cost
@@ -0,0 +1,82 @@
+"""
+Compare login lookups through AccountStore against the old linear scan of
+Accounts.txt.
+
+Run from the project root:
+    python benchmarks/bench_account_store.py [num_records] [num_lookups]
+"""
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from AccountStore import AccountStore, parse_account_line
+
+
+def write_accounts(path, num_records):
+    ids = []
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(num_records):
+            kind = i % 10
+            if kind == 0:
+                user_id = f"700{i:06d}"
+                f.write(f"PROFESSOR,{user_id},Dr. Prof {i}\n")
+            elif kind == 1:
+                user_id = f"800{i:06d}"
+                f.write(f"ADMIN,{user_id},Admin {i}\n")
+            else:
+                user_id = f"900{i:06d}"
+                f.write(f"STUDENT,{user_id},Student {i},Freshman,Comp Sci,false\n")
+                ids.append(user_id)
+    return ids
+
+
+def scan_lookup(database, user_id):
+    # the per-login scan load_student used before AccountStore
+    with open(database, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            parts = parse_account_line(line)
+            if parts[0] == "STUDENT" and parts[1] == user_id:
+                return parts
+    return None
+
+
+def main():
+    num_records = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "Accounts.txt"
+        ids = write_accounts(database, num_records)
+        lookups = [random.choice(ids) for _ in range(num_lookups)]
+
+        start = time.perf_counter()
+        for user_id in lookups:
+            assert scan_lookup(database, user_id) is not None
+        scan_time = time.perf_counter() - start
+
+        store = AccountStore(database)
+        start = time.perf_counter()
+        store.refresh()
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for user_id in lookups:
+            assert store.get_student(user_id) is not None
+        store_time = time.perf_counter() - start
+
+    print(f"records: {num_records}, lookups: {num_lookups}")
+    print(f"linear scan:        {scan_time / num_lookups * 1000:9.3f} ms/lookup")
+    print(f"AccountStore load:  {load_time * 1000:9.3f} ms (once)")
+    print(f"AccountStore:       {store_time / num_lookups * 1000:9.3f} ms/lookup")
+
+
+if __name__ == "__main__":
+    main()
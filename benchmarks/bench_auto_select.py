@@ -0,0 +1,88 @@
+"""
+Time the conflict-free auto_select_courses solver on synthetic catalogs of
+25, 500 and 5,000 sections, next to the old greedy pick (highest credits
+first, meeting times ignored).
+
+Run from the project root:
+    python benchmarks/bench_auto_select.py [time_budget_seconds]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from MeetingTime import meeting_mask
+from ScheduleSolver import best_schedule
+
+SIZES = (25, 500, 5000)
+DAY_PATTERNS = ("MWF", "MW", "TR", "M", "T", "W", "R", "F")
+START_TIMES = ("8", "9", "10", "11", "12", "1", "2", "3", "4")
+CREDITS = (1, 3, 3, 3, 4, 4)
+
+
+class Section:
+    def __init__(self, course_name, time, credits):
+        self.course_name = course_name
+        self.time = time
+        self.credits = credits
+
+
+def make_catalog(size, rng, start_times=START_TIMES):
+    # about five sections per course
+    names = [f"DEPT {100 + i}" for i in range(max(size // 5, 1))]
+    catalog = []
+    for _ in range(size):
+        start = rng.choice(start_times)
+        end = int(start) % 12 + 1
+        meridiem = "AM" if start in ("8", "9", "10") else "PM"
+        catalog.append(Section(rng.choice(names), f"{rng.choice(DAY_PATTERNS)} {start}:00-{end}:15{meridiem}", rng.choice(CREDITS)))
+    return catalog
+
+
+def greedy(catalog, max_credits=19):
+    selected, total = [], 0
+    for course in sorted(catalog, key=lambda c: c.credits, reverse=True):
+        if total + course.credits <= max_credits:
+            selected.append(course)
+            total += course.credits
+        if total == max_credits:
+            break
+    return selected
+
+
+def conflicts(selected):
+    count = 0
+    for i, a in enumerate(selected):
+        for b in selected[i + 1:]:
+            if meeting_mask(a.time) & meeting_mask(b.time):
+                count += 1
+    return count
+
+
+def main():
+    time_budget = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    rng = random.Random(19)
+
+    print(f"time budget: {time_budget}s")
+    # "crowded" squeezes every section into three start times, so 19 credits
+    # are out of reach and the solver has to prove the best it can do
+    for label, start_times in (("spread", START_TIMES), ("crowded", ("9", "10", "11"))):
+        print(f"\n{label} catalog")
+        print(f"{'sections':>8}  {'solver ms':>9}  {'credits':>7}  {'clashes':>7}  |  {'greedy credits':>14}  {'clashes':>7}")
+        for size in SIZES:
+            catalog = make_catalog(size, rng, start_times)
+            start = time.perf_counter()
+            selected = best_schedule(catalog, 19, time_budget=time_budget)
+            elapsed = time.perf_counter() - start
+            old = greedy(catalog)
+            print(
+                f"{size:>8}  {elapsed * 1000:9.2f}  {sum(c.credits for c in selected):>7}  {conflicts(selected):>7}  |  "
+                f"{sum(c.credits for c in old):>14}  {conflicts(old):>7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
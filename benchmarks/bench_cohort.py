@@ -0,0 +1,52 @@
+"""
+Time schedule-cohort on a synthetic catalog of 500 course files for a
+cohort of 200 students, serially and on a process pool.
+
+Run from the project root:
+    python benchmarks/bench_cohort.py [processes]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from bench_auto_select import make_catalog
+from CohortScheduler import schedule_cohort
+
+SECTIONS = 500
+COHORT = 200
+
+
+def write_catalog(folder, rng):
+    for i, section in enumerate(make_catalog(SECTIONS, rng)):
+        with open(folder / f"section {i}.txt", "w", encoding="utf-8") as f:
+            f.write(f"crn: {10000 + i}\n")
+            f.write(f"credits: {section.credits}\n")
+            f.write(f"course_name: {section.course_name}\n")
+            f.write(f"time: {section.time}\n")
+            f.write("professor: none\n\nstudents:\n")
+
+
+def main():
+    processes = int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count()
+    cohort = [str(900000000 + i) for i in range(COHORT)]
+
+    print(f"{SECTIONS} sections, {COHORT} students")
+    for workers in dict.fromkeys((1, processes)):
+        with tempfile.TemporaryDirectory() as tmp:
+            folder = Path(tmp) / "courses"
+            folder.mkdir()
+            write_catalog(folder, random.Random(19))
+            start = time.perf_counter()
+            result = schedule_cohort(cohort, folder, processes=workers)
+            elapsed = time.perf_counter() - start
+        print(f"processes={workers:<3} {elapsed:7.2f}s  scheduled {len(result['scheduled'])}")
+
+
+if __name__ == "__main__":
+    main()
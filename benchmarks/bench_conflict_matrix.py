@@ -0,0 +1,76 @@
+"""
+Time building the catalog conflict matrix for 500 and 5,000 sections, and
+the "compatible with this schedule" query, next to checking every pair of
+meeting-time masks. The "distinct" catalog gives every section its own
+meeting time, the worst case for row sharing.
+
+Run from the project root:
+    python benchmarks/bench_conflict_matrix.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from bench_auto_select import DAY_PATTERNS, make_catalog
+from ConflictMatrix import ConflictMatrix
+from MeetingTime import meeting_mask
+
+SIZES = (500, 5000)
+
+
+class Section:
+    def __init__(self, crn, time):
+        self.CRN = crn
+        self.time = time
+
+
+def distinct_catalog(size, rng):
+    catalog = []
+    for i in range(size):
+        start = rng.randrange(8 * 60, 20 * 60, 5)
+        end = start + rng.choice((50, 75, 110)) + 5 * (i % 7)
+        catalog.append(Section(10000 + i, f"{rng.choice(DAY_PATTERNS)} {start // 60}:{start % 60:02}-{end // 60}:{end % 60:02}"))
+    return catalog
+
+
+def pairwise_conflicts(catalog):
+    masks = [meeting_mask(s.time) for s in catalog]
+    return sum(1 for i, a in enumerate(masks) for b in masks[i + 1:] if a & b)
+
+
+def main():
+    rng = random.Random(21)
+    print(f"{'catalog':>8}  {'sections':>8}  {'build ms':>8}  {'size KB':>7}  {'query ms':>8}  {'pairwise ms':>11}")
+    for label in ("spread", "distinct"):
+        for size in SIZES:
+            if label == "spread":
+                catalog = [Section(10000 + i, s.time) for i, s in enumerate(make_catalog(size, rng))]
+            else:
+                catalog = distinct_catalog(size, rng)
+            for s in catalog:
+                meeting_mask(s.time)
+
+            start = time.perf_counter()
+            matrix = ConflictMatrix(catalog)
+            built = time.perf_counter() - start
+
+            schedule = [str(s.CRN) for s in rng.sample(catalog, 5)]
+            start = time.perf_counter()
+            matrix.compatible_with(schedule)
+            queried = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pairwise_conflicts(catalog)
+            pairwise = time.perf_counter() - start
+            print(
+                f"{label:>8}  {size:>8}  {built * 1000:8.1f}  {matrix.nbytes() / 1024:7.0f}  "
+                f"{queried * 1000:8.2f}  {pairwise * 1000:11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare sign-up latency of the in-process Signup.create_account path
+against launching `java SignUp` once per account.
+
+Run from the project root:
+    python benchmarks/bench_signup.py [num_signups]
+
+The Java half is skipped when javac/java are not installed.
+"""
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from Signup import create_account
+
+
+def bench_python(tmp, num_signups):
+    database = Path(tmp) / "python" / "Accounts.txt"
+    start = time.perf_counter()
+    for i in range(num_signups):
+        create_account("student", f"Student {i}", "Freshman", "Comp Sci", database)
+    return time.perf_counter() - start
+
+
+def bench_java(tmp, num_signups):
+    if shutil.which("javac") is None or shutil.which("java") is None:
+        return None
+
+    work = Path(tmp) / "java"
+    (work / "Database").mkdir(parents=True)
+    shutil.copy(root_folder / "SignUp.java", work)
+    subprocess.run(["javac", "SignUp.java"], cwd=work, check=True)
+
+    start = time.perf_counter()
+    for i in range(num_signups):
+        subprocess.run(
+            ["java", "SignUp"],
+            cwd=work,
+            input=f"1\nStudent {i}\nFreshman\nComp Sci\n",
+            text=True,
+            capture_output=True,
+            check=True,
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    num_signups = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        python_time = bench_python(tmp, num_signups)
+        java_time = bench_java(tmp, num_signups)
+
+    print(f"sign-ups: {num_signups}")
+    print(f"in-process:      {python_time / num_signups * 1000:9.3f} ms/sign-up")
+    if java_time is None:
+        print("java SignUp:     skipped (javac/java not found)")
+    else:
+        print(f"java SignUp:     {java_time / num_signups * 1000:9.3f} ms/sign-up")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Time the simulated-annealing timetable solver on a synthetic 2,000-section
+term: about 400 courses, 6,000 students with five sections each and a
+professor per four sections, plus 2,000 past transcript terms.
+
+Run from the project root:
+    python benchmarks/bench_timetable.py [iterations]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+root_folder = Path(__file__).parent.parent
+sys.path.insert(0, str(root_folder))
+
+from TimetableSolver import ITERATIONS_PER_SECTION, STANDARD_SLOTS, propose_times
+
+SECTIONS = 2000
+STUDENTS = 6000
+
+
+class Section:
+    def __init__(self, crn, course_name, time, professor_id):
+        self.CRN = crn
+        self.course_name = course_name
+        self.time = time
+        self.professor_id = professor_id
+        self.class_list = []
+
+
+def make_term(rng):
+    names = [f"DEPT {100 + i}" for i in range(SECTIONS // 5)]
+    sections = [
+        Section(10000 + i, rng.choice(names), rng.choice(STANDARD_SLOTS), f"7{i // 4:08d}")
+        for i in range(SECTIONS)
+    ]
+    # students cluster around a "major" block of 40 courses, as real cohorts do
+    by_name = {}
+    for s in sections:
+        by_name.setdefault(s.course_name, []).append(s)
+    for student in range(STUDENTS):
+        base = rng.randrange(len(names) - 40)
+        for name in rng.sample(names[base:base + 40], 5):
+            if name in by_name:
+                rng.choice(by_name[name]).class_list.append(str(900000000 + student))
+    transcripts = []
+    for _ in range(2000):
+        base = rng.randrange(len(names) - 40)
+        transcripts.append(["".join(n.split()) for n in rng.sample(names[base:base + 40], 5)])
+    return sections, transcripts
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else ITERATIONS_PER_SECTION * SECTIONS
+    sections, transcripts = make_term(random.Random(25))
+    start = time.perf_counter()
+    proposal, before, after = propose_times(sections, transcript_terms=transcripts, iterations=iterations)
+    elapsed = time.perf_counter() - start
+    print(f"{len(sections)} sections, {iterations} moves: {elapsed:.1f}s")
+    print(f"conflict cost: {before:.0f} with the random times, {after:.0f} proposed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import pytest
+
+
+def _write_course(folder, name, crn, time="MWF 10-11AM", credits=3, professor="none", students=()):
+    path = folder / f"{name}.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"crn: {crn}\n")
+        f.write(f"credits: {credits}\n")
+        f.write(f"course_name: {name}\n")
+        f.write(f"time: {time}\n")
+        f.write(f"professor: {professor}\n\n")
+        f.write("students:\n")
+        for s in students:
+            f.write(f"{s}\n")
+    return path
+
+
+@pytest.fixture
+def write_course():
+    """Return a function that writes a Database/courses-style file and returns its path."""
+    return _write_course
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from AccountStore import AccountStore, get_account_store
+from Student_files.load_student import load_student
+from Admin_files.load_admin import load_admin
+from Functions import import_fiscal_clearances
+
+
+@pytest.fixture
+def accounts_file():
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("STUDENT,900111111,Ann Lee,Freshman,Comp Sci,false\n")
+        f.write("\n")
+        f.write("ADMIN,800111111,Root Admin\n")
+        f.write("PROF,700111111, Dr.Gain\n")
+        f.write("STUDENT,900111111,Duplicate,Senior,Math,true\n")
+    yield Path(path)
+    os.remove(path)
+
+
+class TestAccountStore:
+    """Test suite for the shared AccountStore"""
+
+    def test_indexes_each_role(self, accounts_file):
+        store = AccountStore(accounts_file)
+        assert store.get_student("900111111")[2] == "Ann Lee"
+        assert store.get_admin("800111111")[2] == "Root Admin"
+        assert store.get_professor("700111111")[2] == "Dr.Gain"
+        assert store.get_student("800111111") is None
+
+    def test_first_record_wins(self, accounts_file):
+        store = AccountStore(accounts_file)
+        assert store.get_student("900111111")[3] == "Freshman"
+
+    def test_reloads_after_file_changes(self, accounts_file):
+        store = AccountStore(accounts_file)
+        assert store.get_student("900222222") is None
+        time.sleep(0.01)
+        with open(accounts_file, "a", encoding="utf-8") as f:
+            f.write("STUDENT,900222222,New Student,Freshman,Art,false\n")
+        assert store.get_student("900222222")[2] == "New Student"
+
+    def test_professor_names(self, accounts_file):
+        store = AccountStore(accounts_file)
+        assert store.professor_names() == {"700111111": "Dr.Gain"}
+
+    def test_shared_store_per_path(self, accounts_file):
+        assert get_account_store(accounts_file) is get_account_store(str(accounts_file))
+
+    def test_loaders_read_through_store(self, accounts_file):
+        student = load_student("900111111", accounts_file)
+        admin = load_admin("800111111", accounts_file)
+        assert student.full_name == "Ann Lee"
+        assert student.fiscal_clearance is False
+        assert admin.full_name == "Root Admin"
+
+
+class TestClearanceUpdates:
+    """Test suite for in-place fiscal clearance updates"""
+
+    def test_toggle_is_patched_in_place(self, accounts_file):
+        store = AccountStore(accounts_file)
+        inode = os.stat(accounts_file).st_ino
+        size = os.path.getsize(accounts_file)
+
+        assert store.set_clearance("900111111", True)
+        assert os.stat(accounts_file).st_ino == inode
+        assert os.path.getsize(accounts_file) == size
+        with open(accounts_file, encoding="utf-8") as f:
+            assert f.readline() == "STUDENT,900111111,Ann Lee,Freshman,Comp Sci,true \n"
+        assert load_student("900111111", accounts_file).fiscal_clearance is True
+
+    def test_unpadded_true_is_rewritten_once(self, accounts_file):
+        with open(accounts_file, "w", encoding="utf-8") as f:
+            f.write("STUDENT,900111111,Ann Lee,Freshman,Comp Sci,true\n")
+            f.write("STUDENT,900222222,Bo Kim,Junior,Art,true\n")
+        store = AccountStore(accounts_file)
+
+        assert store.set_clearance("900111111", False)
+        with open(accounts_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        assert lines == [
+            "STUDENT,900111111,Ann Lee,Freshman,Comp Sci,false",
+            "STUDENT,900222222,Bo Kim,Junior,Art,true ",
+        ]
+
+        inode = os.stat(accounts_file).st_ino
+        assert store.set_clearance("900222222", False)
+        assert os.stat(accounts_file).st_ino == inode
+        assert store.get_student("900222222")[5] == "false"
+
+    def test_unknown_student(self, accounts_file):
+        assert AccountStore(accounts_file).set_clearance("900999999", True) is False
+
+    def test_update_student_rewrites_other_fields(self, accounts_file):
+        store = AccountStore(accounts_file)
+        store.update_student("900111111", "Ann Lee", "Sophomore", "Comp Sci", False)
+        assert store.get_student("900111111")[3] == "Sophomore"
+        assert store.get_admin("800111111")[2] == "Root Admin"
+
+
+class TestImportFiscalClearances:
+    """Test suite for the bulk bursar clearance import"""
+
+    def test_counts_and_single_rewrite(self, accounts_file, tmp_path):
+        with open(accounts_file, "a", encoding="utf-8") as f:
+            f.write("STUDENT,900222222,Bo Kim,Junior,Art,true\n")
+        bursar = tmp_path / "bursar.csv"
+        bursar.write_text(
+            "student_id,status\n"
+            "900111111,cleared\n"
+            "900222222,cleared\n"
+            "900333333,uncleared\n"
+            "900444444,maybe\n",
+            encoding="utf-8",
+        )
+
+        counts = import_fiscal_clearances(bursar, accounts_file)
+
+        assert counts == {"changed": 1, "unchanged": 1, "unknown": 1, "invalid": 1}
+        store = AccountStore(accounts_file)
+        assert store.get_student("900111111")[5] == "true"
+        assert store.get_student("900222222")[5] == "true"
+
+    def test_no_changes_leaves_file_alone(self, accounts_file, tmp_path):
+        bursar = tmp_path / "bursar.csv"
+        bursar.write_text("900111111,false\n", encoding="utf-8")
+        before = accounts_file.read_bytes()
+        counts = import_fiscal_clearances(bursar, accounts_file)
+        assert counts["unchanged"] == 1
+        assert accounts_file.read_bytes() == before
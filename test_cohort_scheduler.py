@@ -0,0 +1,68 @@
+import pytest
+
+from CohortScheduler import schedule_cohort
+from CourseCatalog import parse_course_file
+
+
+@pytest.fixture
+def courses_dir(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345, time="MWF 10-11AM", credits=4, students=["900000001"])
+    write_course(folder, "CPSC 101 B", 12346, time="MWF 10-11AM", credits=3)
+    write_course(folder, "MAT 121", 48309, time="TR 11-12:15PM", credits=4)
+    write_course(folder, "ENG 110", 50210, time="TBA", credits=3)
+    return folder
+
+
+def students_in(folder, name):
+    return parse_course_file(folder / f"{name}.txt")["students"]
+
+
+class TestCohortScheduler:
+    """Test suite for batch cohort scheduling"""
+
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_schedules_every_student(self, courses_dir, processes):
+        cohort = ["900111111", "900222222", "900333333"]
+
+        result = schedule_cohort(cohort, courses_dir, processes=processes)
+
+        assert list(result["scheduled"]) == cohort
+        for student in cohort:
+            assert sorted(result["scheduled"][student]) == ["12345", "48309", "50210"]
+        assert students_in(courses_dir, "CPSC 101") == ["900000001"] + cohort
+        assert students_in(courses_dir, "MAT 121") == cohort
+        assert students_in(courses_dir, "CPSC 101 B") == []
+
+    def test_full_sections_are_resolved(self, courses_dir):
+        result = schedule_cohort(["900111111", "900222222"], courses_dir, processes=1, seats=2)
+
+        # CPSC 101 already has one student, so only the first of the cohort fits
+        assert result["resolved"] == ["900222222"]
+        assert sorted(result["scheduled"]["900222222"]) == ["12346", "48309", "50210"]
+        assert students_in(courses_dir, "CPSC 101") == ["900000001", "900111111"]
+        assert students_in(courses_dir, "CPSC 101 B") == ["900222222"]
+
+    def test_rostered_students_are_skipped(self, courses_dir):
+        result = schedule_cohort(["900000001", "900222222"], courses_dir, processes=1)
+
+        assert result["skipped"] == ["900000001"]
+        assert list(result["scheduled"]) == ["900222222"]
+        assert students_in(courses_dir, "MAT 121") == ["900222222"]
+
+    def test_unplaced_students_are_not_saved(self, courses_dir):
+        cohort = ["900111111", "900222222", "900333333", "900444444"]
+
+        result = schedule_cohort(cohort, courses_dir, processes=1, seats=2)
+
+        # every section is full after the first three students
+        assert list(result["scheduled"]) == ["900111111", "900222222", "900333333"]
+        assert result["scheduled"]["900333333"] == ["12346"]
+        assert result["unplaced"] == ["900444444"]
+        assert all("900444444" not in students_in(courses_dir, name)
+                   for name in ("CPSC 101", "CPSC 101 B", "MAT 121", "ENG 110"))
+
+        rerun = schedule_cohort(cohort, courses_dir, processes=1, seats=2)
+        assert rerun["skipped"] == ["900111111", "900222222", "900333333"]
+        assert rerun["unplaced"] == ["900444444"]
@@ -0,0 +1,62 @@
+import os
+from itertools import combinations
+
+import pytest
+
+from ConflictMatrix import ConflictMatrix
+from CourseCatalog import CourseCatalog
+from MeetingTime import meeting_mask
+
+
+class Section:
+    def __init__(self, crn, time):
+        self.CRN = crn
+        self.time = time
+
+
+SECTIONS = [
+    Section(10001, "MWF 10-11AM"),
+    Section(10002, "MWF 10:30-11:30AM"),
+    Section(10003, "TR 10-11:15AM"),
+    Section(10004, "MWF 10-11AM"),
+    Section(10005, "TBA"),
+    Section(10006, "F 11:15AM-12:30PM"),
+]
+
+
+class TestConflictMatrix:
+    """Test suite for the catalog conflict matrix"""
+
+    def test_matches_pairwise_masks(self):
+        matrix = ConflictMatrix(SECTIONS)
+        for a, b in combinations(SECTIONS, 2):
+            expected = bool(meeting_mask(a.time) & meeting_mask(b.time))
+            assert matrix.conflicts(a.CRN, b.CRN) == expected
+            assert matrix.conflicts(b.CRN, a.CRN) == expected
+
+    def test_compatible_with(self):
+        matrix = ConflictMatrix(SECTIONS)
+        assert matrix.compatible_with(["10001"]) == ["10003", "10005", "10006"]
+        assert matrix.compatible_with(["10001", "10006"]) == ["10003", "10005"]
+        assert matrix.compatible_with([]) == [str(s.CRN) for s in SECTIONS]
+
+    def test_unknown_crn(self):
+        with pytest.raises(ValueError):
+            ConflictMatrix(SECTIONS).row("99999")
+
+    def test_rebuilt_only_when_catalog_changes(self, tmp_path, write_course):
+        folder = tmp_path / "courses"
+        folder.mkdir()
+        write_course(folder, "CPSC 101", 12345, time="MWF 10-11AM")
+        write_course(folder, "MAT 121", 48309, time="TR 11-12AM")
+        catalog = CourseCatalog(folder)
+
+        matrix = catalog.conflict_matrix()
+        assert catalog.conflict_matrix() is matrix
+        assert not matrix.conflicts("12345", "48309")
+
+        path = write_course(folder, "MAT 121", 48309, time="MWF 10:30-11:30AM")
+        os.utime(path, ns=(1, 1))
+        rebuilt = catalog.conflict_matrix()
+        assert rebuilt is not matrix
+        assert rebuilt.conflicts("12345", "48309")
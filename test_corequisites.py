@@ -0,0 +1,71 @@
+import random
+
+from CoRequisites import CourseBundle, corequisite_groups, corequisite_key, link_corequisites, load_overrides
+from ScheduleSolver import best_schedule, ranked_schedules
+
+
+class Section:
+    def __init__(self, course_name, time, credits):
+        self.course_name = course_name
+        self.time = time
+        self.credits = credits
+
+
+def names(schedule):
+    return sorted(s.course_name for s in schedule)
+
+
+class TestCoRequisites:
+    """Test suite for lecture/lab co-requisite groups"""
+
+    def test_groups_from_names(self):
+        assert corequisite_key("BIO 110L") == "BIO 110"
+        assert corequisite_key("PHY 201 Lab") == "PHY 201"
+        assert corequisite_key("CPSC 101") == "CPSC 101"
+        groups = corequisite_groups(["BIO 110", "BIO 110L", "CHE 121L", "CPSC 101"])
+        assert groups == {"BIO 110": ["BIO 110", "BIO 110L"]}
+
+    def test_override_table(self, tmp_path):
+        path = tmp_path / "corequisites.csv"
+        path.write_text("course_name,group\nBIO 110L,\nNUR 210C,NUR 210\n", encoding="utf-8")
+        overrides = load_overrides(path)
+        assert corequisite_key("BIO 110L", overrides) is None
+        groups = corequisite_groups(["BIO 110", "BIO 110L", "NUR 210", "NUR 210C"], overrides)
+        assert groups == {"NUR 210": ["NUR 210", "NUR 210C"]}
+
+    def test_bundles_skip_overlapping_pairs(self):
+        sections = [
+            Section("BIO 110", "MW 1-2:15PM", 3),
+            Section("BIO 110", "TR 1-2:15PM", 3),
+            Section("BIO 110L", "T 2-3:50PM", 1),
+            Section("ENG 101", "MWF 9-10AM", 3),
+        ]
+        items = link_corequisites(sections, overrides={})
+        bundles = [i for i in items if isinstance(i, CourseBundle)]
+        assert len(bundles) == 1
+        assert [p.time for p in bundles[0].parts] == ["MW 1-2:15PM", "T 2-3:50PM"]
+        assert bundles[0].credits == 4
+
+    def test_lecture_never_scheduled_without_lab(self):
+        rng = random.Random(23)
+        times = ["MWF 9-10AM", "MW 1-2:15PM", "TR 10-11:15AM", "F 2-3:50PM", "T 2-3:50PM", "TBA"]
+        for _ in range(30):
+            sections = [
+                Section(rng.choice(["BIO 110", "BIO 110L", "CHE 121", "CHE 121L", "ENG 101"]), rng.choice(times), rng.choice([1, 3, 4]))
+                for _ in range(rng.randrange(1, 9))
+            ]
+            present = {s.course_name for s in sections}
+            for schedule in [best_schedule(sections, rng.choice([4, 8, 19]))] + list(ranked_schedules(sections, 19)):
+                chosen = set(names(schedule))
+                for lecture in ("BIO 110", "CHE 121"):
+                    if {lecture, lecture + "L"} <= present:
+                        assert (lecture in chosen) == (lecture + "L" in chosen)
+
+    def test_pair_dropped_when_over_cap(self):
+        sections = [
+            Section("BIO 110", "MW 1-2:15PM", 3),
+            Section("BIO 110L", "F 2-3:50PM", 1),
+            Section("ENG 101", "MWF 9-10AM", 3),
+        ]
+        assert names(best_schedule(sections, 3)) == ["ENG 101"]
+        assert names(best_schedule(sections, 19)) == ["BIO 110", "BIO 110L", "ENG 101"]
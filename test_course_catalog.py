@@ -0,0 +1,90 @@
+import os
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+import CourseCatalog
+from CourseCatalog import CourseCatalog as Catalog
+from Functions import create_schedule
+
+
+@pytest.fixture
+def courses_dir(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345, students=["900111111"])
+    write_course(folder, "MAT 121", 48309, time="TTh 11-12AM", credits=4)
+    (folder / "CPSC 101.bak").write_text("crn: 99999\n", encoding="utf-8")
+    return folder
+
+
+class TestCourseCatalog:
+    """Test suite for the cached course catalog"""
+
+    def test_loads_courses_by_crn(self, courses_dir):
+        catalog = Catalog(courses_dir)
+        course = catalog.get("12345")
+        assert course.course_name == "CPSC 101"
+        assert course.class_list == ["900111111"]
+        assert catalog.get(48309).credits == 4
+        assert catalog.get("99999") is None
+        assert [c.course_name for c in catalog.courses()] == ["CPSC 101", "MAT 121"]
+
+    def test_only_changed_files_are_reparsed(self, courses_dir, write_course):
+        catalog = Catalog(courses_dir)
+        catalog.refresh()
+        path = write_course(courses_dir, "MAT 121", 48309, time="MWF 1-2PM", credits=4, students=["900222222"])
+        os.utime(path, ns=(1, 1))
+
+        with patch.object(CourseCatalog, "parse_course_file", wraps=CourseCatalog.parse_course_file) as parse:
+            assert catalog.get("48309").time == "MWF 1-2PM"
+            catalog.get("12345")
+        assert parse.call_count == 1
+
+    def test_unchanged_catalog_returns_same_objects(self, courses_dir):
+        catalog = Catalog(courses_dir)
+        assert catalog.get("12345") is catalog.get("12345")
+
+    def test_removed_file_drops_course(self, courses_dir):
+        catalog = Catalog(courses_dir)
+        assert catalog.get("12345") is not None
+        os.remove(courses_dir / "CPSC 101.txt")
+        assert catalog.get("12345") is None
+
+    def test_create_schedule_reads_catalog(self, courses_dir):
+        catalog = Catalog(courses_dir)
+        with patch("builtins.input", side_effect=["n"]), patch("sys.stdout", new_callable=StringIO):
+            selected = create_schedule("900333333", catalog)
+        assert sorted(c.course_name for c in selected) == ["CPSC 101", "MAT 121"]
+        assert "900333333" in catalog.get("12345").class_list
+
+    def test_create_schedule_rejects_clashing_course(self, courses_dir, write_course):
+        write_course(courses_dir, "BIO 110", 50210, time="MWF 10:30-11:30AM", credits=1)
+        catalog = Catalog(courses_dir)
+        with patch("builtins.input", side_effect=["y", "1", "done"]), \
+                patch("sys.stdout", new_callable=StringIO) as out:
+            selected = create_schedule("900333333", catalog)
+        assert "meets at the same time as CPSC 101" in out.getvalue()
+        assert "BIO 110" not in [c.course_name for c in selected]
+
+    def test_create_schedule_pages_to_next_best(self, courses_dir, write_course):
+        write_course(courses_dir, "BIO 110", 50210, time="MWF 10:30-11:30AM", credits=1)
+        catalog = Catalog(courses_dir)
+        with patch("builtins.input", side_effect=["next", "next", "n"]), \
+                patch("sys.stdout", new_callable=StringIO) as out:
+            selected = create_schedule("900333333", catalog)
+        # the runner-up swaps CPSC 101 for the clashing BIO 110; nothing else is full
+        assert sorted(c.course_name for c in selected) == ["BIO 110", "MAT 121"]
+        assert "No other schedules fit." in out.getvalue()
+        assert "900333333" not in catalog.get("12345").class_list
+        assert "900333333" in catalog.get("48309").class_list
+
+    def test_create_schedule_names_missing_corequisite(self, courses_dir, write_course):
+        write_course(courses_dir, "BIO 110", 68298, time="MW 1-2:15PM", credits=3)
+        write_course(courses_dir, "BIO 110L", 23537, time="F 2-3:50PM", credits=1)
+        catalog = Catalog(courses_dir)
+        with patch("builtins.input", side_effect=["y", "remove 1", "remove 2", "1", "done"]), \
+                patch("sys.stdout", new_callable=StringIO) as out:
+            create_schedule("900333333", catalog)
+        assert "Also needs its co-requisite: BIO 110L" in out.getvalue()
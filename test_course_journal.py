@@ -0,0 +1,80 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from CourseJournal import CourseJournal
+
+
+@pytest.fixture
+def courses_dir(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345, students=["900111111", "900222222"])
+    return folder
+
+
+def read_course(courses_dir):
+    return (courses_dir / "CPSC 101.txt").read_text(encoding="utf-8").splitlines()
+
+
+class TestCourseJournal:
+    """Test suite for the course file write-ahead journal"""
+
+    def test_operations_edit_one_line(self, courses_dir):
+        journal = CourseJournal(courses_dir)
+        assert journal.apply("12345", "assign_professor", professor_id="700123456")
+        assert journal.apply("12345", "change_time", time="TR 2-3PM")
+        assert journal.apply("12345", "drop_student", student_id="900111111")
+
+        lines = read_course(courses_dir)
+        assert "professor: 700123456" in lines
+        assert "time: TR 2-3PM" in lines
+        assert lines[-1] == "900222222" and "900111111" not in lines
+        assert not list(courses_dir.glob("*.bak")) and not list(courses_dir.glob("*.tmp"))
+        assert journal.pending() == []
+
+    def test_unknown_crn(self, courses_dir):
+        journal = CourseJournal(courses_dir)
+        assert journal.apply("99999", "change_time", time="TR 2-3PM") is False
+        assert not journal.journal_path.exists()
+
+    def test_recover_replays_uncommitted_edit(self, courses_dir):
+        journal = CourseJournal(courses_dir)
+        # crash after the intent was journaled but before the file was replaced
+        with patch.object(CourseJournal, "_write_course_file", side_effect=OSError("crash")):
+            with pytest.raises(OSError):
+                journal.apply("12345", "change_time", time="TR 2-3PM")
+        assert [e["op"] for e in journal.pending()] == ["change_time"]
+        assert "time: TR 2-3PM" not in read_course(courses_dir)
+
+        assert CourseJournal(courses_dir).recover() == 1
+        assert "time: TR 2-3PM" in read_course(courses_dir)
+        assert journal.journal_path.read_text(encoding="utf-8") == ""
+
+    def test_torn_entry_is_ignored(self, courses_dir):
+        journal = CourseJournal(courses_dir)
+        journal.apply("12345", "drop_student", student_id="900111111")
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "op": "chan')
+        assert journal.pending() == []
+        seqs = [json.loads(l)["seq"] for l in journal.journal_path.read_text(encoding="utf-8").splitlines()[:2]]
+        assert seqs == [1, 1]
+
+    def test_newer_edit_survives_failed_one(self, courses_dir):
+        journal = CourseJournal(courses_dir)
+        with patch.object(CourseJournal, "_write_course_file", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                journal.apply("12345", "change_time", time="TR 2-3PM")
+            with pytest.raises(OSError):
+                journal.apply("12345", "drop_student", student_id="900222222")
+
+        # the failed edits are replayed before the newer ones, not after
+        assert journal.apply("12345", "change_time", time="MWF 9-10AM")
+        assert journal.apply("12345", "add_students", student_ids=["900222222"])
+        assert journal.recover() == 0
+
+        lines = read_course(courses_dir)
+        assert "time: MWF 9-10AM" in lines
+        assert "900222222" in lines
+        assert journal.pending() == []
@@ -0,0 +1,58 @@
+from io import StringIO
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+import pytest
+
+root_folder = Path(__file__).parent
+sys.path.insert(0, str(root_folder / "Professor Files"))
+sys.path.insert(0, str(root_folder / "Admin_files"))
+
+import CourseCatalog
+from Course import Course, CourseRegistry
+from Professor import Professor
+from professor_driver import professor_driver
+
+
+@pytest.fixture
+def registry(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345, students=["900111111"])
+    write_course(folder, "MAT 121", 48309, time="TTh 11-12AM")
+    registry = CourseRegistry(folder)
+    with patch.object(Course, "courses_by_crn", registry):
+        yield registry
+
+
+class TestCourseRegistry:
+    """Test suite for lazy hydration of Course.courses_by_crn"""
+
+    def test_miss_loads_only_that_course(self, registry):
+        with patch.object(CourseCatalog, "parse_course_file", wraps=CourseCatalog.parse_course_file) as parse:
+            assert "12345" in registry
+            course = registry["12345"]
+            assert registry.get("12345") is course
+        assert parse.call_count == 1
+        assert course.course_name == "CPSC 101"
+        assert "48309" not in dict(registry)
+
+    def test_unknown_crn(self, registry):
+        assert "99999" not in registry
+        assert registry.get("99999") is None
+        with pytest.raises(KeyError):
+            registry["99999"]
+
+    def test_registered_course_wins(self, registry):
+        course = Course("CPSC 101", "TR 2-3PM", 3, [], crn=12345)
+        assert registry["12345"] is course
+
+    @patch('sys.stdout', new_callable=StringIO)
+    def test_professor_portal_shows_course_from_disk(self, mock_stdout, registry):
+        professor = Professor("700123456", "Dr. Test", "CS", ["48309"])
+        with patch('builtins.input', side_effect=['1', '5']):
+            professor_driver(professor)
+        output = mock_stdout.getvalue()
+        assert "Course Name: MAT 121" in output
+        assert "not loaded" not in output
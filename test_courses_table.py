@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from CoursesTable import CoursesTable
+
+
+@pytest.fixture
+def courses_csv(tmp_path):
+    path = tmp_path / "Courses.csv"
+    path.write_text(
+        "crn,course_name,time,credits,class_list\n"
+        "12345,CPSC 101,MWF 10-11AM,3,900111111;900222222\n"
+        "48309,MAT 121,TTh 11-12AM,4,\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def read_rows(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+class TestCoursesTable:
+    """Test suite for the CRN-keyed Courses.csv table"""
+
+    def test_update_keeps_all_columns(self, courses_csv):
+        row = CoursesTable(courses_csv).update("48309", professor="Dr. Smith")
+        assert row["professor"] == "Dr. Smith"
+        assert read_rows(courses_csv) == [
+            "crn,course_name,time,credits,class_list,professor",
+            "12345,CPSC 101,MWF 10-11AM,3,900111111;900222222,",
+            "48309,MAT 121,TTh 11-12AM,4,,Dr. Smith",
+        ]
+
+    def test_unknown_crn_writes_nothing(self, courses_csv):
+        before = os.stat(courses_csv).st_mtime_ns
+        assert CoursesTable(courses_csv).update("99999", professor="Dr. Jones") is None
+        assert os.stat(courses_csv).st_mtime_ns == before
+
+    def test_batch_flushes_once(self, courses_csv):
+        table = CoursesTable(courses_csv)
+        with table.batch():
+            table.update("12345", professor="Dr. Smith")
+            table.update("48309", professor="Dr. Jones")
+            assert "Dr. Smith" not in courses_csv.read_text(encoding="utf-8")
+        assert read_rows(courses_csv)[2].endswith(",Dr. Jones")
+
+    def test_assign_professors_reports_missing(self, courses_csv):
+        missing = CoursesTable(courses_csv).assign_professors({"12345": "Dr. Smith", "99999": "Dr. Jones"})
+        assert missing == ["99999"]
+        assert CoursesTable(courses_csv).get(12345)["professor"] == "Dr. Smith"
+
+    def test_reloads_after_external_change(self, courses_csv):
+        table = CoursesTable(courses_csv)
+        assert table.get("87227") is None
+        with open(courses_csv, "a", encoding="utf-8") as f:
+            f.write("87227,ENG 101,MWF 1-2PM,3,\n")
+        assert table.get("87227")["course_name"] == "ENG 101"
+
+    def test_name_and_crn_lookups(self, courses_csv):
+        with open(courses_csv, "a", encoding="utf-8") as f:
+            f.write("50210,CPSC 101,TTh 2-3PM,3,\n")
+        table = CoursesTable(courses_csv)
+        assert table.crns_for_name("CPSC 101") == ["12345", "50210"]
+        assert table.crns_for_name("BIO 110") == []
+        assert table.course_name(48309) == "MAT 121"
+        assert table.course_name("99999") is None
+
+    def test_renaming_moves_name_index(self, courses_csv):
+        table = CoursesTable(courses_csv)
+        table.update("48309", course_name="MAT 122")
+        assert table.crns_for_name("MAT 121") == []
+        assert table.crns_for_name("MAT 122") == ["48309"]
+
+    def test_rewrite_keeps_duplicate_rows(self, courses_csv):
+        with open(courses_csv, "a", encoding="utf-8") as f:
+            f.write("12345,CPSC 101,MWF 10-11AM,3,\n")
+        CoursesTable(courses_csv).update("48309", professor="Dr. Smith")
+        assert len(read_rows(courses_csv)) == 4
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+import CrnAllocator
+from CrnAllocator import CrnAllocator as Allocator
+
+
+@pytest.fixture
+def allocator(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345)
+    courses_csv = tmp_path / "Courses.csv"
+    courses_csv.write_text("crn,course_name,time,class_list,professor\n10001,,,,Dr. Smith\n", encoding="utf-8")
+    return Allocator(folder, courses_csv)
+
+
+class TestCrnAllocator:
+    """Test suite for the bitmap CRN allocator"""
+
+    def test_seeded_from_disk(self, allocator):
+        assert 12345 in allocator
+        assert "10001" in allocator
+        assert 54321 not in allocator
+
+    def test_allocate_skips_used(self, allocator):
+        with patch("CrnAllocator.random.randrange", side_effect=[12345 - 10000, 10001 - 10000, 5]):
+            assert allocator.allocate() == 10005
+        assert 10005 in allocator
+
+    def test_reserve(self, allocator):
+        assert allocator.reserve(20000) is True
+        assert allocator.reserve("20000") is False
+        assert allocator.reserve(12345) is False
+
+    def test_reserve_block(self, allocator):
+        block = allocator.reserve_block(5)
+        assert block == [10002, 10003, 10004, 10005, 10006]
+        assert all(crn in allocator for crn in block)
+
+    def test_exhausted_space_raises(self, allocator):
+        with patch.object(CrnAllocator, "CRN_MAX", 10004):
+            small = Allocator(allocator.courses_dir, allocator.courses_csv)
+            assert sorted(small.allocate() for _ in range(4)) == [10000, 10002, 10003, 10004]
+            with pytest.raises(ValueError):
+                small.allocate()
+            with pytest.raises(ValueError):
+                small.reserve_block(1)
+
+    def test_claim_does_not_seed(self, allocator):
+        assert allocator.claim(20000) is True
+        assert allocator.claim("20000") is False
+        assert allocator._used is None
+        # claimed CRNs are folded in once the allocator seeds
+        assert 20000 in allocator and 12345 in allocator
+        assert allocator.claim(12345) is False
+
+    def test_seeding_does_not_write_crn_index(self, allocator):
+        index_path = allocator.courses_dir.parent / "crn_index.csv"
+        assert 12345 in allocator
+        assert not index_path.exists()
@@ -0,0 +1,79 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import CrnIndex
+from CrnIndex import CrnIndex as Index
+
+
+@pytest.fixture
+def courses_dir(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345)
+    write_course(folder, "MAT 121", 48309)
+    return folder
+
+
+class TestCrnIndex:
+    """Test suite for the persistent CRN -> course file index"""
+
+    def test_lookup_builds_and_persists(self, courses_dir):
+        index = Index(courses_dir)
+        assert index.lookup("48309") == courses_dir / "MAT 121.txt"
+        assert index.lookup("99999") is None
+        rows = (courses_dir.parent / "crn_index.csv").read_text(encoding="utf-8").splitlines()
+        assert "12345,CPSC 101.txt" in rows
+
+    def test_fresh_process_opens_only_one_file(self, courses_dir):
+        Index(courses_dir).lookup("12345")
+        index = Index(courses_dir)
+        with patch.object(CrnIndex, "read_crn", wraps=CrnIndex.read_crn) as read:
+            assert index.lookup("48309") == courses_dir / "MAT 121.txt"
+        assert read.call_count == 1
+
+    def test_new_file_triggers_rebuild(self, courses_dir, write_course):
+        index = Index(courses_dir)
+        index.lookup("12345")
+        write_course(courses_dir, "ENG 101", 87227)
+        os.utime(courses_dir, ns=(1, 1))
+        assert index.lookup("87227") == courses_dir / "ENG 101.txt"
+
+    def test_record_keeps_index_current(self, courses_dir, write_course):
+        index = Index(courses_dir)
+        index.lookup("12345")
+        path = write_course(courses_dir, "ENG 101", 87227)
+        index.record(87227, path)
+        with patch.object(Index, "rebuild") as rebuild:
+            assert Index(courses_dir).lookup("87227") == path
+        rebuild.assert_not_called()
+
+    def test_stale_entry_is_repaired(self, courses_dir, write_course):
+        index = Index(courses_dir)
+        index.lookup("12345")
+        write_course(courses_dir, "CPSC 101", 11111)
+        write_course(courses_dir, "MAT 121", 12345)
+        assert index.lookup("12345") == courses_dir / "MAT 121.txt"
+
+    def test_journaled_edits_do_not_grow_index(self, courses_dir):
+        index = Index(courses_dir)
+        path = index.lookup("12345")
+        index_file = courses_dir.parent / "crn_index.csv"
+        for i in range(2 * CrnIndex.COMPACT_SLACK):
+            os.utime(courses_dir, ns=(i + 1, i + 1))
+            with patch.object(os, "listdir", wraps=os.listdir) as listdir:
+                index.record("12345", path)
+            listdir.assert_not_called()
+        assert len(index_file.read_text(encoding="utf-8").splitlines()) <= 3 + CrnIndex.COMPACT_SLACK
+        with patch.object(Index, "rebuild") as rebuild:
+            assert Index(courses_dir).lookup("12345") == path
+        rebuild.assert_not_called()
+
+    def test_bloated_index_is_compacted_on_load(self, courses_dir):
+        Index(courses_dir).lookup("12345")
+        index_file = courses_dir.parent / "crn_index.csv"
+        with open(index_file, "a", encoding="utf-8") as f:
+            f.writelines("12345,CPSC 101.txt\n" for _ in range(3 * CrnIndex.COMPACT_SLACK))
+        assert Index(courses_dir).lookup("48309") == courses_dir / "MAT 121.txt"
+        assert len(index_file.read_text(encoding="utf-8").splitlines()) == 3
@@ -0,0 +1,81 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from Admin_files.Course import Course, CourseRegistry
+from EnrollmentIndex import EnrollmentIndex
+from Student_files.Student import Student
+
+
+@pytest.fixture
+def courses_dir(tmp_path, write_course):
+    folder = tmp_path / "courses"
+    folder.mkdir()
+    write_course(folder, "CPSC 101", 12345, students=["900111111", "900222222"])
+    write_course(folder, "MAT 121", 48309, time="TTh 11-12AM", credits=4, students=["900111111"])
+    return folder
+
+
+@pytest.fixture
+def index(courses_dir):
+    index = EnrollmentIndex(courses_dir)
+    with patch("Admin_files.Course.get_enrollment_index", return_value=index), \
+            patch("Student_files.Student.get_enrollment_index", return_value=index), \
+            patch.object(Course, "courses_by_crn", CourseRegistry(courses_dir)):
+        yield index
+
+
+class TestEnrollmentIndex:
+    """Test suite for the student -> CRNs enrollment index"""
+
+    def test_built_from_course_files(self, index):
+        assert index.crns_for("900111111") == ["12345", "48309"]
+        assert index.crns_for("900222222") == ["12345"]
+        assert index.crns_for("900999999") == []
+
+    def test_roster_changes_update_index(self, index):
+        course = Course("BIO 110", "MWF 1-2PM", 4, [])
+        course.add_course_on_student_schedule([], "900222222")
+        assert index.crns_for("900222222") == ["12345", str(course.CRN)]
+        course.remove_course_from_student_schedule("900222222", [course])
+        assert index.crns_for("900222222") == ["12345"]
+
+    def test_display_schedule_reads_index(self, index):
+        with patch("sys.stdout", new_callable=StringIO) as out:
+            Student("900111111", "Alice", "Senior", "CS", True).display_schedule()
+        assert "CPSC 101" in out.getvalue()
+        assert "MAT 121 (4 credits)" in out.getvalue()
+        assert "Total Credits: 7" in out.getvalue()
+
+    def test_time_change_reports_new_conflicts(self, courses_dir, index, write_course):
+        write_course(courses_dir, "ENG 101", 50210, time="MWF 10-11AM", students=["900111111", "900333333"])
+        index.rebuild()
+        course = Course.courses_by_crn["50210"]
+
+        # 900111111 already had ENG 101 on top of CPSC 101
+        course.change_time("MWF 10:30-11:30AM")
+        assert index.time_conflicts(course, "MWF 10-11AM") == {}
+
+        course.change_time("TTh 11-12AM")
+        with patch.object(index, "courses_for", wraps=index.courses_for) as courses_for:
+            conflicts = index.time_conflicts(course, "MWF 10:30-11:30AM")
+        assert {s: [c.course_name for c in clashes] for s, clashes in conflicts.items()} == {"900111111": ["MAT 121"]}
+        # only ENG 101's roster was looked at, not 900222222
+        assert sorted(call.args[0] for call in courses_for.call_args_list) == ["900111111", "900333333"]
+
+        course.change_time("F 2-3PM")
+        assert index.time_conflicts(course, "TTh 11-12AM") == {}
+
+    def test_constructed_and_reassigned_rosters_are_indexed(self, index):
+        course = Course("BIO 110", "MWF 1-2PM", 4, ["900333333"])
+        assert index.crns_for("900333333") == [str(course.CRN)]
+
+        course.class_list = ["900111111"]
+        assert index.crns_for("900333333") == []
+        assert index.crns_for("900111111") == ["12345", "48309", str(course.CRN)]
+
+    def test_creating_a_course_does_not_build_index(self, index):
+        course = Course("BIO 110", "MWF 1-2PM", 4, ["900333333"])
+        assert index._crns_by_student is None
+        assert index.crns_for("900333333") == [str(course.CRN)]
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+import pytest
+
+import MeetingTime
+from MeetingTime import SLOTS_PER_DAY, meeting_mask, parse_meeting_time, times_conflict
+from Admin_files.Course import Course
+
+
+def slots(day, start, end):
+    """Mask for one day from `start` to `end` given as (hour, minute) in 24h time."""
+    first = (start[0] * 60 + start[1]) // 5
+    last = (end[0] * 60 + end[1] + 4) // 5
+    return ((1 << (last - first)) - 1) << (first + day * SLOTS_PER_DAY)
+
+
+class TestMeetingTime:
+    """Test suite for the meeting-time parser"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("MWF 10-11AM", slots(0, (10, 0), (11, 0)) | slots(2, (10, 0), (11, 0)) | slots(4, (10, 0), (11, 0))),
+        ("TR 12:30–1:45PM", slots(1, (12, 30), (13, 45)) | slots(3, (12, 30), (13, 45))),
+        ("TTH 10:50-12:05", slots(1, (10, 50), (12, 5)) | slots(3, (10, 50), (12, 5))),
+        ("TTh 11-12AM", slots(1, (11, 0), (12, 0)) | slots(3, (11, 0), (12, 0))),
+        ("F 11–12:50PM", slots(4, (11, 0), (12, 50))),
+        ("TH 1–2:50PM", slots(3, (13, 0), (14, 50))),
+        ("TU 9-10AM", slots(1, (9, 0), (10, 0))),
+        ("TUTH 9-10AM", slots(1, (9, 0), (10, 0)) | slots(3, (9, 0), (10, 0))),
+        ("SU 9-10AM", slots(6, (9, 0), (10, 0))),
+        ("THU 9-10AM", slots(3, (9, 0), (10, 0))),
+        ("TUE 9-10AM", slots(1, (9, 0), (10, 0))),
+        ("TUETHU 9-10AM", slots(1, (9, 0), (10, 0)) | slots(3, (9, 0), (10, 0))),
+        ("MonWedFri 9-10AM", slots(0, (9, 0), (10, 0)) | slots(2, (9, 0), (10, 0)) | slots(4, (9, 0), (10, 0))),
+    ])
+    def test_formats(self, text, expected):
+        assert parse_meeting_time(text) == expected
+
+    def test_no_days_means_weekdays(self):
+        mask = parse_meeting_time("5:30–6:45PM")
+        assert mask == sum(slots(day, (17, 30), (18, 45)) for day in range(5))
+
+    def test_tba_has_no_meeting(self):
+        assert parse_meeting_time("TBA") == 0
+
+    @pytest.mark.parametrize("text", ["sometime", "MXF 10-11AM", "MWF 11AM-10AM", "MWF 13-14"])
+    def test_bad_times_raise(self, text):
+        with pytest.raises(ValueError):
+            parse_meeting_time(text)
+
+    def test_meeting_mask_memoizes_and_reports(self, capsys):
+        with patch.object(MeetingTime, "_masks", {}), patch.object(MeetingTime, "unparseable_times", set()):
+            with patch.object(MeetingTime, "parse_meeting_time", wraps=parse_meeting_time) as parse:
+                meeting_mask("MW 1–2:15PM")
+                meeting_mask("MW 1–2:15PM")
+                assert meeting_mask("whenever") == 0
+                assert meeting_mask("whenever") == 0
+            assert parse.call_count == 2
+            assert MeetingTime.unparseable_times == {"whenever"}
+        assert capsys.readouterr().out.count("'whenever'") == 1
+
+    def test_course_conflicts(self):
+        a = Course("CPSC 101", "MWF 10-11AM", 3, [])
+        b = Course("MAT 121", "MWF 10–10:50AM", 4, [])
+        c = Course("ENG 101", "TR 9:30–10:45AM", 3, [])
+        assert a.conflicts_with(b)
+        assert not a.conflicts_with(c)
+        assert not times_conflict(parse_meeting_time("MWF 9-10AM"), parse_meeting_time("MWF 10-11AM"))
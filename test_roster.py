@@ -0,0 +1,38 @@
+import pytest
+
+from Roster import Roster
+
+
+class TestRoster:
+    """Test suite for the insertion-ordered class roster"""
+
+    def test_keeps_order_and_compares_to_lists(self):
+        roster = Roster(["900333333", "900111111", "900333333"])
+        assert roster == ["900333333", "900111111"]
+        assert roster != ["900111111", "900333333"]
+        assert roster == {"900111111", "900333333"}
+        assert ";".join(roster) == "900333333;900111111"
+        assert roster[-1] == "900111111"
+
+    def test_add_and_discard(self):
+        roster = Roster()
+        roster.append("900111111")
+        roster.add("900111111")
+        assert roster.count("900111111") == 1
+        roster.discard("900222222")
+        roster.discard("900111111")
+        assert roster == []
+        assert not roster
+
+    def test_remove_missing_raises(self):
+        with pytest.raises(ValueError):
+            Roster(["900111111"]).remove("900222222")
+
+    def test_on_change_only_for_real_edits(self):
+        changes = []
+        roster = Roster(["900111111"], on_change=lambda student, enrolled: changes.append((student, enrolled)))
+        roster.add("900111111")
+        roster.discard("900222222")
+        roster.add("900222222")
+        roster.remove("900111111")
+        assert changes == [("900222222", True), ("900111111", False)]
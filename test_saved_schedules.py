@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from CourseCatalog import CourseCatalog, parse_course_file
+from EnrollmentIndex import EnrollmentIndex, get_enrollment_index
+from Functions import add_student_to_course, drop_student_from_course, save_student_schedule
+
+
+class TestSavedSchedules:
+    """Test suite for persisting admin-built schedules to the course rosters"""
+
+    def test_schedule_survives_restart(self, tmp_path, write_course):
+        folder = tmp_path / "courses"
+        folder.mkdir()
+        write_course(folder, "CPSC 101", 12345)
+        write_course(folder, "MAT 121", 48309, time="TR 11-12:15PM")
+        write_course(folder, "ENG 101", 50210, time="TBA")
+        catalog = CourseCatalog(folder)
+
+        with patch("Admin_files.Course.get_enrollment_index", return_value=get_enrollment_index(folder)):
+            save_student_schedule("900555555", [catalog.get("12345"), catalog.get("48309")], folder)
+            # a new schedule replaces the courses of the old one
+            save_student_schedule("900555555", [catalog.get("48309")], folder)
+            assert add_student_to_course("900555555", "50210", folder).course_name == "ENG 101"
+            assert add_student_to_course("900555555", "99999", folder) is None
+            drop_student_from_course("900555555", "48309", folder)
+
+        # what the next process sees
+        assert EnrollmentIndex(folder).crns_for("900555555") == ["50210"]
+        assert parse_course_file(folder / "CPSC 101.txt")["students"] == []
+
+    def test_new_schedule_drops_hand_edited_enrollment(self, tmp_path, write_course):
+        folder = tmp_path / "courses"
+        folder.mkdir()
+        write_course(folder, "CPSC 101", 12345, students=["900555555"])
+        write_course(folder, "MAT 121", 48309, time="TR 11-12:15PM")
+        catalog = CourseCatalog(folder)
+
+        with patch("Admin_files.Course.get_enrollment_index", return_value=get_enrollment_index(folder)):
+            save_student_schedule("900555555", [catalog.get("48309")], folder)
+
+        assert EnrollmentIndex(folder).crns_for("900555555") == ["48309"]
+        assert parse_course_file(folder / "CPSC 101.txt")["students"] == []
@@ -0,0 +1,136 @@
+import itertools
+import random
+from unittest.mock import patch
+
+import ScheduleSolver
+
+from MeetingTime import meeting_mask
+from ScheduleSolver import best_schedule, ranked_schedules
+
+
+class Section:
+    def __init__(self, course_name, time, credits):
+        self.course_name = course_name
+        self.time = time
+        self.credits = credits
+
+
+TIMES = ["MWF 9-10AM", "MWF 10-11AM", "TR 9:30–10:45AM", "TR 10-11:15AM", "MW 1–2:15PM", "F 8–10:50AM", "TBA"]
+
+
+def feasible(selection, max_credits):
+    if sum(s.credits for s in selection) > max_credits:
+        return False
+    if len({s.course_name for s in selection}) < len(selection):
+        return False
+    return all(not meeting_mask(a.time) & meeting_mask(b.time) for a, b in itertools.combinations(selection, 2))
+
+
+def full(selection, sections, max_credits):
+    """A non-empty feasible selection no other section can be added to."""
+    return bool(selection) and feasible(selection, max_credits) and not any(
+        feasible(tuple(selection) + (s,), max_credits) for s in sections if s not in selection
+    )
+
+
+def brute_force(sections, max_credits, value=lambda s: s.credits):
+    best = 0
+    for r in range(len(sections) + 1):
+        for combo in itertools.combinations(sections, r):
+            if feasible(combo, max_credits):
+                best = max(best, sum(value(s) for s in combo))
+    return best
+
+
+class TestScheduleSolver:
+    """Test suite for the conflict-free schedule solver"""
+
+    def test_avoids_time_conflicts(self):
+        sections = [
+            Section("CPSC 101", "MWF 10-11AM", 4),
+            Section("MAT 121", "MWF 10–10:50AM", 4),
+            Section("ENG 101", "TR 9:30–10:45AM", 3),
+        ]
+        selected = best_schedule(sections, 19)
+        assert feasible(selected, 19)
+        assert sum(s.credits for s in selected) == 7
+
+    def test_one_section_per_course(self):
+        sections = [Section("CPSC 101", "MWF 9-10AM", 3), Section("CPSC 101", "TR 9:30–10:45AM", 3)]
+        assert len(best_schedule(sections, 19)) == 1
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            sections = [
+                Section(f"C{rng.randrange(6)}", rng.choice(TIMES), rng.choice([1, 3, 4]))
+                for _ in range(rng.randrange(1, 11))
+            ]
+            cap = rng.choice([4, 7, 10, 19])
+            selected = best_schedule(sections, cap, time_budget=None)
+            assert feasible(selected, cap)
+            assert sum(s.credits for s in selected) == brute_force(sections, cap)
+
+    def test_preference_breaks_ties(self):
+        liked = Section("ART 101", "TR 10-11:15AM", 3)
+        sections = [Section("HIS 101", "TR 9:30–10:45AM", 3), liked]
+        selected = best_schedule(sections, 19, preference=lambda c: 0.5 if c is liked else 0)
+        assert selected == [liked]
+
+    def test_zero_budget_still_returns_valid_schedule(self):
+        rng = random.Random(3)
+        sections = [Section(f"C{i}", rng.choice(TIMES), rng.choice([1, 3, 4])) for i in range(200)]
+        selected = best_schedule(sections, 19, time_budget=0)
+        assert feasible(selected, 19)
+        assert sum(s.credits for s in selected) > 0
+
+
+class TestRankedSchedules:
+    """Test suite for lazy best-first schedule enumeration"""
+
+    def test_yields_every_full_schedule_once_best_first(self):
+        rng = random.Random(22)
+        for _ in range(20):
+            sections = [
+                Section(f"C{rng.randrange(5)}", rng.choice(TIMES), rng.choice([1, 3, 4]))
+                for _ in range(rng.randrange(1, 8))
+            ]
+            cap = rng.choice([4, 7, 19])
+            expected = sorted(
+                (sum(s.credits for s in combo) for r in range(len(sections) + 1)
+                 for combo in itertools.combinations(sections, r) if full(combo, sections, cap)),
+                reverse=True,
+            )
+            schedules = list(ranked_schedules(sections, cap, time_budget=None))
+            assert all(full(s, sections, cap) for s in schedules)
+            assert len({frozenset(map(id, s)) for s in schedules}) == len(schedules)
+            assert [sum(s.credits for s in schedule) for schedule in schedules] == expected
+
+    def test_is_lazy(self):
+        sections = [Section(f"C{i}", TIMES[i % len(TIMES)], 3) for i in range(40)]
+        schedules = ranked_schedules(sections, 19)
+        first = next(schedules)
+        assert sum(s.credits for s in first) == 18
+        assert sum(s.credits for s in next(schedules)) == 18
+
+    def test_never_yields_empty_schedule(self):
+        sections = [Section("C1", "MWF 9-10AM", 20), Section("C2", "MWF 9-10AM", 21)]
+        assert list(ranked_schedules(sections, 19, time_budget=None)) == []
+
+    def test_pieces_share_one_time_budget(self):
+        sections = [Section(f"C{i}", TIMES[i % len(TIMES)], 3) for i in range(40)]
+        budgets = []
+        real_solve = ScheduleSolver._solve
+
+        def solve(courses, max_credits, preference, time_budget):
+            budgets.append(time_budget)
+            return real_solve(courses, max_credits, preference, time_budget)
+
+        with patch.object(ScheduleSolver, "_solve", side_effect=solve):
+            schedules = ranked_schedules(sections, 19, time_budget=0.2)
+            next(schedules)
+            next(schedules)
+        # every budget handed out is what is left of the same 0.2s, never a fresh one
+        assert len(budgets) > 2
+        assert all(b <= 0.2 for b in budgets)
+        assert all(later <= earlier for earlier, later in zip(budgets[1:], budgets[2:]))
@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+import pytest
+
+from AccountStore import AccountStore
+from Signup import create_account, provision_accounts, sign_up
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "Accounts.txt"
+    path.write_text("STUDENT,900111111,Ann Lee,Freshman,Comp Sci,false\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def pins_file(tmp_path):
+    path = tmp_path / "Security_pins.txt"
+    path.write_text("professor:1234\nadmin:9876\n", encoding="utf-8")
+    return path
+
+
+class TestCreateAccount:
+    """Test suite for the in-process sign up"""
+
+    def test_student_record_format(self, database):
+        user_id = create_account("student", "Bo Kim", "Junior", "Art", database)
+        assert user_id.startswith("900") and len(user_id) == 9
+        last_line = database.read_text(encoding="utf-8").splitlines()[-1]
+        assert last_line == f"STUDENT,{user_id},Bo Kim,Junior,Art,false"
+
+    def test_professor_and_admin_records(self, database):
+        prof_id = create_account("professor", "Dr. Gain", database=database)
+        admin_id = create_account("admin", "Root", database=database)
+        lines = database.read_text(encoding="utf-8").splitlines()
+        assert lines[-2:] == [f"PROFESSOR,{prof_id},Dr. Gain", f"ADMIN,{admin_id},Root"]
+        assert prof_id.startswith("700") and admin_id.startswith("800")
+
+    def test_new_account_can_log_in(self, database):
+        user_id = create_account("student", "Bo Kim", "Junior", "Art", database)
+        assert AccountStore(database).get_student(user_id)[2] == "Bo Kim"
+
+    def test_rejects_commas(self, database):
+        before = database.read_text(encoding="utf-8")
+        with pytest.raises(ValueError):
+            create_account("student", "Kim, Bo", "Junior", "Art", database)
+        assert database.read_text(encoding="utf-8") == before
+
+    def test_ids_never_collide(self, database):
+        store = AccountStore(database)
+        # 900111111 is already in the file and 900222222 is handed out first
+        with patch("AccountStore.random.randint", side_effect=[111111, 222222, 222222, 333333]):
+            ids = store.allocate_ids("900", 2)
+        assert ids == ["900222222", "900333333"]
+
+    def test_exhausted_prefix_raises(self, database):
+        store = AccountStore(database)
+        with patch("AccountStore.ID_SUFFIX_MIN", 111110), patch("AccountStore.ID_SUFFIX_MAX", 111111):
+            assert store.allocate_ids("900") == ["900111110"]
+            with pytest.raises(ValueError):
+                store.allocate_ids("900")
+
+
+class TestSignUpMenu:
+    """Test suite for the interactive sign up flow"""
+
+    def test_student_sign_up(self, database, pins_file):
+        with patch("builtins.input", side_effect=["1", "Bo Kim", "Junior", "Art"]):
+            user_id = sign_up(database, pins_file)
+        assert AccountStore(database).get_student(user_id)[4] == "Art"
+
+    def test_admin_needs_pin(self, database, pins_file):
+        with patch("builtins.input", side_effect=["3", "0", "1", "2"]):
+            assert sign_up(database, pins_file) is None
+        with patch("builtins.input", side_effect=["3", "9876", "Root"]):
+            user_id = sign_up(database, pins_file)
+        assert AccountStore(database).get_admin(user_id)[2] == "Root"
+
+
+class TestProvisionAccounts:
+    """Test suite for batch account provisioning"""
+
+    def test_provisions_mixed_roles(self, database, tmp_path):
+        source = tmp_path / "new.csv"
+        source.write_text(
+            "name,classification,major,role\n"
+            "Bo Kim,Freshman,Art,\n"
+            "Cy Day,Freshman,Math,student\n"
+            "Dr. Blue,,,professor\n",
+            encoding="utf-8",
+        )
+        output = tmp_path / "ids.csv"
+
+        results = provision_accounts(source, database, output)
+
+        assert [(r[0], r[1], r[2]) for r in results] == [
+            (2, "student", "Bo Kim"), (3, "student", "Cy Day"), (4, "professor", "Dr. Blue"),
+        ]
+        store = AccountStore(database)
+        assert store.get_student(results[0][3])[2] == "Bo Kim"
+        assert store.get_professor(results[2][3])[2] == "Dr. Blue"
+        assert len({r[3] for r in results}) == 3
+        assert output.read_text(encoding="utf-8").splitlines()[1] == f"2,student,Bo Kim,{results[0][3]}"
+
+    def test_invalid_row_writes_nothing(self, database, tmp_path):
+        source = tmp_path / "new.csv"
+        source.write_text("name,classification,major\nBo Kim,Freshman,Art\nCy,,Math\n", encoding="utf-8")
+        before = database.read_text(encoding="utf-8")
+        with pytest.raises(ValueError, match="row 3"):
+            provision_accounts(source, database)
+        assert database.read_text(encoding="utf-8") == before
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from SortedCrnIndex import SortedCrnIndex
+
+
+@pytest.fixture
+def courses_csv(tmp_path):
+    path = tmp_path / "Courses.csv"
+    rows = ["crn,course_name,time,credits,class_list"]
+    rows += [f"{crn},Course {crn},,3," for crn in (48309, 12345, 87227, 50210, 12345)]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return tmp_path / "pages" / "Courses.crns"
+
+
+class TestSortedCrnIndex:
+    """Test suite for the persisted sorted CRN index"""
+
+    def test_pages_in_both_orders(self, courses_csv):
+        index = SortedCrnIndex(courses_csv)
+        assert len(index) == 4
+        assert index.page(0, 3) == [87227, 50210, 48309]
+        assert index.page(3, 3) == [12345]
+        assert index.page(4, 3) == []
+        assert index.page(1, 2, descending=False) == [48309, 50210]
+        assert list(index.pages(3, descending=False)) == [[12345, 48309, 50210], [87227]]
+
+    def test_fresh_process_loads_without_sorting(self, courses_csv, index_path):
+        index_path.parent.mkdir()
+        SortedCrnIndex(courses_csv, index_path).page()
+        with patch.object(SortedCrnIndex, "rebuild") as rebuild:
+            assert SortedCrnIndex(courses_csv, index_path).page(0, 1) == [87227]
+        rebuild.assert_not_called()
+
+    def test_appending_inserts_in_order(self, courses_csv, index_path):
+        index_path.parent.mkdir()
+        index = SortedCrnIndex(courses_csv, index_path)
+        index.page()
+        with index.appending(20000):
+            with open(courses_csv, "a", encoding="utf-8") as f:
+                f.write("20000,Course 20000,,3,\n")
+        with patch.object(SortedCrnIndex, "rebuild") as rebuild:
+            assert SortedCrnIndex(courses_csv, index_path).page(0, 10, descending=False)[:2] == [12345, 20000]
+        rebuild.assert_not_called()
+
+    def test_outside_edit_triggers_rebuild(self, courses_csv):
+        index = SortedCrnIndex(courses_csv)
+        index.page()
+        courses_csv.write_text("crn,course_name\n99999,Course 99999\n", encoding="utf-8")
+        assert index.page() == [99999]
+
+    def test_no_sidecar_unless_asked(self, courses_csv):
+        index = SortedCrnIndex(courses_csv)
+        assert index.page(0, 1) == [87227]
+        with index.appending(20000):
+            with open(courses_csv, "a", encoding="utf-8") as f:
+                f.write("20000,Course 20000,,3,\n")
+        assert index.page(0, 10, descending=False)[:2] == [12345, 20000]
+        assert [p.name for p in courses_csv.parent.iterdir()] == ["Courses.csv"]
+
+    def test_missing_csv_is_empty(self, tmp_path):
+        index = SortedCrnIndex(tmp_path / "Courses.csv", tmp_path / "Courses.crns")
+        assert len(index) == 0
+        assert index.page() == []
+        assert not (tmp_path / "Courses.crns").exists()
@@ -0,0 +1,90 @@
+import random
+
+from MeetingTime import meeting_mask
+from TimetableSolver import (
+    MOVE_WEIGHT,
+    PROFESSOR_WEIGHT,
+    STANDARD_SLOTS,
+    _Annealer,
+    co_enrollment_weights,
+    conflict_cost,
+    propose_times,
+    read_transcript_courses,
+)
+
+
+class Section:
+    def __init__(self, crn, course_name, time, students=(), professor_id=None):
+        self.CRN = crn
+        self.course_name = course_name
+        self.time = time
+        self.class_list = list(students)
+        self.professor_id = professor_id
+
+
+class TestTimetableSolver:
+    """Test suite for the meeting-time annealing solver"""
+
+    def test_weights(self):
+        sections = [
+            Section(1, "CPSC 101", "MWF 9-9:50AM", ["900111111", "900222222"], "700111111"),
+            Section(2, "MAT 121", "MWF 9-9:50AM", ["900111111"], "700111111"),
+            Section(3, "ENG 101", "TR 8-9:15AM", ["900222222"]),
+            Section(4, "ENG 101", "TR 11-12:15PM"),
+        ]
+        weights = co_enrollment_weights(sections, [["CPSC101", "ENG101"], ["MAT121", "HIS201"]])
+        assert weights[0, 1] == 1 + PROFESSOR_WEIGHT
+        # one transcript term shared out over the two ENG 101 sections, plus the shared student
+        assert weights[0, 2] == 1 + 0.5
+        assert weights[0, 3] == 0.5
+        assert (1, 2) not in weights
+        assert conflict_cost([meeting_mask(s.time) for s in sections], weights) == 1 + PROFESSOR_WEIGHT
+
+    def test_transcript_headers(self, tmp_path):
+        path = tmp_path / "Transcripts.csv"
+        path.write_text('Student_name, Student_ID, Courses_list, year\nA,1,"CPSC1724, Math 1030",2022\n', encoding="utf-8")
+        assert read_transcript_courses(path) == [["CPSC1724", "MATH1030"]]
+        assert read_transcript_courses(tmp_path / "missing.csv") == []
+
+    def test_delta_matches_full_rescore(self):
+        rng = random.Random(25)
+        n = 30
+        weights = {}
+        for _ in range(80):
+            i, j = sorted(rng.sample(range(n), 2))
+            weights[i, j] = weights.get((i, j), 0) + rng.choice([1, 2, 0.5])
+        start = [rng.randrange(len(STANDARD_SLOTS)) for _ in range(n)]
+        annealer = _Annealer(n, STANDARD_SLOTS, weights, start, rng)
+        masks = [meeting_mask(s) for s in STANDARD_SLOTS]
+        for _ in range(300):
+            i, new = rng.randrange(n), rng.randrange(len(STANDARD_SLOTS))
+            change = annealer.delta(i, new)
+            annealer.move(i, new)
+            annealer.cost += change
+            moved = sum(1 for a, b in zip(annealer.slot, start) if a != b)
+            expected = conflict_cost([masks[k] for k in annealer.slot], weights) + MOVE_WEIGHT * moved
+            assert abs(annealer.cost - expected) < 1e-9
+
+    def test_separates_sections_taken_together(self):
+        students = [f"9001111{i:02d}" for i in range(10)]
+        sections = [
+            Section(1, "CPSC 101", "MWF 9-9:50AM", students),
+            Section(2, "MAT 121", "MWF 9-9:50AM", students),
+            Section(3, "ENG 101", "TR 8-9:15AM", students[:3]),
+            Section(4, "HIS 201", "TBA", students),
+        ]
+        proposal, before, after = propose_times(sections, iterations=2000)
+        assert before == 10
+        assert after == 0
+        assert "4" not in proposal
+        # only one of the clashing pair needs to move
+        assert sum(proposal[crn] != s.time for crn, s in zip("123", sections)) == 1
+
+    def test_conflict_free_catalog_is_left_alone(self):
+        sections = [
+            Section(1, "CPSC 101", "MWF 9–9:50AM", ["900111111"]),
+            Section(2, "MAT 121", "TR 12:30–1:45PM", ["900111111"]),
+        ]
+        proposal, before, after = propose_times(sections, iterations=2000)
+        assert proposal == {"1": "MWF 9–9:50AM", "2": "TR 12:30–1:45PM"}
+        assert before == after == 0